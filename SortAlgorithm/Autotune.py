@@ -0,0 +1,144 @@
+"""
+Autotune command for the SortAlgorithm package
+
+    python -m SortAlgorithm.Autotune run [--output PATH]
+    python -m SortAlgorithm.Autotune compare [--profile PATH] [--baseline PATH]
+    python -m SortAlgorithm.Autotune show
+
+`run` micro-benchmarks every tunable parameter on this host and writes
+the winners to the tuning profile. `compare` re-times each parameter at
+the baseline value (built-in defaults unless a baseline profile is given)
+and at the profile value, so a deployment can check the effect of a
+re-tune. Profiles are only read at import, so restart long-running
+processes after re-tuning.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from SortAlgorithm.BucketSortAlgorithm import bucket_sort
+from SortAlgorithm.Datasets import generate
+from SortAlgorithm.MergeSortAlgorithm import merge_sort
+from SortAlgorithm.QuickSortAlogirthm import quick_sort
+from SortAlgorithm.RadixAlgorithm import radix_sort_lsd
+from SortAlgorithm.StringSortAlgorithm import msd_string_sort
+from SortAlgorithm.TuningProfile import DEFAULTS, PROFILE_PATH, load_profile, save_profile
+
+CANDIDATES: Dict[str, List] = {
+    "radix_base": [10, 16, 64, 256, 1024, 4096],
+    "quick_sort_cutoff": [0, 8, 16, 24, 32, 48],
+    "merge_sort_cutoff": [1, 8, 16, 24, 32, 48],
+    "bucket_factor": [0.25, 0.5, 1.0, 2.0],
+    "string_insertion_cutoff": [4, 8, 16, 32, 64],
+}
+
+
+def _inputs(n: int) -> Dict[str, list]:
+    ints = generate("uniform", n, seed=36, low=-10**9, high=10**9)
+    return {
+        "ints": ints,
+        "unit": generate("uniform", n, seed=36, dtype="float", low=0.0, high=0.999999),
+        "strings": [f"SKU-{v & 0xFFFFF:05X}-{v % 97}" for v in ints],
+    }
+
+
+def _runner(name: str, data: Dict[str, list]) -> Callable:
+    """Return f(value) that runs the parameter's algorithm on a fresh copy"""
+    if name == "radix_base":
+        return lambda v: radix_sort_lsd(list(data["ints"]), base=v)
+    if name == "quick_sort_cutoff":
+        return lambda v: quick_sort(list(data["ints"]), cutoff=v)
+    if name == "merge_sort_cutoff":
+        return lambda v: merge_sort(data["ints"], cutoff=v)
+    if name == "bucket_factor":
+        return lambda v: bucket_sort(data["unit"], factor=v)
+    if name == "string_insertion_cutoff":
+        return lambda v: msd_string_sort(data["strings"], cutoff=v)
+    raise KeyError(name)
+
+
+def time_best(fn: Callable, value, repeats: int) -> float:
+    """Best-of-repeats wall time in seconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn(value)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def host_info() -> Dict:
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "tuned_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def autotune(n: int = 20000, repeats: int = 5) -> Dict:
+    """Benchmark every candidate and return {params, measurements}"""
+    data = _inputs(n)
+    params, measurements = {}, {}
+    for name, candidates in CANDIDATES.items():
+        run = _runner(name, data)
+        timings = {str(v): time_best(run, v, repeats) for v in candidates}
+        best = min(candidates, key=lambda v: timings[str(v)])
+        params[name] = best
+        measurements[name] = {"n": n, "seconds": timings}
+    return {"params": params, "measurements": measurements}
+
+
+def compare(profile: Dict, baseline: Dict, n: int = 20000, repeats: int = 5) -> List[Dict]:
+    """Time each parameter at its baseline and profile values"""
+    data = _inputs(n)
+    rows = []
+    for name in CANDIDATES:
+        before, after = baseline.get(name, DEFAULTS[name]), profile.get(name, DEFAULTS[name])
+        run = _runner(name, data)
+        t_before = time_best(run, before, repeats)
+        t_after = t_before if after == before else time_best(run, after, repeats)
+        rows.append({"param": name, "before": before, "after": after,
+                     "before_s": t_before, "after_s": t_after,
+                     "speedup": t_before / t_after if t_after else 1.0})
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m SortAlgorithm.Autotune",
+                                     description="Tune SortAlgorithm parameters for this host")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_p = sub.add_parser("run", help="benchmark candidates and write a profile")
+    run_p.add_argument("--output", default=PROFILE_PATH)
+    cmp_p = sub.add_parser("compare", help="time baseline vs profile values")
+    cmp_p.add_argument("--profile", default=PROFILE_PATH)
+    cmp_p.add_argument("--baseline", default=None, help="profile to compare against (default: built-ins)")
+    sub.add_parser("show", help="print the active profile")
+    for p in (run_p, cmp_p):
+        p.add_argument("-n", type=int, default=20000, help="input size per benchmark")
+        p.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        result = autotune(args.n, args.repeats)
+        path = save_profile(result["params"], host_info(), result["measurements"], args.output)
+        for name, value in result["params"].items():
+            print(f"{name:>24} = {value}  (default {DEFAULTS[name]})")
+        print(f"profile written to {path}")
+    elif args.command == "compare":
+        baseline = load_profile(args.baseline) if args.baseline else {}
+        for row in compare(load_profile(args.profile), baseline, args.n, args.repeats):
+            print(f"{row['param']:>24}: {row['before']!s:>6} {row['before_s'] * 1e3:9.2f} ms"
+                  f" -> {row['after']!s:>6} {row['after_s'] * 1e3:9.2f} ms  x{row['speedup']:.2f}")
+    else:
+        print(json.dumps({**DEFAULTS, **load_profile()}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
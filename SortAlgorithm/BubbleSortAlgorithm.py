@@ -1,3 +1,5 @@
+from SortAlgorithm.Permutation import index_buffer
+
 def bubble_sort(arr):
     
     n = len(arr) # getting a length of a list
@@ -13,6 +15,23 @@ def bubble_sort(arr):
         if not swapped:
             break
     return arr 
+
+def bubble_argsort(keys, idx=None):
+    # Stable: indices only swap when their keys are strictly out of order
+    n = len(keys)
+    idx = index_buffer(n, idx)
+
+    for i in range(n):
+        swapped = False
+
+        for j in range(0, n-i-1):
+                if keys[idx[j]] > keys[idx[j + 1]]:
+                     idx[j], idx[j + 1] = idx[j + 1], idx[j]
+                     swapped = True
+
+        if not swapped:
+            break
+    return idx
     
     #demo test
 
@@ -1,30 +1,59 @@
-import time
-from typing import List
+from array import array
+from typing import List, Optional
+from SortAlgorithm.Metrics import start_timer, stop_timer
+from SortAlgorithm.Permutation import index_buffer
+from SortAlgorithm.TuningProfile import tuned
 
-def bucket_sort(arr: List[float]) -> List[float]:
+# Buckets per input element
+BUCKET_FACTOR = tuned("bucket_factor")
+
+def bucket_sort(arr: List[float], factor: float = BUCKET_FACTOR) -> List[float]:
 
     n = len(arr)
     if n == 0:
         return arr
-    start = time.perf_counter()
+    start = start_timer()
 
-    buckets = [[] for _ in range(n)]
+    nb = max(1, int(n * factor))
+    buckets = [[] for _ in range(nb)]
 
     for x in arr:
-        idx = int(n * x)
+        idx = int(nb * x)
         buckets[idx].append(x)
 
-    for i in range(n):
-        buckets[i].sort()
+    for b in buckets:
+        b.sort()
 
     result = []
     for b in buckets:
         result.extend(b)
 
-    end = time.perf_counter()
-    print(f"[Bucket] sort of {n} elements in {end-start:.6f} sec")
+    stop_timer("bucket_sort", start, n)
 
     return result
-gpas = [0.78, 0.17, 0.26, 0.81, 0.92, 0.99, 0.68, 0.39]
-print("Unsorted GPAs:", gpas)
-print("sorted GPAs:", bucket_sort(gpas))
\ No newline at end of file
+
+def bucket_argsort(keys: List[float], idx: Optional[array] = None) -> array:
+    # Stable: buckets keep insertion order and list.sort is stable
+    n = len(keys)
+    idx = index_buffer(n, idx)
+    if n == 0:
+        return idx
+
+    buckets = [[] for _ in range(n)]
+
+    for i in idx:
+        buckets[int(n * keys[i])].append(i)
+
+    pos = 0
+    for b in buckets:
+        if len(b) > 1:
+            b.sort(key=keys.__getitem__)
+        idx[pos:pos + len(b)] = array('q', b)
+        pos += len(b)
+
+    return idx
+
+if __name__ == "__main__":
+    gpas = [0.78, 0.17, 0.26, 0.81, 0.92, 0.99, 0.68, 0.39]
+    print("Unsorted GPAs:", gpas)
+    print("sorted GPAs:", bucket_sort(gpas))
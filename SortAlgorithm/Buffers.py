@@ -0,0 +1,69 @@
+"""
+Helpers for sorting buffer-protocol sequences in place
+
+array.array, memoryview, mmap casts and NumPy arrays are sorted through
+a typed view instead of being converted to lists, and any scratch space
+uses the same typecode as the input.
+"""
+import sys
+from array import array
+from typing import Any, MutableSequence, Optional
+
+# Typecodes shared by array.array and the struct-style memoryview formats
+TYPECODES = frozenset("bBhHiIlLqQfd")
+INT_TYPECODES = frozenset("bBhHiIlLqQ")
+
+
+def is_buffer(seq: Any) -> bool:
+    """True for non-list sequences that expose the buffer protocol"""
+    if isinstance(seq, list):
+        return False
+    if isinstance(seq, array):
+        return True
+    try:
+        memoryview(seq)
+    except TypeError:
+        return False
+    return True
+
+
+def writable_view(seq: Any) -> MutableSequence:
+    """
+    Return something indexable that writes through to seq
+
+    Lists and array.array are used directly; everything else (NumPy,
+    mmap, bytearray, memoryview) goes through a flat typed memoryview,
+    which indexes far faster than NumPy scalars.
+    """
+    if isinstance(seq, (list, array)):
+        return seq
+    # Reuse a caller's memoryview so no extra export outlives the sort
+    mv = seq if isinstance(seq, memoryview) else memoryview(seq)
+    if mv.readonly:
+        raise TypeError("cannot sort a read-only buffer in place")
+    if mv.ndim != 1 or not mv.c_contiguous:
+        raise ValueError("only flat contiguous buffers can be sorted in place")
+    fmt = mv.format.lstrip("@=")  # NumPy reports native order as e.g. '<q'
+    if fmt[:1] == ("<" if sys.byteorder == "little" else ">"):
+        fmt = fmt[1:]
+    if fmt not in TYPECODES:
+        raise TypeError(f"unsupported buffer format {mv.format!r}")
+    return mv if fmt == mv.format else mv.cast("B").cast(fmt)
+
+
+def typecode_of(view: MutableSequence) -> str:
+    return view.typecode if isinstance(view, array) else view.format
+
+
+def scratch_like(view: MutableSequence, n: Optional[int] = None) -> array:
+    """Zeroed array.array with the same typecode as view"""
+    typecode = typecode_of(view)
+    n = len(view) if n is None else n
+    return array(typecode, bytes(array(typecode).itemsize * n))
+
+
+if __name__ == "__main__":
+    data = array('q', [5, -2, 9])
+    view = writable_view(memoryview(data))
+    view[0] = 1
+    print("Through view:", data, "scratch:", scratch_like(view))
@@ -0,0 +1,289 @@
+"""
+Empirical complexity analysis for the SortAlgorithm package
+
+    python -m SortAlgorithm.Complexity fit [--algorithms quick_sort,heap_sort]
+    python -m SortAlgorithm.Complexity crossover insertion_sort merge_sort
+    python -m SortAlgorithm.Complexity worst
+    python -m SortAlgorithm.Complexity all --json complexity.json
+
+Each algorithm is run on seeded inputs whose size n doubles from one step
+to the next. Comparison sorts get their comparisons counted by wrapping
+the values, which gives a noise-free operation count; every algorithm is
+also timed. The log-log slope of cost against n estimates the exponent,
+and fitting c*f(n) for a few complexity classes names the closest one.
+`crossover` finds the size where one algorithm's time overtakes
+another's. `worst` repeats the slope fit per input shape and flags
+shapes where an algorithm degrades, e.g. quick_select on sorted input.
+"""
+import argparse
+import json
+import math
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from SortAlgorithm.BubbleSortAlgorithm import bubble_sort
+from SortAlgorithm.BucketSortAlgorithm import bucket_sort
+from SortAlgorithm.CountingSortAlgorithm import counting_sort
+from SortAlgorithm.Datasets import generate
+from SortAlgorithm.HeapSortAlgorithm import heap_sort
+from SortAlgorithm.InsertionAlgorithm import insertion_sort
+from SortAlgorithm.MergeSortAlgorithm import merge_sort
+from SortAlgorithm.QuickSelectAlgorithm import quick_select
+from SortAlgorithm.QuickSortAlogirthm import intro_sort, quick_sort
+from SortAlgorithm.RadixAlgorithm import radix_sort_lsd
+
+SEED = 42
+
+# name -> (run(values), counts comparisons, default size range)
+ALGORITHMS: Dict[str, Tuple[Callable, bool, Tuple[int, int]]] = {
+    "bubble_sort": (bubble_sort, True, (32, 1024)),
+    "insertion_sort": (insertion_sort, True, (32, 1024)),
+    "quick_sort": (quick_sort, True, (256, 16384)),
+    "intro_sort": (intro_sort, True, (256, 16384)),
+    "merge_sort": (merge_sort, True, (256, 16384)),
+    "heap_sort": (heap_sort, True, (256, 16384)),
+    "quick_select": (lambda a: quick_select(a, 0, len(a) - 1, len(a) // 2), True, (64, 1024)),
+    "radix_sort": (lambda a: radix_sort_lsd(a, 256), False, (256, 16384)),
+    "counting_sort": (counting_sort, False, (256, 16384)),
+    "bucket_sort": (bucket_sort, False, (256, 16384)),
+}
+
+# Cost models c*f(n); the one with the smallest log residual wins
+MODELS: Dict[str, Callable[[int], float]] = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log2(n),
+    "n^2": lambda n: n * n,
+    "n^2 log n": lambda n: n * n * math.log2(n),
+}
+
+WORST_SHAPES = ("uniform", "sorted", "reversed", "organ_pipe", "all_equal")
+
+# A shape whose exponent exceeds the uniform one by this much is a worst case
+DEGRADE_SLOPE = 0.35
+
+
+class _Counted:
+    """Value wrapper that counts every comparison made through it"""
+    __slots__ = ("v",)
+    count = 0
+
+    def __init__(self, v):
+        self.v = v
+
+    def __lt__(self, other):
+        _Counted.count += 1
+        return self.v < other.v
+
+    def __le__(self, other):
+        _Counted.count += 1
+        return self.v <= other.v
+
+    def __gt__(self, other):
+        _Counted.count += 1
+        return self.v > other.v
+
+    def __ge__(self, other):
+        _Counted.count += 1
+        return self.v >= other.v
+
+    def __eq__(self, other):
+        _Counted.count += 1
+        return self.v == other.v
+
+    __hash__ = None
+
+
+def dataset(name: str, shape: str, n: int) -> list:
+    """Seeded input for an algorithm; bucket_sort gets floats in [0, 1)"""
+    params = {"swaps": 0} if shape == "sorted" else {}
+    gen_shape = "nearly_sorted" if shape == "sorted" else shape
+    if name == "bucket_sort":
+        return generate(gen_shape, n, seed=SEED, dtype="float", low=0.0, high=0.999999, **params)
+    return generate(gen_shape, n, seed=SEED, low=0, high=4 * n, **params)
+
+
+def sizes(lo: int, hi: int) -> List[int]:
+    out = []
+    n = lo
+    while n <= hi:
+        out.append(n)
+        n *= 2
+    return out
+
+
+def measure(name: str, n: int, shape: str = "uniform", repeats: int = 3) -> Dict:
+    """Best-of-repeats seconds and (for comparison sorts) comparisons at size n"""
+    run, counts, _ = ALGORITHMS[name]
+    data = dataset(name, shape, n)
+    point = {"n": n, "seconds": None, "comparisons": None}
+    try:
+        best = float("inf")
+        for _ in range(repeats):
+            values = list(data)
+            t0 = time.perf_counter()
+            run(values)
+            best = min(best, time.perf_counter() - t0)
+        point["seconds"] = best
+        if counts:
+            _Counted.count = 0
+            run([_Counted(v) for v in data])
+            point["comparisons"] = _Counted.count
+    except RecursionError:
+        # Recursion depth grew with n: that is itself the worst case
+        point["error"] = "recursion limit"
+    return point
+
+
+def sweep(name: str, shape: str = "uniform", lo: Optional[int] = None,
+          hi: Optional[int] = None, repeats: int = 3) -> List[Dict]:
+    default_lo, default_hi = ALGORITHMS[name][2]
+    return [measure(name, n, shape, repeats) for n in sizes(lo or default_lo, hi or default_hi)]
+
+
+def loglog_slope(ns: Sequence[float], costs: Sequence[float]) -> float:
+    """Least-squares slope of log(cost) against log(n)"""
+    xs = [math.log(n) for n in ns]
+    ys = [math.log(c) for c in costs]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx if sxx else 0.0
+
+
+def best_model(ns: Sequence[int], costs: Sequence[float]) -> Tuple[str, float]:
+    """Complexity class whose c*f(n) fits best, with its RMS log residual"""
+    fits = []
+    for label, f in MODELS.items():
+        logs = [math.log(c / f(n)) for n, c in zip(ns, costs)]
+        mean = sum(logs) / len(logs)  # log c of the best constant
+        rms = math.sqrt(sum((v - mean) ** 2 for v in logs) / len(logs))
+        fits.append((rms, label))
+    rms, label = min(fits)
+    return label, rms
+
+
+def fit(points: List[Dict], metric: str) -> Optional[Dict]:
+    usable = [(p["n"], p[metric]) for p in points if p.get(metric)]
+    if len(usable) < 3:
+        return None
+    ns, costs = zip(*usable)
+    label, rms = best_model(ns, costs)
+    return {"exponent": loglog_slope(ns, costs), "model": label, "residual": rms}
+
+
+def analyse(name: str, shape: str = "uniform", repeats: int = 3) -> Dict:
+    points = sweep(name, shape, repeats=repeats)
+    return {
+        "algorithm": name,
+        "shape": shape,
+        "points": points,
+        "time": fit(points, "seconds"),
+        "comparisons": fit(points, "comparisons"),
+        "failed": [p["n"] for p in points if "error" in p],
+    }
+
+
+def crossover(a: str, b: str, lo: int = 4, hi: int = 4096, repeats: int = 5) -> Dict:
+    """Smallest size where b becomes faster than a, log-interpolated between sweep points"""
+    pa = [measure(a, n, repeats=repeats) for n in sizes(lo, hi)]
+    pb = [measure(b, n, repeats=repeats) for n in sizes(lo, hi)]
+    ratios = [(p["n"], p["seconds"] / q["seconds"]) for p, q in zip(pa, pb)
+              if p["seconds"] and q["seconds"]]
+    result = {"a": a, "b": b, "ratios": ratios, "n": None}
+    for (n0, r0), (n1, r1) in zip(ratios, ratios[1:]):
+        if r0 <= 1 < r1:
+            # Where log(ratio) crosses zero on the log(n) axis
+            t = -math.log(r0) / (math.log(r1) - math.log(r0)) if r1 != r0 else 0.0
+            result["n"] = round(math.exp(math.log(n0) + t * (math.log(n1) - math.log(n0))))
+            break
+    if result["n"] is None and ratios and ratios[0][1] > 1:
+        result["n"] = ratios[0][0]  # b already wins at the smallest size
+    return result
+
+
+def worst_cases(names: Sequence[str], shapes: Sequence[str] = WORST_SHAPES,
+                repeats: int = 1) -> List[Dict]:
+    """Per-shape fits, flagging shapes that raise an algorithm's exponent"""
+    found = []
+    for name in names:
+        metric = "comparisons" if ALGORITHMS[name][1] else "time"
+        base = analyse(name, "uniform", repeats)
+        base_exp = (base[metric] or {}).get("exponent")
+        for shape in shapes:
+            if shape == "uniform":
+                continue
+            r = analyse(name, shape, repeats)
+            exp = (r[metric] or {}).get("exponent")
+            degraded = bool(r["failed"]) or (
+                exp is not None and base_exp is not None and exp - base_exp > DEGRADE_SLOPE)
+            if degraded:
+                found.append({"algorithm": name, "shape": shape, "metric": metric,
+                              "uniform_exponent": base_exp, "exponent": exp,
+                              "model": (r[metric] or {}).get("model"),
+                              "failed_sizes": r["failed"]})
+    return found
+
+
+def _print_fit(r: Dict) -> None:
+    for metric in ("comparisons", "time"):
+        f = r[metric]
+        if f:
+            print(f"{r['algorithm']:>15} {metric:>11}: exponent {f['exponent']:.2f}, "
+                  f"closest {f['model']} (residual {f['residual']:.3f})")
+    if r["failed"]:
+        print(f"{r['algorithm']:>15}: failed at n={r['failed']}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m SortAlgorithm.Complexity",
+                                     description="Estimate growth rates of the sorting algorithms")
+    sub = parser.add_subparsers(dest="command", required=True)
+    fit_p = sub.add_parser("fit", help="fit exponents on uniform input")
+    cross_p = sub.add_parser("crossover", help="size where B starts beating A")
+    cross_p.add_argument("a", nargs="?", default="insertion_sort", choices=list(ALGORITHMS))
+    cross_p.add_argument("b", nargs="?", default="merge_sort", choices=list(ALGORITHMS))
+    worst_p = sub.add_parser("worst", help="find inputs that degrade an algorithm")
+    all_p = sub.add_parser("all", help="fit, insertion crossovers and worst cases")
+    for p in (fit_p, worst_p, all_p):
+        p.add_argument("--algorithms", default=",".join(ALGORITHMS),
+                       help="comma-separated subset of " + ", ".join(ALGORITHMS))
+    for p in (fit_p, cross_p, worst_p, all_p):
+        p.add_argument("--json", default=None, help="write the raw results here")
+    args = parser.parse_args(argv)
+
+    names = [n for n in getattr(args, "algorithms", "").split(",") if n]
+    unknown = [n for n in names if n not in ALGORITHMS]
+    if unknown:
+        parser.error(f"unknown algorithms: {', '.join(unknown)}")
+
+    report: Dict = {}
+    if args.command in ("fit", "all"):
+        report["fits"] = [analyse(n) for n in names]
+        for r in report["fits"]:
+            _print_fit(r)
+    if args.command in ("crossover", "all"):
+        pairs = [(args.a, args.b)] if args.command == "crossover" else \
+            [("insertion_sort", b) for b in ("merge_sort", "quick_sort", "heap_sort")]
+        report["crossovers"] = [crossover(a, b) for a, b in pairs]
+        for c in report["crossovers"]:
+            where = f"n ~ {c['n']}" if c["n"] else "not within the sweep"
+            print(f"{c['b']} overtakes {c['a']} at {where}")
+    if args.command in ("worst", "all"):
+        report["worst_cases"] = worst_cases(names)
+        for w in report["worst_cases"]:
+            exp = f"{w['exponent']:.2f}" if w["exponent"] is not None else "n/a"
+            base = f"{w['uniform_exponent']:.2f}" if w["uniform_exponent"] is not None else "n/a"
+            extra = f", failed at n={w['failed_sizes']}" if w["failed_sizes"] else ""
+            print(f"worst case: {w['algorithm']} on {w['shape']} input, {w['metric']} exponent "
+                  f"{exp} vs {base} on uniform{extra}")
+        if not report["worst_cases"]:
+            print("no shape degraded any algorithm")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
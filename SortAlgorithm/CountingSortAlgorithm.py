@@ -1,4 +1,10 @@
+from array import array
+from SortAlgorithm.Buffers import INT_TYPECODES, is_buffer, typecode_of, writable_view
+from SortAlgorithm.Permutation import index_buffer
+
 def counting_sort(arr):
+    if is_buffer(arr):
+        return _counting_sort_buffer(arr)
     if not arr:
         return []
     
@@ -18,6 +24,57 @@ def counting_sort(arr):
 
     return output
 
+def _counting_sort_buffer(arr):
+    # Same counts as the list path, written back over the buffer in runs
+    view = writable_view(arr)
+    typecode = typecode_of(view)
+    if typecode not in INT_TYPECODES:
+        raise TypeError(f"counting sort needs an integer buffer, got {typecode!r}")
+    if len(view) == 0:
+        return arr
+
+    max_val = max(view)
+    min_val = min(view)
+
+    count = [0] * (max_val - min_val + 1)
+    for num in view:
+        count[num - min_val] += 1
+
+    pos = 0
+    for i, freq in enumerate(count):
+        if freq:
+            view[pos:pos + freq] = array(typecode, [i + min_val]) * freq
+            pos += freq
+
+    return arr
+
+def counting_argsort(keys, idx=None):
+    # Stable: indices are scattered in their original order within each key
+    idx = index_buffer(len(keys), idx)
+    if not idx:
+        return idx
+
+    max_val = max(keys)
+    min_val = min(keys)
+
+    count = [0] * (max_val - min_val + 1)
+    for i in idx:
+        count[keys[i] - min_val] += 1
+
+    total = 0
+    for v, freq in enumerate(count):
+        count[v] = total
+        total += freq
+
+    output = array('q', bytes(8 * len(idx)))
+    for i in idx:
+        pos = count[keys[i] - min_val]
+        output[pos] = i
+        count[keys[i] - min_val] = pos + 1
+
+    idx[:] = output
+    return idx
+
 if __name__ == "__main__":
      data = [23, 77, 10, 12, 50, 60, 9]
      print("Unsorted Data:", data)
@@ -0,0 +1,288 @@
+"""
+Seeded dataset generator for benchmarks and the visualizer
+
+generate(shape, n, seed) builds the input in bulk (NumPy when it is
+installed, plain Python otherwise) and caches it on disk so the same
+(shape, n, seed) is only ever generated once. Both backends draw from the
+same random.Random stream and produce identical data for a seed.
+"""
+import hashlib
+import math
+import operator
+import os
+import random
+import sys
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+SHAPES = (
+    "uniform", "gaussian", "zipf", "nearly_sorted", "reversed",
+    "sawtooth", "few_unique", "organ_pipe", "all_equal",
+)
+DTYPES = ("int", "float", "record")
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "SORTAPP_DATASET_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "sortingapp", "datasets"),
+)
+
+Dataset = Union[List[int], List[float], List[Dict]]
+
+
+# Spans up to this size sample zipf ranks from a cumulative weight table;
+# larger spans use rejection-inversion, which needs no table at all
+ZIPF_TABLE_SIZE = 1 << 16
+
+# Spacing of the doubles a 53-bit word maps onto in [0, 1)
+_ULP = 2.0 ** -53
+
+
+class _Stream:
+    """
+    Uniform doubles in [0, 1) drawn from random.Random(seed)
+
+    Both backends read the same 64-bit words and map them to doubles the
+    same way, and every later step is plain float arithmetic done in the
+    same order, so a seed gives the same dataset with or without NumPy.
+    """
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+
+    def words(self, k: int) -> bytes:
+        return self.rng.getrandbits(64 * k).to_bytes(8 * k, "little") if k else b""
+
+    def uniform(self, k: int) -> List[float]:
+        buf = array("Q", self.words(k))
+        if sys.byteorder == "big":
+            buf.byteswap()
+        return [(w >> 11) * _ULP for w in buf]
+
+    def numpy_uniform(self, k: int):
+        return (np.frombuffer(self.words(k), "<u8") >> np.uint64(11)).astype(np.float64) * _ULP
+
+
+def _zipf_table(count: int, s: float) -> List[float]:
+    return list(accumulate(r ** -s for r in range(1, count + 1)))
+
+
+def _zipf_ranks(rng: random.Random, n: int, count: int, s: float) -> List[int]:
+    """
+    n ranks in [0, count) with P(r) proportional to (r + 1) ** -s
+
+    Rejection-inversion (Hoermann and Derflinger, 1996) samples from the
+    continuous envelope and accepts nearly every draw, in O(1) memory.
+    """
+    def helper1(x):  # log1p(x) / x
+        return math.log1p(x) / x if abs(x) > 1e-8 else 1 - x * (0.5 - x * (1 / 3 - 0.25 * x))
+
+    def helper2(x):  # expm1(x) / x
+        return math.expm1(x) / x if abs(x) > 1e-8 else 1 + 0.5 * x * (1 + x / 3 * (1 + 0.25 * x))
+
+    def h(x):
+        return math.exp(-s * math.log(x))
+
+    def h_integral(x):
+        log_x = math.log(x)
+        return helper2((1 - s) * log_x) * log_x
+
+    def h_integral_inverse(x):
+        t = max(-1.0, x * (1 - s))
+        return math.exp(helper1(t) * x)
+
+    lo, hi = h_integral(1.5) - 1, h_integral(count + 0.5)
+    squeeze = 2 - h_integral_inverse(h_integral(2.5) - h(2))
+    ranks = []
+    while len(ranks) < n:
+        u = hi + rng.random() * (lo - hi)
+        x = h_integral_inverse(u)
+        k = min(count, max(1, int(x + 0.5)))
+        if k - x <= squeeze or u >= h_integral(k + 0.5) - h(k):
+            ranks.append(k - 1)
+    return ranks
+
+
+def _numpy_values(shape: str, n: int, stream: _Stream, low, high, is_float: bool, params: Dict):
+    """Bulk generation of the key column with NumPy, bit-identical to _python_values"""
+    span = high - low
+    if shape in ("uniform", "nearly_sorted", "reversed"):
+        u = stream.numpy_uniform(n)
+        values = low + span * u if is_float else low + np.floor(u * (span + 1))
+    elif shape == "gaussian":
+        # Irwin-Hall: the sum of 12 uniforms minus 6 is close to N(0, 1)
+        u = stream.numpy_uniform(12 * n).reshape(n, 12)
+        z = u[:, 0].copy()
+        for k in range(1, 12):
+            z += u[:, k]
+        values = np.clip((low + high) / 2 + (span / 6 or 1) * (z - 6), low, high)
+    elif shape == "zipf":
+        count = int(span) + 1
+        if count <= ZIPF_TABLE_SIZE:
+            cum = np.array(_zipf_table(count, params["zipf_s"]))
+            values = low + np.searchsorted(cum, stream.numpy_uniform(n) * cum[-1], side="left")
+        else:
+            values = low + np.array(_zipf_ranks(stream.rng, n, count, params["zipf_s"]))
+    elif shape == "sawtooth":
+        period = params["period"]
+        values = low + (np.arange(n) % period) * (span / max(1, period - 1))
+    elif shape == "few_unique":
+        u = stream.numpy_uniform(params["unique"])
+        pool = low + span * u if is_float else low + np.floor(u * (span + 1))
+        values = pool[np.floor(stream.numpy_uniform(n) * len(pool)).astype(np.int64)]
+    elif shape == "organ_pipe":
+        idx = np.arange(n)
+        values = low + np.minimum(idx, n - 1 - idx) * (span / max(1, (n - 1) // 2))
+    else:  # all_equal
+        values = np.full(n, (low + high) / 2)
+
+    if shape == "nearly_sorted":
+        values.sort()
+        u = stream.numpy_uniform(2 * params["swaps"])
+        for i, j in np.floor(u * n).astype(np.int64).reshape(-1, 2).tolist():
+            values[i], values[j] = values[j], values[i]
+    elif shape == "reversed":
+        values.sort()
+        values = values[::-1]
+
+    if is_float:
+        return values.astype(np.float64).tolist()
+    return np.rint(values).astype(np.int64).tolist()
+
+
+def _python_values(shape: str, n: int, stream: _Stream, low, high, is_float: bool, params: Dict):
+    """Fallback generation of the key column in pure Python"""
+    span = high - low
+    if shape in ("uniform", "nearly_sorted", "reversed"):
+        u = stream.uniform(n)
+        if is_float:
+            values = [low + span * x for x in u]
+        else:
+            values = [low + int(x * (span + 1)) for x in u]
+    elif shape == "gaussian":
+        mu, sigma = (low + high) / 2, span / 6 or 1
+        u = stream.uniform(12 * n)
+        z = u[0::12]
+        for k in range(1, 12):
+            z = list(map(operator.add, z, u[k::12]))
+        values = [min(high, max(low, mu + sigma * (x - 6))) for x in z]
+    elif shape == "zipf":
+        count = int(span) + 1
+        if count <= ZIPF_TABLE_SIZE:
+            cum = _zipf_table(count, params["zipf_s"])
+            total = cum[-1]
+            values = [low + bisect_left(cum, x * total) for x in stream.uniform(n)]
+        else:
+            values = [low + r for r in _zipf_ranks(stream.rng, n, count, params["zipf_s"])]
+    elif shape == "sawtooth":
+        period = params["period"]
+        step = span / max(1, period - 1)
+        values = [low + (i % period) * step for i in range(n)]
+    elif shape == "few_unique":
+        u = stream.uniform(params["unique"])
+        if is_float:
+            pool = [low + span * x for x in u]
+        else:
+            pool = [low + int(x * (span + 1)) for x in u]
+        values = [pool[int(x * len(pool))] for x in stream.uniform(n)]
+    elif shape == "organ_pipe":
+        step = span / max(1, (n - 1) // 2)
+        values = [low + min(i, n - 1 - i) * step for i in range(n)]
+    else:  # all_equal
+        values = [(low + high) / 2] * n
+
+    if shape == "nearly_sorted":
+        values.sort()
+        u = stream.uniform(2 * params["swaps"])
+        for k in range(0, len(u), 2):
+            i, j = int(u[k] * n), int(u[k + 1] * n)
+            values[i], values[j] = values[j], values[i]
+    elif shape == "reversed":
+        values.sort(reverse=True)
+
+    if is_float:
+        return [float(v) for v in values]
+    return [int(round(v)) for v in values]
+
+
+def _cache_path(cache_dir: str, shape: str, n: int, seed: int, dtype: str, params: Dict) -> str:
+    digest = hashlib.sha1(repr(sorted(params.items())).encode()).hexdigest()[:10]
+    return os.path.join(cache_dir, f"{shape}-n{n}-s{seed}-{dtype}-{digest}.bin")
+
+
+def _to_records(keys: List[int]) -> List[Dict]:
+    return [{"id": i, "key": k} for i, k in enumerate(keys)]
+
+
+def generate(shape: str, n: int, seed: int = 0, dtype: str = "int",
+             low: Union[int, float] = 0, high: Union[int, float] = 100,
+             swaps: Optional[int] = None, period: Optional[int] = None,
+             unique: int = 8, zipf_s: float = 1.2,
+             cache: bool = True, cache_dir: Optional[str] = None) -> Dataset:
+    """
+    Build a seeded dataset of n values in [low, high]
+
+    dtype "int" and "float" return a list of numbers; "record" returns
+    dicts {"id": i, "key": int} for record-sorting benchmarks.
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"unknown shape {shape!r}, expected one of {SHAPES}")
+    if dtype not in DTYPES:
+        raise ValueError(f"unknown dtype {dtype!r}, expected one of {DTYPES}")
+    if n <= 0:
+        return []
+
+    is_float = dtype == "float"
+    params = {
+        "low": low, "high": high, "unique": max(1, unique), "zipf_s": zipf_s,
+        "swaps": swaps if swaps is not None else max(1, n // 100),
+        "period": period if period is not None else max(2, math.isqrt(n)),
+    }
+
+    path = None
+    if cache:
+        path = _cache_path(cache_dir or DEFAULT_CACHE_DIR, shape, n, seed, dtype, params)
+        if os.path.exists(path):
+            buf = array("d" if is_float else "q")
+            with open(path, "rb") as f:
+                buf.fromfile(f, n)
+            values = buf.tolist()
+            return _to_records(values) if dtype == "record" else values
+
+    if np is not None:
+        values = _numpy_values(shape, n, _Stream(seed), low, high, is_float, params)
+    else:
+        values = _python_values(shape, n, _Stream(seed), low, high, is_float, params)
+
+    if path is not None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            array("d" if is_float else "q", values).tofile(f)
+        os.replace(tmp, path)
+
+    return _to_records(values) if dtype == "record" else values
+
+
+def clear_cache(cache_dir: Optional[str] = None) -> int:
+    """Delete cached datasets; returns the number of files removed"""
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    if not os.path.isdir(cache_dir):
+        return 0
+    removed = 0
+    for name in os.listdir(cache_dir):
+        if name.endswith(".bin"):
+            os.remove(os.path.join(cache_dir, name))
+            removed += 1
+    return removed
+
+
+if __name__ == "__main__":
+    for shape in SHAPES:
+        print(f"{shape:>14}:", generate(shape, 16, seed=42, cache=False))
@@ -1,3 +1,6 @@
+from SortAlgorithm.Buffers import writable_view
+from SortAlgorithm.Permutation import index_buffer
+
 def heap_sort(arr):
     def sift_down(a, start, end):
         root = start
@@ -19,13 +22,40 @@ def heap_sort(arr):
         for i in range(n // 2 - 1, -1, -1):
             sift_down(a, i, n -1 )
 
-    a = arr
+    a = writable_view(arr)
     n = len(a)
     build_max_heap(a)
     for end in range(n-1, 0, -1):
         a[0], a[end] = a[end], a[0]
         sift_down(a, 0, end -1)
 
+    return arr
+
+def heap_argsort(keys, idx=None):
+    # Not stable, like heap_sort
+    def sift_down(a, start, end):
+        root = start
+        while (left :=2 * root +1) <= end:
+            right = left +1
+            largest = root
+            if keys[a[left]] > keys[a[largest]]:
+                largest = left
+
+            if right <= end and keys[a[right]] > keys[a[largest]]:
+                largest = right
+            if largest == root:
+                break
+            a[root], a[largest] = a[largest], a[root]
+            root = largest
+
+    a = index_buffer(len(keys), idx)
+    n = len(a)
+    for i in range(n // 2 - 1, -1, -1):
+        sift_down(a, i, n - 1)
+    for end in range(n-1, 0, -1):
+        a[0], a[end] = a[end], a[0]
+        sift_down(a, 0, end -1)
+
     return a
 
 if __name__ == "__main__":
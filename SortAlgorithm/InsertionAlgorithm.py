@@ -1,18 +1,39 @@
+from SortAlgorithm.Buffers import writable_view
+from SortAlgorithm.Permutation import index_buffer
+
 def insertion_sort(arr):
-    
-    n = len(arr) # getting a length of a list
+    a = writable_view(arr)
+    n = len(a) # getting a length of a list
 
     for i in range(n):
-        key = arr[i]
+        key = a[i]
         j = i - 1
 
-        while j >= 0 and arr[j] > key:
-            arr[j + 1] = arr[j]
+        while j >= 0 and a[j] > key:
+            a[j + 1] = a[j]
             j -= 1
 
-        arr[j + 1] = key
+        a[j + 1] = key
 
     return arr
+
+def insertion_argsort(keys, idx=None):
+    # Stable: an index only moves past strictly larger keys
+    n = len(keys)
+    idx = index_buffer(n, idx)
+
+    for i in range(n):
+        cur = idx[i]
+        key = keys[cur]
+        j = i - 1
+
+        while j >= 0 and keys[idx[j]] > key:
+            idx[j + 1] = idx[j]
+            j -= 1
+
+        idx[j + 1] = cur
+
+    return idx
     #demo test
 
 if __name__ == "__main__":
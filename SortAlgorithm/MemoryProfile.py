@@ -0,0 +1,166 @@
+"""
+Memory profiling for single algorithm calls
+
+profile_call() runs a function twice on fresh copies of its input:
+
+* once untraced, with a thread sampling the process RSS, for the real
+  resident growth the call causes;
+* once under tracemalloc, for the peak extra Python heap bytes, the bytes
+  still held afterwards (usually the result), and the allocation sites
+  that were live when the traced heap was at its largest.
+
+Sites are found by taking a tracemalloc snapshot from the sampler thread
+whenever the traced heap grows past its previous high-water mark, so they
+describe the peak rather than what survives the call.
+"""
+import gc
+import os
+import threading
+import tracemalloc
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+SAMPLE_INTERVAL_S = 0.001
+
+# A new peak snapshot is only taken once the heap grows this much past the last one
+SNAPSHOT_GROWTH = 1.10
+
+_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, "*_weakrefset.py"),  # thread start bookkeeping
+    tracemalloc.Filter(False, __file__),
+]
+
+
+def rss_bytes() -> int:
+    """Current resident set size, or the lifetime peak where /proc is missing"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        if resource is None:
+            return 0
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class _Sampler(threading.Thread):
+    """Polls a probe until stopped, keeping the largest value seen"""
+
+    def __init__(self, probe: Callable[[], int], on_peak: Optional[Callable[[int], None]] = None,
+                 interval: float = SAMPLE_INTERVAL_S):
+        super().__init__(daemon=True)
+        self.probe = probe
+        self.on_peak = on_peak
+        self.interval = interval
+        self.peak = probe()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            value = self.probe()
+            if value > self.peak:
+                self.peak = value
+                if self.on_peak is not None:
+                    self.on_peak(value)
+
+    def stop(self) -> int:
+        self._stop_event.set()
+        self.join()
+        self.peak = max(self.peak, self.probe())
+        return self.peak
+
+
+def _peak_rss(fn: Callable, values: Any, interval: float) -> int:
+    gc.collect()
+    base = rss_bytes()
+    sampler = _Sampler(rss_bytes, interval=interval)
+    sampler.start()
+    try:
+        fn(values)
+    finally:
+        peak = sampler.stop()
+    return max(0, peak - base)
+
+
+def _traced(fn: Callable, values: Any, top: int, interval: float) -> Dict:
+    own_tracing = not tracemalloc.is_tracing()
+    if own_tracing:
+        tracemalloc.start(1)
+    try:
+        # The first filter_traces call compiles the fnmatch patterns; do it on a
+        # throwaway snapshot so those allocations are not charged to fn. The
+        # snapshot needs a trace to match, and tracing may have just started
+        warm = bytearray(64)
+        tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        del warm
+        gc.collect()
+        before = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+
+        state = {"snapshot": None, "size": base}
+
+        def on_peak(current: int) -> None:
+            if current > state["size"] * SNAPSHOT_GROWTH:
+                state["snapshot"] = tracemalloc.take_snapshot()
+                state["size"] = current
+
+        sampler = _Sampler(lambda: tracemalloc.get_traced_memory()[0], on_peak, interval)
+        sampler.start()
+        try:
+            result = fn(values)
+        finally:
+            sampler.stop()
+        current, peak = tracemalloc.get_traced_memory()
+
+        snapshot = state["snapshot"] or tracemalloc.take_snapshot()
+        diffs = [d for d in snapshot.filter_traces(_FILTERS).compare_to(before, "lineno")
+                 if d.size_diff > 0]
+        diffs.sort(key=lambda d: d.size_diff, reverse=True)
+        del result
+        return {
+            "peak_extra_bytes": peak - base,
+            "retained_bytes": current - base,
+            "peak_blocks": sum(d.count_diff for d in diffs if d.count_diff > 0),
+            "sites": [{
+                "site": f"{os.path.basename(d.traceback[0].filename)}:{d.traceback[0].lineno}",
+                "bytes": d.size_diff,
+                "blocks": d.count_diff,
+            } for d in diffs[:top]],
+        }
+    finally:
+        if own_tracing:
+            tracemalloc.stop()
+
+
+def profile_call(fn: Callable, data: Any, copy: Callable = list, top: int = 5,
+                 interval: float = SAMPLE_INTERVAL_S) -> Dict:
+    """
+    Memory cost of fn(copy(data)); the input copy itself is not counted
+
+    Returns peak_rss_bytes, peak_extra_bytes, retained_bytes, peak_blocks
+    (new live blocks at the traced peak) and the top allocation sites.
+    """
+    row = {"peak_rss_bytes": _peak_rss(fn, copy(data), interval)}
+    row.update(_traced(fn, copy(data), top, interval))
+    return row
+
+
+#Demo
+if __name__ == "__main__":
+    from SortAlgorithm.MergeSortAlgorithm import merge_sort
+    from SortAlgorithm.RadixAlgorithm import radix_sort_lsd
+    import random
+
+    data = [random.randrange(10**6) for _ in range(20000)]
+    for name, fn in (("merge_sort", merge_sort), ("radix_sort_lsd", radix_sort_lsd)):
+        r = profile_call(fn, data)
+        print(f"{name}: peak +{r['peak_extra_bytes'] / 1024:.0f} KiB traced, "
+              f"+{r['peak_rss_bytes'] / 1024:.0f} KiB RSS, {r['peak_blocks']} blocks")
+        for s in r["sites"][:3]:
+            print(f"    {s['site']:<32} {s['bytes'] / 1024:8.0f} KiB  {s['blocks']} blocks")
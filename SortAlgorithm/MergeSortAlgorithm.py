@@ -1,11 +1,32 @@
-def merge_sort(arr):
+from array import array
+from heapq import heapify, heappop, heapreplace
+from itertools import islice
+from SortAlgorithm.Buffers import is_buffer, scratch_like, writable_view
+from SortAlgorithm.InsertionAlgorithm import insertion_sort
+from SortAlgorithm.Permutation import index_buffer
+from SortAlgorithm.TuningProfile import tuned
+
+# Runs of at most this many elements are insertion sorted instead of split
+MERGE_SORT_CUTOFF = tuned("merge_sort_cutoff")
+
+# Items pulled from each input at a time by merge_iter
+MERGE_BATCH = 256
+
+def merge_sort(arr, cutoff=MERGE_SORT_CUTOFF):
+
+    if is_buffer(arr):
+        # Typed buffers are sorted in place instead of sliced into lists
+        _merge_sort_buffer(writable_view(arr), cutoff)
+        return arr
 
     if len(arr) <= 1:
         return arr
+    if len(arr) <= cutoff:
+        return insertion_sort(list(arr))
     
     mid = len(arr) //2
-    left_half = merge_sort(arr[:mid])
-    right_half = merge_sort(arr[mid:])
+    left_half = merge_sort(arr[:mid], cutoff)
+    right_half = merge_sort(arr[mid:], cutoff)
 
     return merge(left_half, right_half)
 
@@ -26,8 +47,175 @@ def merge(left, right):
     result.extend(right[j:])
     return result
 
+def _merge_sort_buffer(view, cutoff=1):
+    # Bottom-up merge between the buffer and one same-typecode scratch buffer
+    n = len(view)
+    if n <= 1:
+        return
+    src = memoryview(view)
+    dst = memoryview(scratch_like(view))
+    in_scratch = False
+
+    # Insertion sort the initial runs, then merge from that width up
+    width = max(1, cutoff)
+    if width > 1:
+        for lo in range(0, n, width):
+            for i in range(lo + 1, min(lo + width, n)):
+                key = src[i]
+                j = i - 1
+                while j >= lo and src[j] > key:
+                    src[j + 1] = src[j]
+                    j -= 1
+                src[j + 1] = key
+
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if src[i] <= src[j]:
+                    dst[k] = src[i]
+                    i += 1
+                else:
+                    dst[k] = src[j]
+                    j += 1
+                k += 1
+            dst[k:k + mid - i] = src[i:mid]
+            k += mid - i
+            dst[k:k + hi - j] = src[j:hi]
+        src, dst = dst, src
+        in_scratch = not in_scratch
+        width *= 2
+
+    if in_scratch:
+        dst[:] = src
+
+def merge_argsort(keys, idx=None):
+    # Stable bottom-up merge of the index buffer through one scratch buffer
+    src = index_buffer(len(keys), idx)
+    n = len(src)
+    if n <= 1:
+        return src
+    result = src
+    dst = array('q', bytes(8 * n))
+
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if keys[src[i]] <= keys[src[j]]:
+                    dst[k] = src[i]
+                    i += 1
+                else:
+                    dst[k] = src[j]
+                    j += 1
+                k += 1
+            dst[k:k + mid - i] = src[i:mid]
+            k += mid - i
+            dst[k:k + hi - j] = src[j:hi]
+        src, dst = dst, src
+        width *= 2
+
+    if src is not result:
+        result[:] = src
+    return result
+
+class _Reversed:
+    # Inverts comparisons so the min-heap pops the largest key first
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+def _batches(it, key, batch):
+    # Yields (values, keys) lists so keys are computed once per element
+    while True:
+        values = list(islice(it, batch))
+        if not values:
+            return
+        yield values, values if key is None else list(map(key, values))
+
+def _merge_two(a, b, key, reverse, batch):
+    # Two-pointer merge over batches; ties take from a, which keeps it stable
+    ba = _batches(a, key, batch)
+    bb = _batches(b, key, batch)
+    va, ka = next(ba, ((), ()))
+    vb, kb = next(bb, ((), ()))
+    i = j = 0
+    while va and vb:
+        if (ka[i] < kb[j]) if reverse else (kb[j] < ka[i]):
+            yield vb[j]
+            j += 1
+            if j == len(vb):
+                vb, kb = next(bb, ((), ()))
+                j = 0
+        else:
+            yield va[i]
+            i += 1
+            if i == len(va):
+                va, ka = next(ba, ((), ()))
+                i = 0
+    rest, pos, source = (va, i, ba) if va else (vb, j, bb)
+    yield from rest[pos:]
+    for values, _ in source:
+        yield from values
+
+def merge_iter(*iterables, key=None, reverse=False, batch=MERGE_BATCH):
+    """
+    Lazily merge already-sorted iterables into one sorted generator
+
+    Keeps one batch per input plus a k-entry heap. Equal keys come out in
+    argument order, so the merge is stable.
+    """
+    sources = [iter(it) for it in iterables]
+    if len(sources) == 1:
+        yield from sources[0]
+        return
+    if len(sources) == 2:
+        yield from _merge_two(sources[0], sources[1], key, reverse, batch)
+        return
+
+    feeds = [_batches(it, key, batch) for it in sources]
+    buffers = []
+    heap = []
+    for s, feed in enumerate(feeds):
+        values, keys = next(feed, ((), ()))
+        buffers.append([values, keys, 0])
+        if values:
+            k = _Reversed(keys[0]) if reverse else keys[0]
+            heap.append((k, s))
+    heapify(heap)
+
+    while heap:
+        _, s = heap[0]
+        buf = buffers[s]
+        values, keys, pos = buf
+        yield values[pos]
+        pos += 1
+        if pos == len(values):
+            values, keys = next(feeds[s], ((), ()))
+            buf[0], buf[1] = values, keys
+            pos = 0
+            if not values:
+                heappop(heap)
+                continue
+        buf[2] = pos
+        heapreplace(heap, (_Reversed(keys[pos]) if reverse else keys[pos], s))
+
 if __name__ == "__main__":
     data = [23, 77, 10, 12, 50, 60, 9]
     print("Unsorted Data:", data)
     sorted_data = merge_sort(data)
-    print("Sorted Data:", sorted_data)
\ No newline at end of file
+    print("Sorted Data:", sorted_data)
+    shards = [[9, 23, 77], [10, 12], [50, 60, 90]]
+    print("Merged shards:", list(merge_iter(*shards)))
\ No newline at end of file
@@ -0,0 +1,139 @@
+"""
+Opt-in timing hooks for the SortAlgorithm package
+
+Algorithms never print. When a hook is installed they report
+(name, duration_ns, n) after each call; when none is installed the
+timing code is skipped entirely.
+"""
+import json
+import time
+from typing import Callable, Dict, List, Optional
+
+TimingHook = Callable[[str, int, int], None]
+
+_hook: Optional[TimingHook] = None
+
+
+def set_timing_hook(hook: Optional[TimingHook]) -> None:
+    """Install a callable(name, duration_ns, n), or None to disable timing"""
+    global _hook
+    _hook = hook
+
+
+def start_timer() -> int:
+    """Return a perf_counter_ns start mark, or 0 when timing is disabled"""
+    return time.perf_counter_ns() if _hook is not None else 0
+
+
+def stop_timer(name: str, start: int, n: int = 0) -> None:
+    """Report the time since start to the installed hook (if any)"""
+    if start and _hook is not None:
+        _hook(name, time.perf_counter_ns() - start, n)
+
+
+class Histogram:
+    """Log2-bucketed histogram of nanosecond durations"""
+
+    def __init__(self):
+        self.buckets: List[int] = [0] * 64
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, duration_ns: int) -> None:
+        if self.count == 0 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+        self.buckets[min(63, max(0, duration_ns).bit_length())] += 1
+
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile_ns(self, q: float) -> int:
+        """Upper bound of the bucket holding the q-th percentile (0-100)"""
+        if not self.count:
+            return 0
+        target = max(1, int(self.count * q / 100 + 0.5))
+        seen = 0
+        for i, c in enumerate(self.buckets):
+            seen += c
+            if seen >= target:
+                return min(self.max_ns, (1 << i) - 1 if i else 0)
+        return self.max_ns
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "mean_ns": self.mean_ns(),
+            "p50_ns": self.percentile_ns(50),
+            "p99_ns": self.percentile_ns(99),
+            "buckets": {self.bucket_label(i): c for i, c in enumerate(self.buckets) if c},
+        }
+
+    @staticmethod
+    def bucket_label(i: int) -> str:
+        """Inclusive ns range of bucket i: 0, then [2**(i-1), 2**i - 1], the last one open"""
+        if i == 0:
+            return "0"
+        if i == 63:
+            return f"{1 << 62}+"
+        return f"{1 << (i - 1)}-{(1 << i) - 1}"
+
+
+class MetricsRegistry:
+    """In-memory histograms keyed by algorithm name; usable as a timing hook"""
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self.elements: Dict[str, int] = {}
+
+    def __call__(self, name: str, duration_ns: int, n: int) -> None:
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = Histogram()
+            self.elements[name] = 0
+        hist.record(duration_ns)
+        self.elements[name] += n
+
+    def snapshot(self) -> Dict[str, Dict]:
+        out = {}
+        for name, hist in self.histograms.items():
+            data = hist.to_dict()
+            data["elements"] = self.elements[name]
+            out[name] = data
+        return out
+
+    def export_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+    def reset(self) -> None:
+        self.histograms.clear()
+        self.elements.clear()
+
+
+def enable_metrics(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """Start recording timings into registry (a new one by default) and return it"""
+    registry = registry if registry is not None else MetricsRegistry()
+    set_timing_hook(registry)
+    return registry
+
+
+def disable_metrics() -> None:
+    set_timing_hook(None)
+
+
+if __name__ == "__main__":
+    registry = enable_metrics()
+    for n in (10, 100, 1000):
+        start = start_timer()
+        sorted(range(n, 0, -1))
+        stop_timer("sorted", start, n)
+    print(json.dumps(registry.snapshot(), indent=2))
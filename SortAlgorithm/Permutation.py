@@ -0,0 +1,50 @@
+"""
+Index-buffer helpers shared by the argsort functions
+
+A permutation is an array('q') where position i holds the index of the
+element that belongs at i, i.e. sorted_seq[i] == seq[perm[i]].
+"""
+from array import array
+from typing import MutableSequence, Optional, Sequence
+
+
+def index_buffer(n: int, idx: Optional[array] = None) -> array:
+    """Return idx, or a fresh identity permutation of length n"""
+    if idx is None:
+        return array('q', range(n))
+    if len(idx) != n:
+        raise ValueError(f"index buffer has {len(idx)} entries for {n} keys")
+    return idx
+
+
+def apply_permutation(perm: Sequence[int], *seqs: MutableSequence) -> None:
+    """Reorder every seq in place so that seq[i] becomes old seq[perm[i]]"""
+    n = len(perm)
+    for seq in seqs:
+        if len(seq) != n:
+            raise ValueError(f"sequence of length {len(seq)} for permutation of {n}")
+    done = bytearray(n)
+    for start in range(n):
+        if done[start] or perm[start] == start:
+            continue
+        # Walk the cycle once, shifting every sequence along it
+        saved = [seq[start] for seq in seqs]
+        j = start
+        while True:
+            done[j] = 1
+            k = perm[j]
+            if k == start:
+                for seq, value in zip(seqs, saved):
+                    seq[j] = value
+                break
+            for seq in seqs:
+                seq[j] = seq[k]
+            j = k
+
+
+def invert_permutation(perm: Sequence[int]) -> array:
+    """Return inv with inv[perm[i]] == i (the rank of each original element)"""
+    inv = array('q', bytes(8 * len(perm)))
+    for i, p in enumerate(perm):
+        inv[p] = i
+    return inv
@@ -1,5 +1,7 @@
-import time
-from typing import List
+from array import array
+from typing import List, Optional
+from SortAlgorithm.Metrics import start_timer, stop_timer
+from SortAlgorithm.Permutation import index_buffer
 
 def partition(arr: List[int], low: int, high: int) -> int:
     pivot = arr[high]
@@ -23,14 +25,38 @@ def quick_select(arr: List[int], low: int, high: int, k: int) -> int:
 
 def timed_quick_select(arr: List[int], k: int) -> int:
 
-    start = time.perf_counter()
+    start = start_timer()
     result = quick_select(arr, 0, len(arr) - 1, k)
-    end = time.perf_counter()
-    print(f"[QuickSelect] found k={k} in {end - start:.6f} sec")
+    stop_timer("quick_select", start, len(arr))
     return result
 
+def _arg_partition(keys, idx, low: int, high: int) -> int:
+    pivot = keys[idx[high]]
+    i = low
+    for j in range(low, high):
+        if keys[idx[j]] <= pivot:
+            idx[i], idx[j] = idx[j], idx[i]
+            i += 1
+    idx[i], idx[high] = idx[high], idx[i]
+    return i
+
+def arg_quick_select(keys, k: int, idx: Optional[array] = None) -> int:
+    # Index of the k-th smallest key; idx is left partitioned around position k
+    idx = index_buffer(len(keys), idx)
+    low, high = 0, len(idx) - 1
+    while low <= high:
+        pi = _arg_partition(keys, idx, low, high)
+        if pi == k:
+            return idx[pi]
+        elif pi > k:
+            high = pi - 1
+        else:
+            low = pi + 1
+    raise IndexError(f"k={k} out of range for {len(idx)} keys")
+
 #DEMO
-incomes = [5000, 72000, 48000, 93000, 60000, 83000, 75000]
-median_idx = len(incomes) // 2
-median_income = timed_quick_select(incomes, median_idx)
-print("Median Income:", median_income)
\ No newline at end of file
+if __name__ == "__main__":
+    incomes = [5000, 72000, 48000, 93000, 60000, 83000, 75000]
+    median_idx = len(incomes) // 2
+    median_income = timed_quick_select(incomes, median_idx)
+    print("Median Income:", median_income)
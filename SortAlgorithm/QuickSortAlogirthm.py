@@ -1,13 +1,129 @@
-def quick_sort(arr):
+from SortAlgorithm.Buffers import writable_view
+from SortAlgorithm.Permutation import index_buffer
+from SortAlgorithm.TuningProfile import tuned
+
+# Ranges shorter than this are finished with insertion sort
+QUICK_SORT_CUTOFF = tuned("quick_sort_cutoff")
+INTRO_SORT_CUTOFF = 16
+
+def quick_sort(arr, cutoff=QUICK_SORT_CUTOFF):
+    a = writable_view(arr)
+
+    def insertion(low, high):
+        for i in range(low + 1, high + 1):
+            key = a[i]
+            j = i - 1
+            while j >= low and a[j] > key:
+                a[j + 1] = a[j]
+                j -= 1
+            a[j + 1] = key
 
     def partition(low, high):
-        pivot = arr [(low + high) // 2]
+        pivot = a [(low + high) // 2]
         i = low
         j = high
         while i <= j:
-            while arr[i] < pivot:
+            while a[i] < pivot:
                 i += 1
-            while arr[j] > pivot:
+            while a[j] > pivot:
+                j -= 1
+            if i <= j:
+                a[i], a[j] = a[j], a[i]
+                i += 1
+                j -= 1
+
+        return i,j
+    def sort(low,high):
+        if high - low < cutoff:
+            insertion(low, high)
+        elif low < high:
+            i, j = partition(low, high)
+            sort(low, j)
+            sort(i, high)
+
+    sort(0, len(a) - 1)
+    return arr
+
+def intro_sort(arr, cutoff=INTRO_SORT_CUTOFF):
+    # Quick sort with a depth limit: a range that recurses too deep is heap
+    # sorted instead, and short ranges are finished with insertion sort
+    a = writable_view(arr)
+
+    def insertion(low, high):
+        for i in range(low + 1, high + 1):
+            key = a[i]
+            j = i - 1
+            while j >= low and a[j] > key:
+                a[j + 1] = a[j]
+                j -= 1
+            a[j + 1] = key
+
+    def heap_range(low, high):
+        def sift_down(root, end):
+            while (child := 2 * root + 1) <= end:
+                if child + 1 <= end and a[low + child] < a[low + child + 1]:
+                    child += 1
+                if not a[low + root] < a[low + child]:
+                    return
+                a[low + root], a[low + child] = a[low + child], a[low + root]
+                root = child
+
+        size = high - low + 1
+        for i in range(size // 2 - 1, -1, -1):
+            sift_down(i, size - 1)
+        for end in range(size - 1, 0, -1):
+            a[low], a[low + end] = a[low + end], a[low]
+            sift_down(0, end - 1)
+
+    def partition(low, high):
+        # Median-of-three pivot value, then the same scheme as quick_sort
+        x, y, z = a[low], a[(low + high) // 2], a[high]
+        pivot = max(min(x, y), min(max(x, y), z))
+        i = low
+        j = high
+        while i <= j:
+            while a[i] < pivot:
+                i += 1
+            while a[j] > pivot:
+                j -= 1
+            if i <= j:
+                a[i], a[j] = a[j], a[i]
+                i += 1
+                j -= 1
+        return i, j
+
+    def sort(low, high, depth):
+        while high - low >= max(1, cutoff):
+            if depth == 0:
+                heap_range(low, high)
+                return
+            depth -= 1
+            i, j = partition(low, high)
+            # Recurse into the smaller side and loop on the larger one
+            if j - low < high - i:
+                sort(low, j, depth)
+                low = i
+            else:
+                sort(i, high, depth)
+                high = j
+        insertion(low, high)
+
+    n = len(a)
+    sort(0, n - 1, 2 * n.bit_length())
+    return arr
+
+def quick_argsort(keys, idx=None):
+    # Not stable, like quick_sort
+    arr = index_buffer(len(keys), idx)
+
+    def partition(low, high):
+        pivot = keys[arr[(low + high) // 2]]
+        i = low
+        j = high
+        while i <= j:
+            while keys[arr[i]] < pivot:
+                i += 1
+            while keys[arr[j]] > pivot:
                 j -= 1
             if i <= j:
                 arr[i], arr[j] = arr[j], arr[i]
@@ -23,6 +139,7 @@ def quick_sort(arr):
 
     sort(0, len(arr) - 1)
     return arr
+
 if __name__ == "__main__":
     data = [23, 77, 10, 12, 50, 60, 9]
     print("Unsorted Data:", data)
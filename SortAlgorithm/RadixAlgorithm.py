@@ -1,44 +1,68 @@
-from typing import List, Dict
-import time
+from array import array
+from typing import List, Dict, Optional
 import random
+from SortAlgorithm.Metrics import start_timer, stop_timer
+from SortAlgorithm.Buffers import INT_TYPECODES, is_buffer, scratch_like, typecode_of, writable_view
+from SortAlgorithm.Permutation import index_buffer
+from SortAlgorithm.TuningProfile import tuned
 
-def _counting_sort_by_digit(a: List[int], exp: int, base: int = 10) -> None:
+RADIX_BASE = tuned("radix_base")
+
+def _counting_sort_by_digit(a: List[int], exp: int, base: int = 10, offset: int = 0) -> None:
     n = len(a)
-    output = [0] * n
+    output = [0] * n if isinstance(a, list) else scratch_like(a)
     count = [0] * base
 
     for i in range(n):
-        digit = (a[i]// exp) % base
+        digit = ((a[i] - offset) // exp) % base
         count[digit] += 1
     for d in range(1, base):
         count[d] += count[d - 1]
 
     for i in range(n - 1, -1, -1):
-        digit = (a[i] // exp) % base
+        digit = ((a[i] - offset) // exp) % base
         pos = count[digit] -1
         output[pos] = a[i]
         count[digit] -= 1
 
-    for i in range(n):
-        a[i] = output[i]
+    a[:] = output
 
-def radix_sort_lsd_nonneg(a: List[int], base: int = 10) -> List[int]:
-    if not a:
+def _int_view(a):
+    view = writable_view(a)
+    if typecode_of(view) not in INT_TYPECODES:
+        raise TypeError(f"radix sort needs an integer buffer, got {typecode_of(view)!r}")
+    return view
+
+def radix_sort_lsd_nonneg(a: List[int], base: int = RADIX_BASE) -> List[int]:
+    if len(a) == 0:
         return a
     
-    start = time.perf_counter()
+    start = start_timer()
 
-    max_val = max(a)
+    view = _int_view(a) if is_buffer(a) else a
+    max_val = max(view)
     exp = 1 
 
     while max_val // exp > 0:
-        _counting_sort_by_digit(a, exp, base)
+        _counting_sort_by_digit(view, exp, base)
         exp *= base
-    end = time.perf_counter()
-    print (f"[Radix] nonneg sort in {end - start:.6f} sec (base={base})")
+    stop_timer("radix_sort_lsd_nonneg", start, len(a))
     return a
 
-def radix_sort_lsd(a: List[int], base: int = 10) -> List[int]:
+def radix_sort_lsd(a: List[int], base: int = RADIX_BASE) -> List[int]:
+    if is_buffer(a):
+        # In place: shift by the minimum instead of splitting off negatives
+        view = _int_view(a)
+        if len(view) == 0:
+            return a
+        offset = min(view)
+        span = max(view) - offset
+        exp = 1
+        while span // exp > 0:
+            _counting_sort_by_digit(view, exp, base, offset)
+            exp *= base
+        return a
+
     if not a:
         return a
     neg = [-x for x in a if x <0]
@@ -55,7 +79,86 @@ def radix_sort_lsd(a: List[int], base: int = 10) -> List[int]:
     out = neg_sorted + pos
     return out
 
-def sort_orders_by_id(orders: List[Dict], key: str = "order_id", base: int = 10) -> List[Dict]:
+_SIGN = 1 << 63
+_MASK64 = (1 << 64) - 1
+
+def radix_sort_float(a, bits: Optional[int] = None):
+    """
+    LSD radix sort of IEEE doubles via their uint64 bit patterns
+
+    Sorts array('d') and other float64 buffers in place through a
+    memoryview cast (a float list is sorted through one packed copy).
+    Order is IEEE totalOrder: -0.0 sorts before 0.0 and NaNs sort last,
+    with their sign bit cleared.
+    """
+    packed = not is_buffer(a)
+    buf = array('d', a) if packed else writable_view(a)
+    if typecode_of(buf) != 'd':
+        raise TypeError(f"float radix sort needs a float64 buffer, got {typecode_of(buf)!r}")
+    n = len(buf)
+    if n <= 1:
+        return a
+    start = start_timer()
+
+    u = memoryview(buf).cast('B').cast('Q')
+    if bits is None:
+        bits = 16 if n >= 1 << 16 else 8
+    mask = (1 << bits) - 1
+    shifts = range(0, 64, bits)
+    counts = [[0] * (mask + 1) for _ in shifts]
+
+    # Flip to order-preserving keys in place, histogramming every digit at once
+    for i in range(n):
+        v = u[i]
+        if v & _SIGN:
+            # Negative numbers reverse; a negative NaN keeps its bits, which
+            # is already the key of the matching positive NaN
+            k = v if v & ~_SIGN > 0x7FF0000000000000 else v ^ _MASK64
+        else:
+            k = v ^ _SIGN
+        u[i] = k
+        for c, shift in zip(counts, shifts):
+            c[(k >> shift) & mask] += 1
+
+    src, dst = u, memoryview(array('Q', bytes(8 * n)))
+    for count, shift in zip(counts, shifts):
+        if max(count) == n:  # every key has the same digit
+            continue
+        total = 0
+        for d in range(mask + 1):
+            count[d], total = total, total + count[d]
+        for k in src:
+            d = (k >> shift) & mask
+            pos = count[d]
+            dst[pos] = k
+            count[d] = pos + 1
+        src, dst = dst, src
+    if src is not u:
+        u[:] = src
+
+    # Flip back to IEEE bit patterns
+    for i in range(n):
+        k = u[i]
+        u[i] = k ^ _SIGN if k & _SIGN else k ^ _MASK64
+
+    stop_timer("radix_sort_float", start, n)
+    if packed:
+        a[:] = buf.tolist()
+    return a
+
+def float_order_keys(values) -> array:
+    """uint64 keys whose unsigned order is the IEEE totalOrder radix_sort_float sorts by"""
+    u = memoryview(array('d', values)).cast('B').cast('Q')
+    keys = array('Q', bytes(8 * len(u)))
+    for i, v in enumerate(u):
+        # The same flip as radix_sort_float, NaNs of either sign last
+        if v & _SIGN:
+            keys[i] = v if v & ~_SIGN > 0x7FF0000000000000 else v ^ _MASK64
+        else:
+            keys[i] = v ^ _SIGN
+    return keys
+
+def sort_orders_by_id(orders: List[Dict], key: str = "order_id", base: int = RADIX_BASE) -> List[Dict]:
     if not orders:
         return orders
     keys = [o[key] for o in orders]
@@ -86,12 +189,11 @@ def sort_orders_by_id(orders: List[Dict], key: str = "order_id", base: int = 10)
 
     max_key = max(keys) if keys else 0
     exp = 1
-    start = time.perf_counter()
+    start = start_timer()
     while max_key // exp > 0:
         stable_pass_with_companion(keys, indx, exp, base)
         exp *= base
-    end = time.perf_counter()
-    print(f"[Radix] order sort in {end - start:.6f} sec for {len(orders)} records")
+    stop_timer("sort_orders_by_id", start, len(orders))
 
     sorted_orders = [orders[i] for i in indx]
     return sorted_orders
@@ -99,6 +201,36 @@ def sort_orders_by_id(orders: List[Dict], key: str = "order_id", base: int = 10)
 
 
 
+def radix_argsort(keys: List[int], idx: Optional[array] = None, base: int = 256) -> array:
+    # Stable LSD passes over the index buffer; negative keys are offset by min
+    n = len(keys)
+    idx = result = index_buffer(n, idx)
+    if n <= 1:
+        return idx
+
+    min_key = min(keys)
+    span = max(keys) - min_key
+    out = array('q', bytes(8 * n))
+    exp = 1
+    while span // exp > 0:
+        digits = [((keys[i] - min_key) // exp) % base for i in idx]
+        count = [0] * base
+        for d in digits:
+            count[d] += 1
+        total = 0
+        for d in range(base):
+            count[d], total = total, total + count[d]
+        for i, d in zip(idx, digits):
+            out[count[d]] = i
+            count[d] += 1
+        idx, out = out, idx
+        exp *= base
+
+    if idx is not result:
+        result[:] = idx
+    return result
+
+
 #Demo
 if __name__ == "__main__":
     data = [170, -7, 35, 802, 24, -100, 2, 66, 0, -1]
@@ -133,4 +265,7 @@ if __name__ == "__main__":
     assert [(o["order_id"], o["line_item"]) for o in sorted_orders] == \
         [(o["order_id"], o["line_item"]) for o in expected], "Stability/correctness mismatch"
     
-    print("\n[CHECK] Radix record-sort matches Python's stable sort.")
\ No newline at end of file
+    print("\n[CHECK] Radix record-sort matches Python's stable sort.")
+
+    latencies = [12.5, -0.0, 0.25, float("nan"), 0.0, -1.5, 3.75]
+    print("\nFloat radix sort:", radix_sort_float(latencies))
\ No newline at end of file
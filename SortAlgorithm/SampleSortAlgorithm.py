@@ -0,0 +1,108 @@
+from bisect import bisect_right
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, List, Optional
+from SortAlgorithm.MergeSortAlgorithm import merge_sort
+from SortAlgorithm.Metrics import start_timer, stop_timer
+from SortAlgorithm.QuickSortAlogirthm import quick_sort
+import os
+import random
+import time
+
+# Below this many elements per worker a single quick_sort is faster
+MIN_BUCKET = 1 << 12
+
+# Sample size per bucket; more samples give more even buckets
+OVERSAMPLE = 32
+
+BUCKET_SORTS = {
+    "quick": quick_sort,
+    "merge": merge_sort,
+}
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+def _sort_bucket(job) -> List[Any]:
+    # Runs in a worker: the bucket arrives pickled and goes back the same way
+    bucket, algorithm = job
+    return BUCKET_SORTS[algorithm](bucket)
+
+def choose_splitters(arr: List[Any], p: int, rng: random.Random,
+                     oversample: int = OVERSAMPLE) -> List[Any]:
+    # p - 1 splitters taken evenly from a sorted random sample
+    sample = quick_sort(rng.sample(arr, min(len(arr), p * oversample)))
+    step = len(sample) / p
+    return [sample[int(step * i)] for i in range(1, p)]
+
+def sample_sort(arr: List[Any], workers: Optional[int] = None, algorithm: str = "quick",
+                seed: Optional[int] = None, executor: Optional[Executor] = None) -> List[Any]:
+    # Sorts arr in place by partitioning into one bucket per worker
+    n = len(arr)
+    workers = workers or default_workers()
+    if algorithm not in BUCKET_SORTS:
+        raise ValueError(f"unknown bucket sort {algorithm!r}, expected one of {list(BUCKET_SORTS)}")
+    p = min(workers, n // MIN_BUCKET)
+    if p <= 1:
+        result = BUCKET_SORTS[algorithm](arr)
+        if result is not arr:
+            arr[:] = result
+        return arr
+    start = start_timer()
+
+    splitters = choose_splitters(arr, p, random.Random(seed))
+
+    # One partitioning pass; keys equal to a splitter land in the same bucket
+    buckets = [[] for _ in range(p)]
+    appends = [b.append for b in buckets]
+    for x in arr:
+        appends[bisect_right(splitters, x)](x)
+
+    own_pool = executor is None
+    pool = ProcessPoolExecutor(p) if own_pool else executor
+    try:
+        # Buckets are already in key order, so concatenation needs no merge
+        pos = 0
+        for bucket in pool.map(_sort_bucket, [(b, algorithm) for b in buckets]):
+            arr[pos:pos + len(bucket)] = bucket
+            pos += len(bucket)
+    finally:
+        if own_pool:
+            pool.shutdown()
+
+    stop_timer("sample_sort", start, n)
+    return arr
+
+def benchmark(n: int = 1 << 18, workers: Optional[int] = None, repeats: int = 3,
+              seed: int = 0) -> dict:
+    # Best-of-repeats wall time of sample_sort against single-core quick_sort
+    workers = workers or default_workers()
+    rng = random.Random(seed)
+    data = [rng.random() for _ in range(n)]
+    results = {"n": n, "workers": workers}
+    with ProcessPoolExecutor(workers) as pool:
+        for name, run in (
+            ("quick_sort", lambda a: quick_sort(a)),
+            ("sample_sort", lambda a: sample_sort(a, workers, seed=seed, executor=pool)),
+        ):
+            best = float("inf")
+            for _ in range(repeats):
+                a = list(data)
+                t0 = time.perf_counter()
+                run(a)
+                best = min(best, time.perf_counter() - t0)
+            results[name] = best
+    results["speedup"] = results["quick_sort"] / results["sample_sort"]
+    return results
+
+
+#Demo
+if __name__ == "__main__":
+    rng = random.Random(1)
+    words = ["%x" % rng.getrandbits(40) for _ in range(MIN_BUCKET * 4)]
+    expected = sorted(words)
+    assert sample_sort(words, workers=4) == expected
+    print("[CHECK] Sample sort matches Python's sort.")
+
+    r = benchmark()
+    print(f"n={r['n']} workers={r['workers']}: quick_sort {r['quick_sort']:.3f}s, "
+          f"sample_sort {r['sample_sort']:.3f}s, speedup x{r['speedup']:.2f}")
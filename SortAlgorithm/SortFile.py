@@ -0,0 +1,225 @@
+"""
+Sort fixed-width binary files through mmap
+
+    python -m SortAlgorithm.SortFile keys.i64
+    python -m SortAlgorithm.SortFile prices.f64 --dtype float64 --algorithm heap
+    python -m SortAlgorithm.SortFile orders.bin --dtype record --record-size 32 \\
+        --key-offset 8 --key-type int64 --output orders.sorted.bin
+
+Files hold native-endian int64 or float64 values, or fixed-size records
+with one numeric key at a fixed offset. Keys are sorted in place through
+a memoryview cast of the mapping, so no Python list is built and the data
+itself only occupies page cache. Records are sorted by argsorting their
+key column and then moving whole records along permutation cycles.
+With --output the file is copied and the copy is sorted, leaving the
+original untouched.
+"""
+import argparse
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Callable, Dict, List, Optional
+
+from SortAlgorithm.HeapSortAlgorithm import heap_argsort, heap_sort
+from SortAlgorithm.InsertionAlgorithm import insertion_sort
+from SortAlgorithm.MergeSortAlgorithm import merge_argsort, merge_sort
+from SortAlgorithm.Metrics import start_timer, stop_timer
+from SortAlgorithm.QuickSortAlogirthm import intro_sort, quick_argsort, quick_sort
+from SortAlgorithm.RadixAlgorithm import float_order_keys, radix_argsort, radix_sort_float, radix_sort_lsd
+
+DTYPES = {"int64": "q", "uint64": "Q", "float64": "d"}
+
+# In-place sorts for key files; merge needs one scratch copy of the keys
+KEY_SORTS: Dict[str, Callable] = {
+    "intro": intro_sort,
+    "quick": quick_sort,
+    "heap": heap_sort,
+    "merge": merge_sort,
+    "insertion": insertion_sort,
+    "radix": None,  # chosen by dtype below
+}
+
+# Argsorts for record files; intro and insertion only sort keys in place
+RECORD_SORTS: Dict[str, Callable] = {
+    "quick": quick_argsort,
+    "heap": heap_argsort,
+    "merge": merge_argsort,
+    "radix": radix_argsort,
+}
+
+
+def _key_sort(algorithm: str, typecode: str) -> Callable:
+    if algorithm not in KEY_SORTS:
+        raise ValueError(f"unknown algorithm {algorithm!r}, expected one of {list(KEY_SORTS)}")
+    if algorithm == "radix":
+        return radix_sort_float if typecode == "d" else lambda v: radix_sort_lsd(v, 256)
+    return KEY_SORTS[algorithm]
+
+
+def _record_sort(algorithm: str, typecode: str) -> Callable:
+    if algorithm not in RECORD_SORTS:
+        what = "only sorts key files" if algorithm in KEY_SORTS else "is unknown"
+        raise ValueError(f"algorithm {algorithm!r} {what}; record files take one of {list(RECORD_SORTS)}")
+    if algorithm == "radix" and typecode == "d":
+        # radix_argsort only takes integers; float keys go through their bit patterns
+        return lambda keys: radix_argsort(float_order_keys(keys))
+    return RECORD_SORTS[algorithm]
+
+
+def _same_file(path: str, output: str) -> bool:
+    return os.path.realpath(output) == os.path.realpath(path)
+
+
+def _prepare(path: str, output: Optional[str]) -> str:
+    """Return the file to sort in place, copying to output first if given"""
+    if output is None or _same_file(path, output):
+        return path
+    shutil.copyfile(path, output)
+    return output
+
+
+def sort_keys_file(path: str, dtype: str = "int64", algorithm: str = "intro",
+                   output: Optional[str] = None) -> int:
+    """Sort a file of packed int64/uint64/float64 values; returns the element count"""
+    if dtype not in DTYPES:
+        raise ValueError(f"unknown dtype {dtype!r}, expected one of {list(DTYPES)}")
+    typecode = DTYPES[dtype]
+    sort = _key_sort(algorithm, typecode)
+    target = _prepare(path, output)
+
+    size = os.path.getsize(target)
+    if size % 8:
+        raise ValueError(f"{target}: size {size} is not a multiple of 8 bytes")
+    n = size // 8
+    if n < 2:
+        return n
+
+    start = start_timer()
+    with open(target, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+        with memoryview(mm) as raw, raw.cast(typecode) as view:
+            sort(view)
+        mm.flush()
+    stop_timer(f"sortfile_{algorithm}", start, n)
+    return n
+
+
+def _permute_records(mm: mmap.mmap, perm: array, size: int) -> None:
+    """Move fixed-size records in place so that slot i receives old record perm[i]"""
+    done = bytearray(len(perm))
+    for start in range(len(perm)):
+        if done[start] or perm[start] == start:
+            continue
+        saved = mm[start * size:(start + 1) * size]
+        j = start
+        while True:
+            done[j] = 1
+            k = perm[j]
+            if k == start:
+                mm[j * size:(j + 1) * size] = saved
+                break
+            mm[j * size:(j + 1) * size] = mm[k * size:(k + 1) * size]
+            j = k
+
+
+def sort_records_file(path: str, record_size: int, key_offset: int = 0,
+                      key_type: str = "int64", algorithm: str = "merge",
+                      output: Optional[str] = None) -> int:
+    """Sort fixed-size records by a numeric key field; returns the record count"""
+    if key_type not in DTYPES:
+        raise ValueError(f"unknown key type {key_type!r}, expected one of {list(DTYPES)}")
+    if not 0 <= key_offset <= record_size - 8:
+        raise ValueError(f"key at offset {key_offset} does not fit a {record_size}-byte record")
+    typecode = DTYPES[key_type]
+    argsort = _record_sort(algorithm, typecode)
+    if output is not None and _same_file(path, output):
+        output = None  # sorting a file onto itself is the in-place sort
+
+    size = os.path.getsize(path)
+    if size % record_size:
+        raise ValueError(f"{path}: size {size} is not a multiple of {record_size}-byte records")
+    n = size // record_size
+    if n < 2:
+        _prepare(path, output)
+        return n
+
+    start = start_timer()
+    with open(path, "r+b" if output is None else "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if output is None else mmap.ACCESS_READ) as src:
+        # The key column is the only thing copied out of the mapping
+        key_struct = struct.Struct("=" + typecode)
+        keys = array(typecode, bytes(8 * n))
+        for i in range(n):
+            keys[i] = key_struct.unpack_from(src, i * record_size + key_offset)[0]
+        perm = argsort(keys)
+        del keys
+
+        if output is None:
+            _permute_records(src, perm, record_size)
+            src.flush()
+        else:
+            # Out of place: stream records into a new mapped file in sorted order,
+            # renamed over output only once it is complete
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output)),
+                                       suffix=".tmp")
+            try:
+                with open(fd, "w+b") as out_f:
+                    out_f.truncate(size)
+                    with mmap.mmap(out_f.fileno(), 0) as dst:
+                        for i, p in enumerate(perm):
+                            dst[i * record_size:(i + 1) * record_size] = \
+                                src[p * record_size:(p + 1) * record_size]
+                        dst.flush()
+                shutil.copymode(path, tmp)  # mkstemp creates the file 0600
+                os.replace(tmp, output)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+    stop_timer(f"sortfile_records_{algorithm}", start, n)
+    return n
+
+
+def sortfile(path: str, dtype: str = "int64", algorithm: Optional[str] = None,
+             output: Optional[str] = None, record_size: Optional[int] = None,
+             key_offset: int = 0, key_type: str = "int64") -> int:
+    """
+    Sort a binary file in place (or into output); dtype 'record' needs record_size
+
+    algorithm defaults to intro for key files and merge for record files.
+    """
+    if dtype == "record":
+        if not record_size:
+            raise ValueError("record files need a record size")
+        return sort_records_file(path, record_size, key_offset, key_type, algorithm or "merge", output)
+    return sort_keys_file(path, dtype, algorithm or "intro", output)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m SortAlgorithm.SortFile",
+                                     description="Sort a fixed-width binary file through mmap")
+    parser.add_argument("path")
+    parser.add_argument("--dtype", choices=[*DTYPES, "record"], default="int64")
+    parser.add_argument("--algorithm", choices=list(KEY_SORTS),
+                        help="default intro for key files, merge for record files")
+    parser.add_argument("--output", help="write the sorted data to a new file instead")
+    parser.add_argument("--record-size", type=int, help="bytes per record (dtype record)")
+    parser.add_argument("--key-offset", type=int, default=0, help="byte offset of the key in a record")
+    parser.add_argument("--key-type", choices=list(DTYPES), default="int64")
+    args = parser.parse_args(argv)
+
+    try:
+        n = sortfile(args.path, args.dtype, args.algorithm, args.output,
+                     args.record_size, args.key_offset, args.key_type)
+    except (OSError, ValueError) as e:
+        print(f"sortfile: {e}", file=sys.stderr)
+        return 1
+    print(f"sorted {n} {'records' if args.dtype == 'record' else 'values'} in "
+          f"{args.output or args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
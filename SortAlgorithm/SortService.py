@@ -0,0 +1,476 @@
+"""
+Local asyncio sort service
+
+    python -m SortAlgorithm.SortService serve [--port 8765 | --unix /tmp/sort.sock]
+    python -m SortAlgorithm.SortService bench [--port 8765 | --unix ...] [-c 32] [-r 2000]
+
+Clients send binary frames: a fixed header followed by packed native
+int64 or float64 values, and get the same kind of frame back, so nothing
+is JSON-encoded on the hot path.
+
+    request  = HEADER(op, dtype, flags, count, param) + count * 8 bytes
+    response = HEADER(status, dtype, 0, count, 0.0) + count * 8 bytes
+               (status != 0: the payload is a UTF-8 error message)
+
+Ops are SORT, SELECT (param = k), PERCENTILE (param = 0..100),
+TOP_K (param = k, FLAG_REVERSE for the largest) and STATS, which returns
+a JSON document. Requests of up to SMALL_REQUEST values are collected for
+BATCH_WINDOW_MS and sent to the process pool as one job; larger ones are
+sent alone. Each connection may pipeline up to PIPELINE_DEPTH requests,
+and a shared byte budget stops reading from sockets while too much data
+is in flight, so slow workers push back on clients through TCP.
+
+The server only binds to loopback addresses or a Unix socket.
+"""
+import argparse
+import asyncio
+import heapq
+import json
+import math
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from SortAlgorithm.Metrics import MetricsRegistry
+from SortAlgorithm.QuickSelectAlgorithm import arg_quick_select
+from SortAlgorithm.RadixAlgorithm import radix_sort_float, radix_sort_lsd
+
+HEADER = struct.Struct("=BBHId")
+
+OP_SORT, OP_SELECT, OP_PERCENTILE, OP_TOP_K, OP_STATS = range(1, 6)
+OP_NAMES = {OP_SORT: "sort", OP_SELECT: "select", OP_PERCENTILE: "percentile",
+            OP_TOP_K: "top_k", OP_STATS: "stats"}
+
+DTYPE_INT64, DTYPE_FLOAT64, DTYPE_JSON = 0, 1, 255
+TYPECODES = {DTYPE_INT64: "q", DTYPE_FLOAT64: "d"}
+
+FLAG_REVERSE = 1
+
+STATUS_OK, STATUS_ERROR, STATUS_BUSY = 0, 1, 2
+
+SMALL_REQUEST = 4096
+BATCH_WINDOW_MS = 2.0
+BATCH_MAX = 64
+PIPELINE_DEPTH = 16
+MAX_REQUEST_VALUES = 1 << 24
+MAX_INFLIGHT_BYTES = 256 << 20
+
+LOOPBACK = ("127.0.0.1", "::1", "localhost")
+
+
+# --- worker side --------------------------------------------------------
+
+def _values(dtype: int, payload: bytes) -> array:
+    values = array(TYPECODES[dtype])
+    values.frombytes(payload)
+    return values
+
+
+def _select(values: array, k: int):
+    # Shuffled start order keeps quick select linear on sorted inputs
+    order = array('q', range(len(values)))
+    random.shuffle(order)
+    return values[arg_quick_select(values, k, order)]
+
+
+def run_job(job: Tuple[int, int, int, float, bytes]) -> Tuple[int, int, bytes]:
+    """Execute one request; returns (status, dtype, payload)"""
+    op, dtype, flags, param, payload = job
+    try:
+        if dtype not in TYPECODES:
+            raise ValueError(f"unknown dtype {dtype}")
+        values = _values(dtype, payload)
+        n = len(values)
+        if op == OP_SORT:
+            if dtype == DTYPE_FLOAT64:
+                radix_sort_float(values)
+            else:
+                radix_sort_lsd(values, 256)
+            if flags & FLAG_REVERSE:
+                values.reverse()
+            return STATUS_OK, dtype, values.tobytes()
+        if op in (OP_SELECT, OP_PERCENTILE):
+            if n == 0:
+                raise ValueError("cannot select from an empty payload")
+            if op == OP_PERCENTILE:
+                if not 0 <= param <= 100:
+                    raise ValueError(f"percentile {param} outside 0..100")
+                k = max(0, math.ceil(param / 100 * n) - 1)  # nearest rank
+            else:
+                k = int(param)
+                if not 0 <= k < n:
+                    raise ValueError(f"k={k} out of range for {n} values")
+            return STATUS_OK, dtype, array(values.typecode, [_select(values, k)]).tobytes()
+        if op == OP_TOP_K:
+            pick = heapq.nlargest if flags & FLAG_REVERSE else heapq.nsmallest
+            return STATUS_OK, dtype, array(values.typecode, pick(int(param), values)).tobytes()
+        raise ValueError(f"unknown op {op}")
+    except (ValueError, IndexError, OverflowError) as e:
+        return STATUS_ERROR, dtype, str(e).encode()
+
+
+def run_batch(jobs: List[Tuple]) -> List[Tuple[int, int, bytes]]:
+    """Execute many small requests in one worker dispatch"""
+    return [run_job(job) for job in jobs]
+
+
+# --- server side --------------------------------------------------------
+
+class ByteBudget:
+    """Async counter of payload bytes in flight; acquire waits while over the limit"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self, n: int) -> None:
+        async with self._cond:
+            # A request larger than the whole budget runs once the server is idle
+            await self._cond.wait_for(lambda: self.used == 0 or self.used + n <= self.limit)
+            self.used += n
+
+    async def release(self, n: int) -> None:
+        async with self._cond:
+            self.used -= n
+            self._cond.notify_all()
+
+
+class SortService:
+    """asyncio server that batches small requests and offloads work to processes"""
+
+    def __init__(self, workers: Optional[int] = None, batch_window_ms: float = BATCH_WINDOW_MS,
+                 small_request: int = SMALL_REQUEST, max_inflight_bytes: int = MAX_INFLIGHT_BYTES):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_window = batch_window_ms / 1000
+        self.small_request = small_request
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.budget = ByteBudget(max_inflight_bytes)
+        self.metrics = MetricsRegistry()
+        self.pending: List[Tuple[Tuple, asyncio.Future]] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.started = time.monotonic()
+        self.requests = 0
+        self.elements = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.connections = 0
+        self.pool_restarts = 0
+
+    # dispatch
+
+    def _submit(self, fn, arg) -> asyncio.Future:
+        """Run fn(arg) on the pool, replacing the pool if a dead worker broke it"""
+        loop = asyncio.get_running_loop()
+        try:
+            return loop.run_in_executor(self.pool, fn, arg)
+        except BrokenProcessPool:
+            # Jobs already on the broken pool fail on their own; new ones get a fresh pool
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = ProcessPoolExecutor(self.workers)
+            self.pool_restarts += 1
+            return loop.run_in_executor(self.pool, fn, arg)
+
+    async def execute(self, job: Tuple) -> Tuple[int, int, bytes]:
+        """Run a job on the pool, batching it with other small jobs"""
+        loop = asyncio.get_running_loop()
+        if len(job[4]) // 8 > self.small_request:
+            return await self._submit(run_job, job)
+        fut = loop.create_future()
+        self.pending.append((job, fut))
+        if len(self.pending) >= BATCH_MAX:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.batch_window, self.flush)
+        return await fut
+
+    def flush(self) -> None:
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        self.batches += 1
+        self.batched_requests += len(batch)
+        task = self._submit(run_batch, [job for job, _ in batch])
+        task.add_done_callback(lambda t: self._resolve(batch, t))
+
+    @staticmethod
+    def _resolve(batch, task) -> None:
+        for i, (_, fut) in enumerate(batch):
+            if fut.cancelled():
+                continue
+            if task.cancelled():
+                fut.cancel()
+            elif task.exception() is not None:
+                fut.set_exception(task.exception())
+            else:
+                fut.set_result(task.result()[i])
+
+    # metrics
+
+    def stats(self) -> Dict:
+        uptime = time.monotonic() - self.started
+        return {
+            "uptime_s": uptime,
+            "requests": self.requests,
+            "elements": self.elements,
+            "requests_per_s": self.requests / uptime if uptime else 0.0,
+            "elements_per_s": self.elements / uptime if uptime else 0.0,
+            "batches": self.batches,
+            "mean_batch": self.batched_requests / self.batches if self.batches else 0.0,
+            "inflight_bytes": self.budget.used,
+            "connections": self.connections,
+            "workers": self.workers,
+            "pool_restarts": self.pool_restarts,
+            "latency": self.metrics.snapshot(),
+        }
+
+    # connections
+
+    async def _handle(self, op: int, dtype: int, flags: int, param: float,
+                      payload: bytes) -> Tuple[int, int, bytes]:
+        start = time.perf_counter_ns()
+        try:
+            if op == OP_STATS:
+                result = STATUS_OK, DTYPE_JSON, json.dumps(self.stats()).encode()
+            else:
+                result = await self.execute((op, dtype, flags, param, payload))
+        finally:
+            await self.budget.release(len(payload))
+        n = len(payload) // 8
+        self.requests += 1
+        self.elements += n
+        self.metrics(OP_NAMES.get(op, "unknown"), time.perf_counter_ns() - start, n)
+        return result
+
+    async def _write_responses(self, queue: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        # Responses leave in request order even though jobs finish out of order
+        connected = True
+        while True:
+            task = await queue.get()
+            if task is None:
+                return
+            if not connected:
+                task.cancel()  # the client is gone and nobody reads this answer
+                continue
+            try:
+                status, dtype, payload = await task
+            except Exception as e:  # a worker crashed; report it on this request
+                status, dtype, payload = STATUS_ERROR, DTYPE_JSON, repr(e).encode()
+            count = len(payload) // 8 if status == STATUS_OK and dtype != DTYPE_JSON else len(payload)
+            try:
+                writer.write(HEADER.pack(status, dtype, 0, count, 0.0))
+                writer.write(payload)
+                await writer.drain()
+            except ConnectionError:
+                # Keep draining the queue so the read loop never blocks on a full one
+                connected = False
+
+    @staticmethod
+    async def _enqueue(queue: asyncio.Queue, item, responder: asyncio.Task) -> bool:
+        """Put item on the response queue unless the responder has stopped"""
+        put = asyncio.ensure_future(queue.put(item))
+        await asyncio.wait((put, responder), return_when=asyncio.FIRST_COMPLETED)
+        if put.done():
+            return True
+        put.cancel()
+        if isinstance(item, asyncio.Task):
+            item.cancel()
+        return False
+
+    async def serve_connection(self, reader: asyncio.StreamReader,
+                               writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        queue: asyncio.Queue = asyncio.Queue(PIPELINE_DEPTH)
+        responder = asyncio.create_task(self._write_responses(queue, writer))
+        try:
+            while not responder.done():
+                try:
+                    header = await reader.readexactly(HEADER.size)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                op, dtype, flags, count, param = HEADER.unpack(header)
+                if count > MAX_REQUEST_VALUES:
+                    done = asyncio.get_running_loop().create_future()
+                    done.set_result((STATUS_BUSY, dtype, f"request of {count} values is too large".encode()))
+                    await self._enqueue(queue, done, responder)
+                    break
+                # Waiting here stops reading the socket, which pushes back on the client
+                await self.budget.acquire(count * 8)
+                try:
+                    payload = await reader.readexactly(count * 8)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    await self.budget.release(count * 8)
+                    break
+                task = asyncio.create_task(self._handle(op, dtype, flags, param, payload))
+                if not await self._enqueue(queue, task, responder):
+                    break
+            if await self._enqueue(queue, None, responder):
+                await responder
+        except asyncio.CancelledError:
+            # Server shutdown: drop unanswered requests with the connection
+            responder.cancel()
+        finally:
+            if not responder.done():
+                responder.cancel()
+            writer.close()
+            self.connections -= 1
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765,
+                    unix: Optional[str] = None) -> asyncio.AbstractServer:
+        if unix is None and host not in LOOPBACK:
+            raise ValueError(f"refusing to bind {host!r}: the sort service is local only")
+        self.pool = ProcessPoolExecutor(self.workers)
+        if unix is not None:
+            return await asyncio.start_unix_server(self.serve_connection, path=unix)
+        return await asyncio.start_server(self.serve_connection, host, port)
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+
+# --- client -------------------------------------------------------------
+
+class SortClient:
+    """Pipelining client for SortService; one request at a time per call"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 8765,
+                      unix: Optional[str] = None) -> "SortClient":
+        if unix is not None:
+            return cls(*await asyncio.open_unix_connection(unix))
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(self, op: int, values: Sequence = (), dtype: Optional[int] = None,
+                      flags: int = 0, param: float = 0.0):
+        if dtype is None:
+            dtype = DTYPE_FLOAT64 if any(isinstance(v, float) for v in values) else DTYPE_INT64
+        payload = values.tobytes() if isinstance(values, array) else \
+            array(TYPECODES[dtype], values).tobytes()
+        async with self._lock:
+            self.writer.write(HEADER.pack(op, dtype, flags, len(payload) // 8, param) + payload)
+            await self.writer.drain()
+            status, rdtype, _, count, _ = HEADER.unpack(await self.reader.readexactly(HEADER.size))
+            body = await self.reader.readexactly(
+                count if status != STATUS_OK or rdtype == DTYPE_JSON else count * 8)
+        if status != STATUS_OK:
+            raise RuntimeError(body.decode(errors="replace"))
+        return json.loads(body) if rdtype == DTYPE_JSON else _values(rdtype, body)
+
+    async def sort(self, values: Sequence, reverse: bool = False) -> array:
+        return await self.request(OP_SORT, values, flags=FLAG_REVERSE if reverse else 0)
+
+    async def select(self, values: Sequence, k: int):
+        return (await self.request(OP_SELECT, values, param=k))[0]
+
+    async def percentile(self, values: Sequence, q: float):
+        return (await self.request(OP_PERCENTILE, values, param=q))[0]
+
+    async def top_k(self, values: Sequence, k: int, largest: bool = False) -> array:
+        return await self.request(OP_TOP_K, values, flags=FLAG_REVERSE if largest else 0, param=k)
+
+    async def stats(self) -> Dict:
+        return await self.request(OP_STATS, dtype=DTYPE_INT64)
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def load_test(host: str = "127.0.0.1", port: int = 8765, unix: Optional[str] = None,
+                    clients: int = 32, requests: int = 2000, size: int = 256,
+                    seed: int = 0) -> Dict:
+    """Drive the service with concurrent clients; returns throughput and server stats"""
+    rng = random.Random(seed)
+    payloads = [array('q', (rng.randrange(-1 << 40, 1 << 40) for _ in range(size)))
+                for _ in range(16)]
+    conns = [await SortClient.connect(host, port, unix) for _ in range(clients)]
+    latencies: List[float] = []
+
+    async def worker(client: SortClient, count: int) -> None:
+        for i in range(count):
+            values = payloads[i % len(payloads)]
+            t0 = time.perf_counter()
+            result = await client.sort(values)
+            latencies.append(time.perf_counter() - t0)
+            if i == 0 and list(result) != sorted(values):
+                raise AssertionError("service returned an unsorted payload")
+
+    t0 = time.perf_counter()
+    per_client = max(1, requests // clients)
+    await asyncio.gather(*(worker(c, per_client) for c in conns))
+    elapsed = time.perf_counter() - t0
+    stats = await conns[0].stats()
+    for c in conns:
+        await c.close()
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "requests_per_s": len(latencies) / elapsed,
+        "elements_per_s": len(latencies) * size / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1e3,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1e3,
+        "server": stats,
+    }
+
+
+async def _serve(args) -> None:
+    service = SortService(args.workers, args.batch_window_ms)
+    server = await service.start(args.host, args.port, args.unix)
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"sort service on {where} with {service.workers} workers", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m SortAlgorithm.SortService",
+                                     description="Local sort service and load tester")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_p = sub.add_parser("serve", help="run the service")
+    serve_p.add_argument("--workers", type=int, default=None)
+    serve_p.add_argument("--batch-window-ms", type=float, default=BATCH_WINDOW_MS)
+    bench_p = sub.add_parser("bench", help="load-test a running service")
+    bench_p.add_argument("-c", "--clients", type=int, default=32)
+    bench_p.add_argument("-r", "--requests", type=int, default=2000)
+    bench_p.add_argument("--size", type=int, default=256, help="values per request")
+    for p in (serve_p, bench_p):
+        p.add_argument("--host", default="127.0.0.1", choices=LOOPBACK)
+        p.add_argument("--port", type=int, default=8765)
+        p.add_argument("--unix", default=None, help="Unix socket path instead of TCP")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        try:
+            asyncio.run(_serve(args))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    result = asyncio.run(load_test(args.host, args.port, args.unix, args.clients,
+                                   args.requests, args.size))
+    server = result.pop("server")
+    print(json.dumps(result, indent=2))
+    print(f"server: {server['requests']} requests, mean batch {server['mean_batch']:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Machine tuning profile for the SortAlgorithm package
+
+The profile is a JSON file written by `python -m SortAlgorithm.Autotune`.
+It is read once, when this module is first imported, and algorithms bind
+their tuned defaults (cutoffs, radix base, bucket factor) at import time.
+Parameters missing from the profile keep the built-in defaults, which
+reproduce the untuned behaviour.
+"""
+import json
+import math
+import os
+from typing import Any, Dict, Optional
+
+DEFAULTS: Dict[str, Any] = {
+    "radix_base": 10,
+    "quick_sort_cutoff": 0,
+    "merge_sort_cutoff": 1,
+    "bucket_factor": 1.0,
+    "string_insertion_cutoff": 16,
+}
+
+# Lower bound of each parameter; integers may equal it, floats must exceed it.
+# Radix base 1 never terminates, base 0 divides by zero and a merge cutoff
+# of 0 recurses forever
+MINIMUMS: Dict[str, Any] = {
+    "radix_base": 2,
+    "quick_sort_cutoff": 0,
+    "merge_sort_cutoff": 1,
+    "bucket_factor": 0.0,
+    "string_insertion_cutoff": 1,
+}
+
+PROFILE_PATH = os.environ.get(
+    "SORTAPP_TUNING_PROFILE",
+    os.path.join(os.path.expanduser("~"), ".config", "sortingapp", "tuning.json"),
+)
+
+
+def _valid(name: str, value: Any) -> bool:
+    """Whether value is usable for a parameter: a number of the right kind and in range"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    if not math.isfinite(value):
+        return False
+    if isinstance(DEFAULTS[name], int) and value != int(value):
+        return False
+    if isinstance(DEFAULTS[name], float):
+        return value > MINIMUMS[name]
+    return value >= MINIMUMS[name]
+
+
+def load_profile(path: Optional[str] = None) -> Dict[str, Any]:
+    """Return the tuned parameters stored at path, ignoring unknown, mistyped or out-of-range entries"""
+    try:
+        with open(path or PROFILE_PATH) as f:
+            params = json.load(f).get("params", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+    if not isinstance(params, dict):
+        return {}
+    return {name: type(DEFAULTS[name])(value) for name, value in params.items()
+            if name in DEFAULTS and _valid(name, value)}
+
+
+def save_profile(params: Dict[str, Any], host: Dict[str, Any],
+                 measurements: Dict[str, Any], path: Optional[str] = None) -> str:
+    """Write a profile and return its path"""
+    path = path or PROFILE_PATH
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"params": params, "host": host, "measurements": measurements}, f, indent=2)
+    os.replace(tmp, path)
+    return path
+
+
+_params = {**DEFAULTS, **load_profile()}
+
+
+def tuned(name: str) -> Any:
+    """Tuned value of a parameter for this host"""
+    return _params[name]
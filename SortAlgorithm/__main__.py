@@ -0,0 +1,324 @@
+"""
+Streaming sort command for shell pipelines
+
+    python -m SortAlgorithm -n < ids.txt > sorted.txt
+    python -m SortAlgorithm -t , -k 3 -k 1 -n -r orders.csv
+    python -m SortAlgorithm -n -u --top 100 --algorithm radix big.txt
+
+Lines are read from files (or stdin, "-") in large binary chunks and are
+never decoded: lexical order is byte order, like `LC_ALL=C sort`. With
+-n, keys are parsed as numbers the way `sort -n` does, and lines whose key
+does not start with a number sort as 0. Sorting is stable; equal keys keep
+their input order. Key columns are 1-based fields split on -t.
+
+When the buffered input grows past --memory-limit, the batch is sorted
+and spilled to a temporary run file, and the runs are merged lazily with
+merge_iter at the end. Output is written in large joined blocks.
+"""
+import argparse
+import heapq
+import os
+import re
+import sys
+import tempfile
+from array import array
+from itertools import islice
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Sequence
+
+from SortAlgorithm.CountingSortAlgorithm import counting_argsort
+from SortAlgorithm.HeapSortAlgorithm import heap_argsort
+from SortAlgorithm.InsertionAlgorithm import insertion_argsort
+from SortAlgorithm.MergeSortAlgorithm import merge_argsort, merge_iter
+from SortAlgorithm.Metrics import start_timer, stop_timer
+from SortAlgorithm.Permutation import index_buffer
+from SortAlgorithm.QuickSortAlogirthm import quick_argsort
+from SortAlgorithm.RadixAlgorithm import radix_argsort
+from SortAlgorithm.StringSortAlgorithm import msd_string_argsort
+
+READ_CHUNK = 1 << 20
+WRITE_LINES = 1 << 16
+
+# Rough per-line bookkeeping cost (list slot, bytes header, key) for spilling
+LINE_OVERHEAD = 96
+
+ARGSORTS: Dict[str, Callable] = {
+    "radix": radix_argsort,
+    "msd": msd_string_argsort,
+    "merge": merge_argsort,
+    "counting": counting_argsort,
+    "insertion": insertion_argsort,
+    "quick": quick_argsort,
+    "heap": heap_argsort,
+}
+
+# These keep ties in idx order, so multi-key sorts can run one column at a time
+STABLE = frozenset({"radix", "msd", "merge", "counting", "insertion"})
+
+# Large batches use 16-bit digits: half the passes for a 64K-entry count table
+WIDE_RADIX_MIN = 1 << 16
+
+# Leading number as `sort -n` reads it: blanks, optional sign, digits, fraction
+NUMBER_RE = re.compile(rb"\s*(-?(?:\d+\.?\d*|\.\d+))")
+
+# Fields int() may parse directly; it also takes '+5' and '1_000', which sort -n does not
+INTEGER_RE = re.compile(rb"-?\d+")
+INTEGER_BYTES = b"-0123456789"
+
+
+def parse_size(text: str) -> int:
+    """'512M' -> bytes; accepts K, M and G suffixes"""
+    text = text.strip().upper()
+    scale = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}.get(text[-1:], 1)
+    return int(float(text.rstrip("KMGB") or 0) * scale)
+
+
+def iter_lines(paths: Sequence[str], chunk_size: int = READ_CHUNK) -> Iterator[List[bytes]]:
+    """Yield lists of lines (without newlines) read in chunk_size blocks"""
+    for path in paths or ["-"]:
+        f = sys.stdin.buffer if path == "-" else open(path, "rb")
+        try:
+            tail = b""
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                lines = (tail + chunk).split(b"\n")
+                tail = lines.pop()
+                if lines:
+                    yield lines
+            if tail:
+                yield [tail]
+        finally:
+            if f is not sys.stdin.buffer:
+                f.close()
+
+
+def _number(field: bytes):
+    if INTEGER_RE.fullmatch(field):
+        return int(field)
+    m = NUMBER_RE.match(field)
+    if m is None:
+        return 0
+    text = m.group(1)
+    return int(text) if text.lstrip(b"-").isdigit() else float(text)
+
+
+def numeric_column(fields: List[bytes]) -> list:
+    # All-integer columns are parsed at C speed; anything else goes field by field
+    if not b"".join(fields).translate(None, INTEGER_BYTES):
+        try:
+            return list(map(int, fields))
+        except ValueError:
+            pass
+    return list(map(_number, fields))
+
+
+class KeySpec:
+    """Which fields make up the sort key and how to read them"""
+
+    def __init__(self, columns: Sequence[int] = (), delimiter: bytes = b",",
+                 numeric: bool = False):
+        self.columns = [c - 1 for c in columns]
+        self.delimiter = delimiter
+        self.numeric = numeric
+
+    def field_columns(self, lines: List[bytes]) -> List[List[bytes]]:
+        """Raw key fields per column; missing fields read as empty"""
+        if not self.columns:
+            return [lines]
+        width = max(self.columns) + 1
+        rows = [line.split(self.delimiter, width) for line in lines]
+        return [[r[c] if c < len(r) else b"" for r in rows] for c in self.columns]
+
+    def key_columns(self, lines: List[bytes]) -> List[list]:
+        cols = self.field_columns(lines)
+        return [numeric_column(c) for c in cols] if self.numeric else cols
+
+    def line_key(self, line: bytes):
+        """Key of a single line, comparable with the column keys (for merging runs)"""
+        cols = [col[0] for col in self.field_columns([line])]
+        if self.numeric:
+            cols = [_number(c) for c in cols]
+        return cols[0] if len(cols) == 1 else tuple(cols)
+
+
+def _auto(col: list) -> str:
+    # Radix for integers, MSD for byte strings, merge sort for everything else
+    if all(type(v) is int for v in col):
+        return "radix"
+    if all(type(v) is bytes for v in col):
+        return "msd"
+    return "merge"
+
+
+def argsort_columns(cols: List[list], algorithm: str = "auto", reverse: bool = False) -> array:
+    """Stable permutation ordering rows by cols, most significant column first"""
+    n = len(cols[0])
+    perm = index_buffer(n)
+    if n <= 1:
+        return perm
+    if reverse:
+        # Stable descending: sort the reversed order ascending, then flip back
+        perm.reverse()
+
+    if algorithm == "auto" or algorithm in STABLE:
+        for col in reversed(cols):
+            name = _auto(col) if algorithm == "auto" else algorithm
+            if name in ("radix", "counting") and _auto(col) != "radix":
+                raise ValueError(f"{name} sort needs integer keys (use -n on integer columns)")
+            if name == "radix":
+                radix_argsort(col, perm, base=1 << 16 if n >= WIDE_RADIX_MIN else 1 << 8)
+            else:
+                ARGSORTS[name](col, perm)
+    else:
+        keys = cols[0] if len(cols) == 1 else list(zip(*cols))
+        ARGSORTS[algorithm](keys, perm)
+
+    if reverse:
+        perm.reverse()
+    return perm
+
+
+def sort_batch(lines: List[bytes], spec: KeySpec, algorithm: str = "auto",
+               reverse: bool = False, unique: bool = False,
+               top: Optional[int] = None) -> List[bytes]:
+    """Sort one in-memory batch of lines; unique keeps the first line of each key"""
+    n = len(lines)
+    if n == 0:
+        return lines
+    start = start_timer()
+    cols = spec.key_columns(lines)
+
+    if algorithm == "auto" and top is not None and not unique and top * 8 < n:
+        # Small top-k: a bounded heap beats sorting everything
+        key = cols[0].__getitem__ if len(cols) == 1 else (lambda i: tuple(c[i] for c in cols))
+        pick = heapq.nlargest if reverse else heapq.nsmallest
+        result = [lines[i] for i in pick(top, range(n), key=key)]
+        stop_timer("cli_top_k", start, n)
+        return result
+
+    perm = argsort_columns(cols, algorithm, reverse)
+    if unique:
+        keys = cols[0] if len(cols) == 1 else list(zip(*cols))
+        kept, last = [], object()
+        for i in perm:
+            if keys[i] != last:
+                kept.append(i)
+                last = keys[i]
+        perm = kept
+    if top is not None:
+        perm = perm[:top]
+    result = [lines[i] for i in perm]
+    stop_timer(f"cli_sort_{algorithm}", start, n)
+    return result
+
+
+def _spill(lines: List[bytes], tmpdir: Optional[str]) -> str:
+    fd, path = tempfile.mkstemp(prefix="sortrun-", suffix=".txt", dir=tmpdir)
+    with os.fdopen(fd, "wb") as f:
+        write_lines(f, lines)
+    return path
+
+
+def _read_run(path: str) -> Iterator[bytes]:
+    with open(path, "rb", buffering=READ_CHUNK) as f:
+        for line in f:
+            yield line[:-1] if line.endswith(b"\n") else line
+
+
+def _unique(lines: Iterator[bytes], key: Callable) -> Iterator[bytes]:
+    last = object()
+    for line in lines:
+        k = key(line)
+        if k != last:
+            yield line
+            last = k
+
+
+def write_lines(out: BinaryIO, lines) -> None:
+    """Write lines newline-terminated, joining WRITE_LINES at a time"""
+    it = iter(lines)
+    while True:
+        block = list(islice(it, WRITE_LINES))
+        if not block:
+            return
+        block.append(b"")
+        out.write(b"\n".join(block))
+
+
+def sort_stream(paths: Sequence[str], out: BinaryIO, spec: KeySpec,
+                algorithm: str = "auto", reverse: bool = False, unique: bool = False,
+                top: Optional[int] = None, memory_limit: int = 512 << 20,
+                chunk_size: int = READ_CHUNK, tmpdir: Optional[str] = None) -> int:
+    """Sort the lines of paths into out, spilling runs past memory_limit; returns runs spilled"""
+    batch: List[bytes] = []
+    used = 0
+    runs: List[str] = []
+    try:
+        for lines in iter_lines(paths, chunk_size):
+            batch.extend(lines)
+            used += sum(map(len, lines)) + LINE_OVERHEAD * len(lines)
+            if used > memory_limit:
+                runs.append(_spill(sort_batch(batch, spec, algorithm, reverse, unique, top), tmpdir))
+                batch, used = [], 0
+
+        last = sort_batch(batch, spec, algorithm, reverse, unique, top)
+        if not runs:
+            write_lines(out, last)
+            return 0
+
+        # Runs are in input order and merge_iter is stable, so ties stay stable
+        del batch
+        merged = merge_iter(*map(_read_run, runs), last, key=spec.line_key, reverse=reverse)
+        if unique:
+            merged = _unique(merged, spec.line_key)
+        if top is not None:
+            merged = islice(merged, top)
+        write_lines(out, merged)
+        return len(runs)
+    finally:
+        for path in runs:
+            os.remove(path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m SortAlgorithm",
+                                     description="Sort lines of numbers or CSV rows")
+    parser.add_argument("files", nargs="*", help="input files ('-' or none for stdin)")
+    parser.add_argument("-n", "--numeric", action="store_true", help="compare keys as numbers")
+    parser.add_argument("-r", "--reverse", action="store_true")
+    parser.add_argument("-u", "--unique", action="store_true", help="keep the first line of each key")
+    parser.add_argument("-k", "--key", type=int, action="append", default=[],
+                        metavar="COL", help="1-based key column; repeat for more keys")
+    parser.add_argument("-t", "--delimiter", default=",", help="column separator (default ',')")
+    parser.add_argument("--top", type=int, metavar="K", help="only output the first K lines")
+    parser.add_argument("-a", "--algorithm", choices=["auto", *ARGSORTS], default="auto")
+    parser.add_argument("-S", "--memory-limit", default="512M", help="spill runs past this size")
+    parser.add_argument("-T", "--temporary-directory", default=None)
+    parser.add_argument("-o", "--output", help="write to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    if any(c < 1 for c in args.key):
+        parser.error("key columns are 1-based")
+    if args.top is not None and args.top < 0:
+        parser.error("--top must be non-negative")
+    spec = KeySpec(args.key, args.delimiter.encode(), args.numeric)
+
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        sort_stream(args.files, out, spec, args.algorithm, args.reverse, args.unique,
+                    args.top, parse_size(args.memory_limit),
+                    tmpdir=args.temporary_directory)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"python -m SortAlgorithm: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+        else:
+            out.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
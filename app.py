@@ -3,12 +3,21 @@ Main Application Class for Sorting Algorithm Visualizer
 """
 import sys
 
+import io
+import os
 import pygame
 import random
 import time
 from config import *
 from ui_components import UIComponents
 from event_handler import EventHandler
+from SortAlgorithm.Datasets import generate
+from array_import import IncrementalParser, iter_file_chunks, iter_text_chunks
+from sorting_visualizers import GRANULARITIES, Stepper
+from console_log import ArrayPreview, ConsoleLog
+from trace_cache import RecordingList, Trace, TraceCache, content_key, typecode_of
+from background_sort import BackgroundSort
+from race_mode import Race
 
 class SortingVisualizer:
     def __init__(self):
@@ -34,12 +43,20 @@ class SortingVisualizer:
 
         # Array settings
         self.array_size = SORTING_CONFIG['DEFAULT_ARRAY_SIZE']
+        self.dataset_shape = SORTING_CONFIG['DATASET_SHAPE']
+        self.dataset_seed = SORTING_CONFIG['DATASET_SEED']
+        if self.dataset_seed is None:
+            # A fresh sequence each launch; set DATASET_SEED to replay one
+            self.dataset_seed = random.randrange(1 << 32)
         self.array = []
         self.sorting_array = []
         self.array_input_active = False
         self.array_input_text = ""
+        self.array_parser = IncrementalParser()
         self.cursor_position = 0
         self.editing_array = False
+        self.array_text_edited = False
+        self.import_job = None
 
         # Control variables
         self.sorting = False
@@ -50,8 +67,15 @@ class SortingVisualizer:
         self.done_active = False
         self.speed = SORTING_CONFIG['DEFAULT_SPEED']
         self.current_indices = []
-        self.console_messages = []
-        self.max_console_lines = SORTING_CONFIG['MAX_CONSOLE_LINES']
+        self.console = ConsoleLog(SORTING_CONFIG['CONSOLE_HISTORY'])
+        self.console_search = None  # query text while Ctrl+F search is open
+        self.step_granularity = SORTING_CONFIG['STEP_GRANULARITY']
+        self.stepper = Stepper(self.step_granularity, SORTING_CONFIG['STEP_RATE'])
+        self.trace_cache = TraceCache(SORTING_CONFIG['TRACE_CACHE_BYTES'])
+        self.race_mode = False
+        self.race_algorithms = set()
+        self.race = None
+        self.background = None
 
         # Timing variables
         self.sort_start_time = 0
@@ -100,6 +124,12 @@ class SortingVisualizer:
         # Console panel
         self.console_panel = pygame.Rect(450, 360, UI_DIMENSIONS['CONSOLE_WIDTH'],
                                         UI_DIMENSIONS['CONSOLE_HEIGHT'])
+        self.full_console_panel = self.console_panel
+
+        # Race mode: a grid of panels below the buttons, with a shorter console above it
+        self.race_console_panel = pygame.Rect(450, 360, UI_DIMENSIONS['CONSOLE_WIDTH'],
+                                              UI_DIMENSIONS['RACE_CONSOLE_HEIGHT'])
+        self.race_grid_rect = pygame.Rect(30, 480, self.width - 60, UI_DIMENSIONS['RACE_GRID_HEIGHT'])
 
         # QUIT button
         self.quit_button = pygame.Rect((self.width - 120) // 2, 680, 120, 40)
@@ -144,22 +174,21 @@ class SortingVisualizer:
 
     def generate_array(self):
         """Generate a random array for sorting"""
-        if self.array_size == 0:
-            self.array = []
-        else:
-            self.array = [random.randint(SORTING_CONFIG['MIN_VALUE'],
-                                        SORTING_CONFIG['MAX_VALUE'])
-                         for _ in range(self.array_size)]
+        # Seeded but not cached: a visualizer array is small enough to
+        # regenerate, and a new seed per click would only grow the disk cache
+        self.array = generate(self.dataset_shape, self.array_size, seed=self.dataset_seed,
+                              low=SORTING_CONFIG['MIN_VALUE'],
+                              high=SORTING_CONFIG['MAX_VALUE'], cache=False)
+        self.dataset_seed += 1
 
         self.sorting_array = self.array.copy()
-        self.array_input_text = str(self.array)[1:-1]  # Remove brackets for editing
-        self.cursor_position = len(self.array_input_text)
+        self.sync_input_text()
         self.sorted = False
         self.sorting = False
         self.paused = False
         self.started = False
         self.current_indices = []
-        self.console_messages = []
+        self.console.clear()
         self.array_scroll_offset = 0
         self.sort_start_time = 0
         self.total_pause_duration = 0
@@ -168,51 +197,116 @@ class SortingVisualizer:
         algo_name = self.selected_algorithm.replace(" Sort", "")
         self.add_console_message(f"sortingapp$ running [{algo_name}] sort...")
         self.add_console_message(f"sortingapp$ utilizing array of size {self.array_size}")
-        self.add_console_message(f"sortingapp$ Original array: {self.array}")
+        self.add_console_message("sortingapp$ Original array: ", self.array_preview(self.array))
+
+    def sync_input_text(self):
+        """Rebuild the editable text (without brackets) from the current array"""
+        self.array_parser.load_values(self.array)
+        self.array_input_text = self.array_parser.text
+        self.cursor_position = len(self.array_input_text)
+        self.array_text_edited = False
 
     def update_array_from_text(self):
         """Update array from user input text"""
+        # Tokens were parsed as they were typed; only clamping is left
+        low, high = SORTING_CONFIG['MIN_VALUE'], SORTING_CONFIG['MAX_VALUE']
+        elements = [low if v < low else high if v > high else v
+                    for v in self.array_parser.numbers()]
+        invalid = self.array_parser.invalid
+
+        # Limit to max array size; only file imports may go beyond it
+        if self.array_text_edited and len(elements) > SORTING_CONFIG['MAX_ARRAY_SIZE']:
+            elements = elements[:SORTING_CONFIG['MAX_ARRAY_SIZE']]
+            # Update text to reflect truncation
+            self.array = elements
+            self.sync_input_text()
+
+        self.set_array(elements)
+        if invalid:
+            self.add_console_message(f"sortingapp$ ignored {invalid} invalid entries")
+
+    def set_array(self, elements):
+        """Replace the array and refresh the dependent state and console"""
+        self.array = elements
+        self.array_size = len(elements)
+
+        # Update other components
+        self.sorting_array = self.array.copy()
+        self.input_text = str(self.array_size)  # Update element count
+
+        # Update console
+        self.console.clear()
+        algo_name = self.selected_algorithm.replace(" Sort", "")
+        self.add_console_message(f"sortingapp$ running [{algo_name}] sort...")
+        self.add_console_message(f"sortingapp$ utilizing array of size {self.array_size}")
+        self.add_console_message("sortingapp$ Original array: ", self.array_preview(self.array))
+
+    def import_array_file(self, path):
+        """Start a chunked import of a CSV, text or packed binary file"""
+        if self.started:
+            self.add_console_message("sortingapp$ reset before importing a new array")
+            return
+        chunks = iter_file_chunks(path, SORTING_CONFIG['IMPORT_CHUNK_BYTES'])
+        self.import_job = self._import_chunks(chunks, os.path.basename(path))
+
+    def import_clipboard(self):
+        """Start a chunked import of numbers pasted from the clipboard"""
+        text = self._read_clipboard()
+        if not text or self.started:
+            return
+        chunks = iter_text_chunks(io.StringIO(text), SORTING_CONFIG['IMPORT_CHUNK_BYTES'])
+        self.import_job = self._import_chunks(chunks, "clipboard")
+
+    def _import_chunks(self, chunks, source):
+        """Generator that accumulates parsed chunks, yielding between them"""
+        self.add_console_message(f"sortingapp$ importing array from {source}...")
+        low, high = SORTING_CONFIG['MIN_VALUE'], SORTING_CONFIG['MAX_VALUE']
+        limit = SORTING_CONFIG['MAX_IMPORT_SIZE']
+        elements = []
         try:
-            # Parse the input text
-            if not self.array_input_text.strip():
-                self.array = []
-                self.array_size = 0
-            else:
-                # Split by comma and convert to integers
-                elements = []
-                for item in self.array_input_text.split(','):
-                    item = item.strip()
-                    if item:
-                        value = int(item)
-                        # Clamp value to valid range
-                        value = max(SORTING_CONFIG['MIN_VALUE'],
-                                    min(SORTING_CONFIG['MAX_VALUE'], value))
-                        elements.append(value)
-
-                # Limit to max array size
-                if len(elements) > SORTING_CONFIG['MAX_ARRAY_SIZE']:
-                    elements = elements[:SORTING_CONFIG['MAX_ARRAY_SIZE']]
-                    # Update text to reflect truncation
-                    self.array_input_text = ', '.join(str(e) for e in elements)
-                    self.cursor_position = len(self.array_input_text)
-
-                self.array = elements
-                self.array_size = len(elements)
-
-            # Update other components
-            self.sorting_array = self.array.copy()
-            self.input_text = str(self.array_size)  # Update element count
-
-            # Update console
-            self.console_messages = []
-            algo_name = self.selected_algorithm.replace(" Sort", "")
-            self.add_console_message(f"sortingapp$ running [{algo_name}] sort...")
-            self.add_console_message(f"sortingapp$ utilizing array of size {self.array_size}")
-            self.add_console_message(f"sortingapp$ Original array: {self.array}")
+            for chunk in chunks:
+                elements.extend(low if v < low else high if v > high else v for v in chunk)
+                self.input_text = str(min(len(elements), limit))
+                if len(elements) >= limit:
+                    del elements[limit:]
+                    break
+                yield
+        except OSError as e:
+            self.add_console_message(f"sortingapp$ import failed: {e}")
+            self.input_text = str(self.array_size)
+            return
 
-        except ValueError:
-            # Invalid input, don't update
-            pass
+        self.set_array(elements)
+        self.sync_input_text()
+
+    def step_import(self):
+        """Advance a running import for at most one frame budget"""
+        if self.import_job is None:
+            return
+        deadline = time.perf_counter() + SORTING_CONFIG['IMPORT_FRAME_BUDGET_MS'] / 1000
+        try:
+            while time.perf_counter() < deadline:
+                next(self.import_job)
+        except StopIteration:
+            self.import_job = None
+
+    def _read_clipboard(self):
+        """Return clipboard text, or an empty string if it is unavailable"""
+        try:
+            if not pygame.scrap.get_init():
+                pygame.scrap.init()
+            data = pygame.scrap.get(pygame.SCRAP_TEXT)
+        except pygame.error:
+            return ""
+        if not data:
+            return ""
+        return data.decode('utf-8', errors='ignore').replace('\x00', '')
+
+    def _edit_input_text(self, start, end, replacement=""):
+        """Apply one edit through the incremental parser"""
+        self.array_parser.edit(start, end, replacement)
+        self.array_input_text = self.array_parser.text
+        self.array_text_edited = True
 
     def handle_array_input(self, event):
         """Handle keyboard input for array editing"""
@@ -224,22 +318,20 @@ class SortingVisualizer:
 
         elif event.key == pygame.K_ESCAPE:
             # Cancel editing, restore original
-            self.array_input_text = str(self.array)[1:-1] if self.array else ""
+            self.sync_input_text()
             self.array_input_active = False
             self.editing_array = False
             return
 
         elif event.key == pygame.K_BACKSPACE:
             if self.cursor_position > 0:
-                self.array_input_text = (self.array_input_text[:self.cursor_position - 1] +
-                                         self.array_input_text[self.cursor_position:])
+                self._edit_input_text(self.cursor_position - 1, self.cursor_position)
                 self.cursor_position -= 1
                 self.preview_array_update()
 
         elif event.key == pygame.K_DELETE:
             if self.cursor_position < len(self.array_input_text):
-                self.array_input_text = (self.array_input_text[:self.cursor_position] +
-                                         self.array_input_text[self.cursor_position + 1:])
+                self._edit_input_text(self.cursor_position, self.cursor_position + 1)
                 self.preview_array_update()
 
         elif event.key == pygame.K_LEFT:
@@ -254,49 +346,115 @@ class SortingVisualizer:
         elif event.key == pygame.K_END:
             self.cursor_position = len(self.array_input_text)
 
+        elif event.key == pygame.K_v and event.mod & pygame.KMOD_CTRL:
+            # Paste at the cursor; only the pasted region is tokenized
+            pasted = self._read_clipboard()
+            if pasted:
+                self._edit_input_text(self.cursor_position, self.cursor_position, pasted)
+                self.cursor_position += len(pasted)
+                self.preview_array_update()
+
         else:
             # Check for valid input (numbers, comma, space)
-            if event.unicode in '0123456789, ':
-                # Check if adding this would exceed max size
-                test_text = (self.array_input_text[:self.cursor_position] +
-                             event.unicode +
-                             self.array_input_text[self.cursor_position:])
-
-                # Quick check for array size limit
-                test_elements = test_text.split(',')
-                if len(test_elements) <= SORTING_CONFIG['MAX_ARRAY_SIZE']:
-                    self.array_input_text = test_text
+            if event.unicode and event.unicode in '0123456789, ':
+                count_before = len(self.array_parser)
+                self._edit_input_text(self.cursor_position, self.cursor_position, event.unicode)
+
+                # Undo the keystroke if it would grow the array past max size
+                count = len(self.array_parser)
+                if count > count_before and count > SORTING_CONFIG['MAX_ARRAY_SIZE']:
+                    self._edit_input_text(self.cursor_position, self.cursor_position + 1)
+                else:
                     self.cursor_position += 1
                     self.preview_array_update()
 
     def preview_array_update(self):
         """Update array size preview while typing"""
-        try:
-            if not self.array_input_text.strip():
-                element_count = 0
-            else:
-                # Count valid elements
-                elements = [item.strip() for item in self.array_input_text.split(',')
-                            if item.strip() and item.strip().isdigit()]
-                element_count = min(len(elements), SORTING_CONFIG['MAX_ARRAY_SIZE'])
-
-            self.input_text = str(element_count)
+        self.input_text = str(min(len(self.array_parser), SORTING_CONFIG['MAX_ARRAY_SIZE']))
 
-        except:
-            pass
+    def add_console_message(self, *parts):
+        """Add a message to the console output; parts are formatted when first shown"""
+        self.console.add(*parts)
 
-    def add_console_message(self, message):
-        """Add a message to the console output"""
-        self.console_messages.append(message)
-        if len(self.console_messages) > self.max_console_lines:
-            self.console_messages.pop(0)
+    def array_preview(self, values):
+        """Console-sized view of an array: only its ends are kept and printed"""
+        return ArrayPreview(values, SORTING_CONFIG['CONSOLE_PREVIEW_ITEMS'])
 
     def start_sorting(self):
         """Start the sorting process and timer"""
         self.sort_start_time = time.time()
         self.total_pause_duration = 0
         self.done_active = False  # Reset DONE button when starting
-        self.add_console_message(f"sortingapp$ visualizing...")
+        # A fresh stepper per run, so rate mode starts with a clean clock
+        self.stepper = Stepper(self.step_granularity, SORTING_CONFIG['STEP_RATE'])
+        if not self.race_mode:
+            self.add_console_message(f"sortingapp$ visualizing ({self.step_granularity} steps)...")
+
+    def run_visual(self, visual):
+        """Start a visual generator, replaying a cached trace of the same run when there is one"""
+        content = content_key(self.sorting_array)
+        if content is None:
+            return self._start_visual(visual)
+
+        key = (self.selected_algorithm, self.step_granularity, content)
+        trace = self.trace_cache.get(key)
+        if trace is not None:
+            self.add_console_message(f"sortingapp$ trace cache hit, replaying {len(trace)} frames "
+                                     f"({self.trace_cache.stats()})")
+            return self.trace_cache.replay(trace, self.sorting_array, self)
+
+        self.add_console_message(f"sortingapp$ trace cache miss, recording ({self.trace_cache.stats()})")
+        self.sorting_array = RecordingList(self.sorting_array, Trace(content[0]))
+        return self.trace_cache.record(key, self._start_visual(visual), self.sorting_array, self)
+
+    def _start_visual(self, visual):
+        """Large arrays sort in a worker thread; small ones step directly in the render loop"""
+        if (len(self.sorting_array) < SORTING_CONFIG['BACKGROUND_SORT_MIN']
+                or typecode_of(self.sorting_array) is None):
+            return visual(self.sorting_array, self)
+        self.background = BackgroundSort(visual, list(self.sorting_array), self.stepper,
+                                         SORTING_CONFIG['BACKGROUND_CHUNK_FRAMES'],
+                                         SORTING_CONFIG['BACKGROUND_QUEUE_CHUNKS'])
+        self.add_console_message("sortingapp$ sorting in a background thread...")
+        return self.background.run(self)
+
+    def toggle_race_mode(self):
+        """Switch between the single panel and the race grid"""
+        self.race_mode = not self.race_mode
+        if self.race_mode and not self.race_algorithms:
+            self.race_algorithms = {self.selected_algorithm}
+        self.console_panel = self.race_console_panel if self.race_mode else self.full_console_panel
+        state = "on, click algorithms to enter them" if self.race_mode else "off"
+        self.add_console_message(f"sortingapp$ race mode {state}")
+
+    def toggle_race_algorithm(self, name):
+        """Add an algorithm to the race, or take it out"""
+        self.race_algorithms ^= {name}
+
+    def start_race(self):
+        """Start every entered algorithm on its own copy of the array"""
+        names = [name for name in ALGORITHMS if name in self.race_algorithms]
+        # Larger arrays take proportionally more steps per tick, so races finish in similar time
+        steps = SORTING_CONFIG['RACE_STEPS_PER_TICK'] * max(1, len(self.array) // SORTING_CONFIG['MAX_ARRAY_SIZE'])
+        self.race = Race(names, self.array, steps, SORTING_CONFIG['RACE_PROCESS_MIN'],
+                         SORTING_CONFIG['RACE_CHUNK_FRAMES'])
+        where = "worker processes" if self.race.in_workers else "this process"
+        self.add_console_message(f"sortingapp$ racing {len(names)} algorithms, {steps} steps per tick, in {where}...")
+        return self.race.run(self)
+
+    def race_panels(self):
+        """(title, values, highlighted indices, costs, done) for each panel of the grid"""
+        if self.race is None:
+            return [(name, self.array, [], "ready", False)
+                    for name in ALGORITHMS if name in self.race_algorithms]
+        return [(f"{lane.name}  {lane.seconds * 1000:.1f} ms", lane.values, lane.current_indices,
+                 lane.costs(), lane.sorted) for lane in self.race.lanes]
+
+    def cycle_step_granularity(self):
+        """Switch to the next step granularity for the next run"""
+        names = list(GRANULARITIES)
+        self.step_granularity = names[(names.index(self.step_granularity) + 1) % len(names)]
+        self.add_console_message(f"sortingapp$ step granularity: {self.step_granularity}")
 
     def pause_sorting(self):
         """Pause the sorting and track pause time"""
@@ -310,22 +468,28 @@ class SortingVisualizer:
 
     def complete_sorting(self):
         """Calculate and display total sorting time"""
-        if self.sort_start_time > 0:
+        if self.race is not None:
+            for place, lane in enumerate(self.race.standings(), 1):
+                name = lane.name.replace(" Sort", "")
+                self.add_console_message(f"sortingapp$ {place}. [{name}] {lane.summary()}")
+        elif self.sort_start_time > 0:
             total_time = time.time() - self.sort_start_time - self.total_pause_duration
             algo_name = self.selected_algorithm.replace(" Sort", "")
             self.add_console_message(f"sortingapp$ [{algo_name}] sort took {total_time:.2f} seconds to complete")
-            self.add_console_message(f"sortingapp$ Sorted array: {self.sorting_array}")
+            self.add_console_message("sortingapp$ Sorted array: ", self.array_preview(self.sorting_array))
             self.add_console_message("sortingapp$ cleaning up...")
 
     def reset_sorting(self):
         """Reset the sorting state"""
+        self.close_race()
+        self.cancel_background()
         self.sorting_array = self.array.copy()
         self.sorting = False
         self.paused = False
         self.sorted = False
         self.started = False
         self.current_indices = []
-        self.console_messages = []
+        self.console.clear()
         self.array_scroll_offset = 0
         self.sort_start_time = 0
         self.total_pause_duration = 0
@@ -334,10 +498,24 @@ class SortingVisualizer:
         algo_name = self.selected_algorithm.replace(" Sort", "")
         self.add_console_message(f"sortingapp$ running [{algo_name}] sort...")
         self.add_console_message(f"sortingapp$ utilizing array of size {self.array_size}")
-        self.add_console_message(f"sortingapp$ Original array: {self.array}")
+        self.add_console_message("sortingapp$ Original array: ", self.array_preview(self.array))
+
+    def close_race(self):
+        """Stop a race and any worker processes it started"""
+        if self.race is not None:
+            self.race.close()
+            self.race = None
+
+    def cancel_background(self):
+        """Stop a background sort; its thread exits at the generator's next checkpoint"""
+        if self.background is not None:
+            self.background.cancel()
+            self.background = None
 
     def quit_application(self):
         """Quit the application"""
+        self.close_race()
+        self.cancel_background()
         pygame.quit()
         sys.exit()
 
@@ -358,10 +536,15 @@ class SortingVisualizer:
         if needs_scroll:
             self.array_scroll_max = max(0, scroll_max)
 
-        self.ui.draw_algorithm_selection(self.algorithm_buttons, self.selected_algorithm)
+        self.ui.draw_algorithm_selection(self.algorithm_buttons, self.selected_algorithm,
+                                         self.race_algorithms if self.race_mode else None)
         self.ui.draw_control_buttons(self.start_button, self.pause_button,
                                     self.reset_button, self.started, self.paused)
-        self.ui.draw_visualization_panel(self.viz_panel, self.sorting_array,
-                                        self.current_indices, self.sorting, self.sorted)
-        self.ui.draw_console_panel(self.console_panel, self.console_messages)
+        if self.race_mode:
+            max_value = self.race.max_value if self.race else max(self.array, default=1)
+            self.ui.draw_race_grid(self.race_grid_rect, self.race_panels(), max_value, self.sorting)
+        else:
+            self.ui.draw_visualization_panel(self.viz_panel, self.sorting_array,
+                                            self.current_indices, self.sorting, self.sorted)
+        self.ui.draw_console_panel(self.console_panel, self.console, self.console_search)
         self.ui.draw_quit_button(self.quit_button)
@@ -0,0 +1,191 @@
+"""
+Bulk array import for the Sorting Algorithm Visualizer
+Streams numbers out of text/CSV/binary files in chunks and keeps the
+editable array text tokenized incrementally
+"""
+
+import math
+import os
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+# Any run of characters that is not a separator is one token
+TOKEN_RE = re.compile(r"[^,;\s]+")
+SEPARATORS = ",; \t\r\n"
+
+# File extension -> array typecode for raw little-endian binary imports
+BINARY_FORMATS = {'.bin': 'q', '.i64': 'q', '.f64': 'd'}
+
+CHUNK_BYTES = 1 << 20
+
+
+def parse_int(token):
+    """Parse one token, returning None when it is not a number"""
+    try:
+        return int(token)
+    except ValueError:
+        try:
+            return int(float(token))
+        except (ValueError, OverflowError):
+            return None
+
+
+def parse_tokens(tokens):
+    """Convert a list of tokens to ints, dropping the ones that do not parse"""
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        values = [parse_int(t) for t in tokens]
+        return [v for v in values if v is not None]
+
+
+def iter_text_chunks(stream, chunk_size=CHUNK_BYTES):
+    """
+    Yield lists of ints from a text stream (CSV, newline or comma separated)
+    A token split across two reads is carried into the next chunk
+    """
+    carry = ""
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        block = carry + block
+        # Hold back a trailing partial token until the next read
+        cut = len(block)
+        while cut > 0 and block[cut - 1] not in SEPARATORS:
+            cut -= 1
+        carry = block[cut:]
+        values = parse_tokens(TOKEN_RE.findall(block, 0, cut))
+        if values:
+            yield values
+    if carry:
+        values = parse_tokens(TOKEN_RE.findall(carry))
+        if values:
+            yield values
+
+
+def iter_binary_chunks(path, typecode, chunk_size=CHUNK_BYTES):
+    """Yield lists of ints from a packed int64/float64 file; NaN and infinities are skipped"""
+    items = max(1, chunk_size // array(typecode).itemsize)
+    with open(path, 'rb') as f:
+        while True:
+            buf = array(typecode)
+            try:
+                buf.fromfile(f, items)
+            except EOFError:
+                pass  # short final read still fills buf
+            if not buf:
+                break
+            yield buf.tolist() if typecode == 'q' else [int(round(x)) for x in buf if math.isfinite(x)]
+
+
+def iter_file_chunks(path, chunk_size=CHUNK_BYTES):
+    """Pick a reader by extension and yield chunks of ints from the file"""
+    typecode = BINARY_FORMATS.get(os.path.splitext(path)[1].lower())
+    if typecode:
+        yield from iter_binary_chunks(path, typecode, chunk_size)
+        return
+    with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        yield from iter_text_chunks(f, chunk_size)
+
+
+class IncrementalParser:
+    """
+    Tokenized view of the array text that re-parses only the edited region
+
+    Token start offsets after an edit are shifted lazily: starts from
+    index _shift_from onward are stored without the pending _shift, so a
+    keystroke costs time proportional to the tokens it touches plus the
+    distance the cursor moved since the last edit, not the array length.
+    """
+
+    def __init__(self, text=""):
+        self.reset(text)
+
+    def reset(self, text):
+        """Tokenize the whole text from scratch"""
+        self.text = text
+        self._starts = []
+        self._lengths = []
+        self.values = []
+        for m in TOKEN_RE.finditer(text):
+            self._starts.append(m.start())
+            self._lengths.append(m.end() - m.start())
+            self.values.append(parse_int(m.group()))
+        self.invalid = self.values.count(None)
+        self._shift_from = len(self._starts)
+        self._shift = 0
+
+    def load_values(self, values):
+        """Build the text and token table for a known list of ints without re-parsing"""
+        strs = list(map(str, values))
+        self.text = ", ".join(strs)
+        self._lengths = list(map(len, strs))
+        self._starts = [0] + list(accumulate(l + 2 for l in self._lengths[:-1])) if strs else []
+        self.values = list(values)
+        self.invalid = 0
+        self._shift_from = len(self._starts)
+        self._shift = 0
+
+    def __len__(self):
+        """Number of tokens that parse as numbers"""
+        return len(self.values) - self.invalid
+
+    def numbers(self):
+        """Parsed values in order, skipping invalid tokens"""
+        if not self.invalid:
+            return list(self.values)
+        return [v for v in self.values if v is not None]
+
+    def _start(self, i):
+        start = self._starts[i]
+        return start + self._shift if i >= self._shift_from else start
+
+    def _move_shift(self, k):
+        """Re-anchor the pending shift so that it applies from token k onward"""
+        d = self._shift
+        if d:
+            starts = self._starts
+            if k > self._shift_from:
+                for i in range(self._shift_from, k):
+                    starts[i] += d
+            else:
+                for i in range(k, self._shift_from):
+                    starts[i] -= d
+        self._shift_from = k
+
+    def edit(self, start, end, replacement=""):
+        """Replace text[start:end] and re-tokenize only the tokens touching it"""
+        n = len(self._starts)
+        # Tokens touching [start, end] may merge with or split around the edit
+        a = bisect_left(range(n), start, key=lambda i: self._start(i) + self._lengths[i])
+        b = bisect_right(range(n), end, key=self._start)
+        lo, hi = start, end
+        if a < b:
+            lo = min(start, self._start(a))
+            hi = max(end, self._start(b - 1) + self._lengths[b - 1])
+
+        self.text = self.text[:start] + replacement + self.text[end:]
+        delta = len(replacement) - (end - start)
+
+        new_starts, new_lengths, new_values = [], [], []
+        for m in TOKEN_RE.finditer(self.text, lo, hi + delta):
+            new_starts.append(m.start())
+            new_lengths.append(m.end() - m.start())
+            new_values.append(parse_int(m.group()))
+
+        self._move_shift(b)
+        self._shift += delta
+        self.invalid += new_values.count(None) - self.values[a:b].count(None)
+        self._starts[a:b] = new_starts
+        self._lengths[a:b] = new_lengths
+        self.values[a:b] = new_values
+        self._shift_from = a + len(new_starts)
+
+    def insert(self, pos, text):
+        self.edit(pos, pos, text)
+
+    def delete(self, start, end):
+        self.edit(start, end, "")
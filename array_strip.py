@@ -0,0 +1,115 @@
+"""
+Virtualized text strip for the array display
+Lays out an array (or the text being edited) as a row of tiles with
+precomputed x offsets, so only the tiles inside the scroll window are
+rendered and no surface ever holds the whole array
+"""
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+# Characters per tile when laying out free text being edited
+TEXT_TILE_CHARS = 64
+
+# Rendered tiles kept between frames; the cache is dropped when it fills up
+GLYPH_CACHE_SIZE = 4096
+
+
+class ArrayStrip:
+    """Tile layout and glyph cache for one font"""
+
+    def __init__(self, font, color):
+        self.font = font
+        self.color = color
+        self.char_widths = {}
+        self.glyphs = {}
+        self.source = None
+        self.tokens = None
+        self.offsets = array('q', [0])
+
+    def char_width(self, ch):
+        width = self.char_widths.get(ch)
+        if width is None:
+            width = self.char_widths[ch] = self.font.size(ch)[0]
+        return width
+
+    def text_width(self, text):
+        """Width of text from per-character advances, without rendering it"""
+        widths = self.char_widths
+        if all(ch in widths for ch in text):
+            return sum(map(widths.__getitem__, text))
+        return sum(map(self.char_width, text))
+
+    @property
+    def width(self):
+        return self.offsets[-1]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def layout_array(self, values):
+        """One tile per element, rendered as it appears in str(values)"""
+        if self.source is values and self.tokens is None:
+            return
+        if not values:
+            self.layout_text("")
+            return
+        last = len(values) - 1
+        memo = {}
+        widths = []
+        sep = self.text_width(", ")
+        for v in values:
+            # Integers repeat a lot, so each distinct one is measured once
+            if type(v) is int:
+                w = memo.get(v)
+                if w is None:
+                    w = memo[v] = self.text_width(str(v)) + sep
+            else:
+                w = self.text_width(str(v)) + sep
+            widths.append(w)
+        widths[0] += self.text_width("[")
+        widths[last] += self.text_width("]") - sep
+        self.offsets = array('q', accumulate(widths, initial=0))
+        self.source = values
+        self.tokens = None
+
+    def layout_text(self, text):
+        """Fixed-size character tiles over "[text]", for the text being edited"""
+        if self.tokens is not None and self.source is text:
+            return
+        framed = f"[{text}]"
+        self.tokens = [framed[i:i + TEXT_TILE_CHARS] for i in range(0, len(framed), TEXT_TILE_CHARS)]
+        self.offsets = array('q', accumulate(map(self.text_width, self.tokens), initial=0))
+        self.source = text
+
+    def token(self, i):
+        if self.tokens is not None:
+            return self.tokens[i]
+        values = self.source
+        text = str(values[i])
+        if i == 0:
+            text = "[" + text
+        return text + ("]" if i == len(values) - 1 else ", ")
+
+    def text_x(self, pos):
+        """x offset of a character position in the laid-out text, brackets included"""
+        tile, rem = divmod(pos, TEXT_TILE_CHARS)
+        if tile >= len(self):
+            return self.width
+        return self.offsets[tile] + self.text_width(self.tokens[tile][:rem])
+
+    def visible(self, left, right):
+        """Indices of the tiles overlapping [left, right)"""
+        first = max(0, bisect_right(self.offsets, left) - 1)
+        last = min(len(self), bisect_right(self.offsets, right))
+        return range(first, last)
+
+    def glyph(self, i):
+        text = self.token(i)
+        surface = self.glyphs.get(text)
+        if surface is None:
+            if len(self.glyphs) >= GLYPH_CACHE_SIZE:
+                self.glyphs.clear()
+            surface = self.glyphs[text] = self.font.render(text, True, self.color)
+        return surface
@@ -0,0 +1,135 @@
+"""
+Background sort execution for the Sorting Algorithm Visualizer
+A visual generator runs on a private copy of the array in a worker thread
+and streams its frames (writes and highlighted indices) through a bounded
+queue. The render loop only applies one frame per step, so frame time
+stays bounded however much work a single generator step does
+"""
+
+import queue
+import threading
+
+from trace_cache import RecordingList, Trace, typecode_of
+
+
+class HeadlessApp:
+    """The app_instance a visual generator sees when it runs off the UI thread"""
+
+    def __init__(self, stepper):
+        self.sorting = True
+        self.paused = False
+        self.sorted = False
+        self.current_indices = []
+        self.stepper = stepper
+
+    def complete_sorting(self):
+        """The consumer reports completion on the UI thread"""
+
+
+class BackgroundSort:
+    """Runs a visual generator in a daemon thread, one bounded queue of frame chunks"""
+
+    def __init__(self, visual, values, stepper, chunk_frames=64, queue_chunks=8):
+        self.typecode = typecode_of(values)
+        if self.typecode is None:
+            raise ValueError("background sorting needs an all-int or all-float array")
+        self.values = RecordingList(values, Trace(self.typecode))
+        self.state = HeadlessApp(stepper)
+        self.generator = visual(self.values, self.state)
+        self.chunk_frames = chunk_frames
+        self.frames = queue.Queue(maxsize=queue_chunks)
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self._produce, daemon=True)
+        self.thread.start()
+
+    def _put(self, item):
+        # Blocks while the queue is full, but still notices a cancel
+        while not self.cancelled.is_set():
+            try:
+                self.frames.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce(self):
+        values, state = self.values, self.state
+        trace = values.trace
+        try:
+            for frame in self.generator:
+                if self.cancelled.is_set():
+                    return
+                if values.trace is None:
+                    raise ValueError("array holds values the frame buffer cannot store")
+                if frame:
+                    trace.frame_writes.append(len(trace.write_index))
+                    trace.highlight.extend(state.current_indices)
+                    trace.frame_highlight.append(len(trace.highlight))
+                if state.sorted or len(trace) >= self.chunk_frames:
+                    if not self._put((trace, state.sorted)):
+                        return
+                    if state.sorted:
+                        return
+                    trace = values.trace = Trace(self.typecode)
+            # A generator that stopped without finishing (it was told to stop)
+            self._put((trace, True))
+        except Exception as e:
+            self._put(e)
+
+    def cancel(self):
+        """Stop the worker at its next checkpoint; it exits on its own"""
+        self.cancelled.set()
+        self.state.sorting = False
+
+    def run(self, app_instance):
+        """Visual generator for the main loop that applies one streamed frame per step"""
+        sorting_array = app_instance.sorting_array
+        chunk, finished = None, False
+        f = w = h = 0
+        while True:
+            if not app_instance.sorting:
+                self.cancel()
+                yield False
+                return
+
+            while app_instance.paused:
+                yield True
+
+            if chunk is None or f == len(chunk):
+                if chunk is not None and finished:
+                    # Writes made after the last frame, before the generator finished
+                    for k in range(w, len(chunk.write_index)):
+                        sorting_array[chunk.write_index[k]] = chunk.write_value[k]
+                    break
+                try:
+                    item = self.frames.get_nowait()
+                except queue.Empty:
+                    # The worker is still computing; None is not a frame, so the
+                    # trace cache does not record the wait
+                    yield None
+                    continue
+                if isinstance(item, Exception):
+                    app_instance.add_console_message(f"sortingapp$ sort failed: {item}")
+                    app_instance.sorting = False
+                    yield False
+                    return
+                chunk, finished = item
+                f = w = h = 0
+                continue
+
+            w_end = chunk.frame_writes[f]
+            index, value = chunk.write_index, chunk.write_value
+            for k in range(w, w_end):
+                sorting_array[index[k]] = value[k]
+            w = w_end
+            h_end = chunk.frame_highlight[f]
+            app_instance.current_indices = chunk.highlight[h:h_end].tolist()
+            h = h_end
+            f += 1
+            yield True
+
+        app_instance.complete_sorting()
+        app_instance.sorted = True
+        app_instance.sorting = False
+        app_instance.current_indices = []
+        yield False
@@ -50,6 +50,8 @@ UI_DIMENSIONS = {
     'CONSOLE_HEIGHT': 310,
     'SCROLLBAR_WIDTH': 10,
     'SCROLLBAR_HEIGHT': 20,
+    'RACE_CONSOLE_HEIGHT': 110,
+    'RACE_GRID_HEIGHT': 190,
 }
 
 # Algorithm Names
@@ -68,5 +70,21 @@ SORTING_CONFIG = {
     'MAX_VALUE': 100,
     'DEFAULT_SPEED': 10,  # milliseconds
     'SCROLL_SPEED': 20,
-    'MAX_CONSOLE_LINES': 16,
+    'CONSOLE_SCROLL_SPEED': 3,  # console messages per mouse wheel notch
+    'CONSOLE_HISTORY': 2000,  # messages kept for scrollback
+    'CONSOLE_PREVIEW_ITEMS': 8,  # array items shown from each end in console messages
+    'DATASET_SHAPE': 'uniform',  # see SortAlgorithm.Datasets.SHAPES
+    'DATASET_SEED': None,  # first seed, None for a random one per launch; Randomize advances it
+    'MAX_IMPORT_SIZE': 1_000_000,  # file/clipboard imports may exceed MAX_ARRAY_SIZE
+    'IMPORT_CHUNK_BYTES': 1 << 16,
+    'IMPORT_FRAME_BUDGET_MS': 8,  # parsing time allowed per frame during an import
+    'STEP_GRANULARITY': 'operation',  # operation, swap, pass, partition or rate; G cycles
+    'STEP_RATE': 120,  # yields per second of sorting work in 'rate' granularity
+    'TRACE_CACHE_BYTES': 32 << 20,  # recorded runs kept for instant replay
+    'BACKGROUND_SORT_MIN': 1000,  # arrays this long sort in a worker thread, not the render loop
+    'BACKGROUND_CHUNK_FRAMES': 64,  # frames per chunk the worker queues
+    'BACKGROUND_QUEUE_CHUNKS': 8,  # chunks the worker may run ahead before it blocks
+    'RACE_STEPS_PER_TICK': 1,  # checkpoints every lane advances per tick, per MAX_ARRAY_SIZE items
+    'RACE_PROCESS_MIN': 5000,  # arrays this long are raced in worker processes
+    'RACE_CHUNK_FRAMES': 4096,  # frames per trace chunk a race worker sends
 }
@@ -0,0 +1,135 @@
+"""
+Console log for the Sorting Algorithm Visualizer
+A bounded ring buffer of messages that are formatted and wrapped only
+when they scroll into view, so drawing costs the same for any log size
+"""
+
+from collections import deque
+
+
+class ArrayPreview:
+    """Lazily formatted array that shows only the first and last k items"""
+
+    __slots__ = ("head", "tail", "n")
+
+    def __init__(self, values, k=8):
+        # Only 2k items are copied, so large arrays cost nothing to log
+        self.n = len(values)
+        if self.n > 2 * k:
+            self.head = list(values[:k])
+            self.tail = list(values[-k:])
+        else:
+            self.head = list(values)
+            self.tail = None
+
+    def __str__(self):
+        if self.tail is None:
+            return str(self.head)
+        head = ", ".join(map(str, self.head))
+        tail = ", ".join(map(str, self.tail))
+        return f"[{head}, ... {self.n - len(self.head) - len(self.tail)} more ..., {tail}] (n={self.n})"
+
+
+class _Entry:
+    __slots__ = ("seq", "parts", "_text", "_width", "_lines")
+
+    def __init__(self, seq, parts):
+        self.seq = seq
+        self.parts = parts
+        self._text = None
+        self._width = None
+        self._lines = None
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = "".join(p if isinstance(p, str) else str(p() if callable(p) else p)
+                                 for p in self.parts)
+            self.parts = None
+        return self._text
+
+    def lines(self, wrap, width):
+        """Wrapped lines, cached for the last width they were wrapped to"""
+        if self._width != width:
+            self._lines = wrap(self.text)
+            self._width = width
+        return self._lines
+
+
+class ConsoleLog:
+    """Ring buffer of console messages with scrollback and search"""
+
+    def __init__(self, capacity=2000):
+        self.entries = deque(maxlen=capacity)
+        self.next_seq = 0
+        self.anchor = None  # seq of the bottom visible entry; None follows the newest
+        self.query = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return (e.text for e in self.entries)
+
+    def add(self, *parts):
+        """Append a message made of strings, objects or zero-argument callables"""
+        self.entries.append(_Entry(self.next_seq, parts))
+        self.next_seq += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.anchor = None
+
+    def _anchor_index(self):
+        if not self.entries:
+            return -1
+        if self.anchor is None:
+            return len(self.entries) - 1
+        # Sequence numbers are contiguous, so this is an O(1) lookup
+        return max(0, min(len(self.entries) - 1, self.anchor - self.entries[0].seq))
+
+    def scroll(self, delta):
+        """Move the view delta messages back in time (negative moves forward)"""
+        if not self.entries:
+            return
+        index = self._anchor_index() - delta
+        if index >= len(self.entries) - 1:
+            self.anchor = None
+        else:
+            self.anchor = self.entries[max(0, index)].seq
+
+    def visible_lines(self, max_lines, wrap, width):
+        """
+        The max_lines wrapped lines ending at the anchor entry, oldest first
+
+        Returns (line, matched) pairs; matched marks entries containing the
+        current search query. Only entries that end up on screen are formatted.
+        """
+        out = []
+        query = self.query.lower() if self.query else None
+        index = self._anchor_index()
+        while index >= 0 and len(out) < max_lines:
+            entry = self.entries[index]
+            matched = bool(query) and query in entry.text.lower()
+            for line in reversed(entry.lines(wrap, width)):
+                out.append((line, matched))
+                if len(out) == max_lines:
+                    break
+            index -= 1
+        out.reverse()
+        return out
+
+    def find(self, query):
+        """Scroll to the next older message containing query, wrapping to the newest"""
+        self.query = query
+        if not query or not self.entries:
+            return False
+        needle = query.lower()
+        n = len(self.entries)
+        start = self._anchor_index()
+        for step in range(1, n + 1):
+            index = (start - step) % n
+            if needle in self.entries[index].text.lower():
+                self.anchor = None if index == n - 1 else self.entries[index].seq
+                return True
+        return False
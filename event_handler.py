@@ -33,6 +33,12 @@ class EventHandler:
             self._handle_keydown(event)
             return True, sort_generator
 
+        elif event.type == pygame.DROPFILE:
+            # Dropping a CSV, text or .i64/.f64 file onto the window imports it
+            if not self.app.locked:
+                self.app.import_array_file(event.file)
+            return True, sort_generator
+
         return True, sort_generator
 
     def _handle_mousewheel(self, event):
@@ -41,6 +47,9 @@ class EventHandler:
             self.app.array_scroll_offset -= event.y * SORTING_CONFIG['SCROLL_SPEED']
             self.app.array_scroll_offset = max(0, min(self.app.array_scroll_offset,
                                                       self.app.array_scroll_max))
+        elif self.app.console_panel.collidepoint(pygame.mouse.get_pos()):
+            # Wheel up scrolls back through older console messages
+            self.app.console.scroll(event.y * SORTING_CONFIG['CONSOLE_SCROLL_SPEED'])
         return True
 
     def _handle_mouse_down(self, event, sort_generator):
@@ -58,8 +67,7 @@ class EventHandler:
 
             # Initialize editing text if starting to edit
             if not self.app.array_input_text:
-                self.app.array_input_text = str(self.app.array)[1:-1] if self.app.array else ""
-                self.app.cursor_position = len(self.app.array_input_text)
+                self.app.sync_input_text()
 
             return sort_generator
 
@@ -99,14 +107,20 @@ class EventHandler:
         # Check algorithm selection
         for algo_data in self.app.algorithm_buttons:
             if algo_data['rect'].collidepoint(event.pos):
+                # In race mode clicks enter or withdraw algorithms instead
+                if self.app.race_mode:
+                    if not self.app.started:
+                        self.app.toggle_race_algorithm(algo_data['name'])
+                    continue
                 self.app.selected_algorithm = algo_data['name']
                 # Update console when algorithm is changed
                 if not self.app.started:
-                    self.app.console_messages = []
+                    self.app.console.clear()
                     algo_name = self.app.selected_algorithm.replace(" Sort", "")
                     self.app.add_console_message(f"sortingapp$ running [{algo_name}] sort...")
                     self.app.add_console_message(f"sortingapp$ utilizing array of size {self.app.array_size}")
-                    self.app.add_console_message(f"sortingapp$ Original array: {self.app.array}")
+                    self.app.add_console_message("sortingapp$ Original array: ",
+                                                  self.app.array_preview(self.app.array))
 
         # Check control buttons
         if self.app.start_button.collidepoint(event.pos):
@@ -116,23 +130,19 @@ class EventHandler:
                 self.app.started = True
                 self.app.start_sorting()
 
+                if self.app.race_mode:
+                    if self.app.race_algorithms:
+                        return self.app.start_race()
+                    self.app.add_console_message("sortingapp$ pick at least one algorithm to race")
+                    self.app.started = False
+                    self.app.sorting = False
+                    return None
+
                 # Import and select the correct sorting algorithm
-                from sorting_visualizers import SortingVisualizers
-
-                algorithm_map = {
-                    "Bubble Sort": SortingVisualizers.bubble_sort_visual,
-                    "Bucket Sort": SortingVisualizers.bucket_sort_visual,
-                    "Counting Sort": SortingVisualizers.counting_sort_visual,
-                    "Quick Select": SortingVisualizers.quick_select_visual,
-                    "Heap Sort": SortingVisualizers.heap_sort_visual,
-                    "Insertion Sort": SortingVisualizers.insertion_sort_visual,
-                    "Merge Sort": SortingVisualizers.merge_sort_visual,
-                    "Quick Sort": SortingVisualizers.quick_sort_visual,
-                    "Radix Sort": SortingVisualizers.radix_sort_visual,
-                }
-
-                if self.app.selected_algorithm in algorithm_map:
-                    return algorithm_map[self.app.selected_algorithm](self.app.sorting_array, self.app)
+                from sorting_visualizers import VISUALS
+
+                if self.app.selected_algorithm in VISUALS:
+                    return self.app.run_visual(VISUALS[self.app.selected_algorithm])
                 else:
                     self.app.add_console_message(f"sortingapp$ Algorithm not implemented yet")
                     self.app.started = False
@@ -170,11 +180,36 @@ class EventHandler:
 
     def _handle_keydown(self, event):
         """Handle keyboard input"""
+        # Console search takes all keys while its prompt is open
+        if self.app.console_search is not None:
+            self._handle_console_search(event)
+            return
+
         # Handle array editing input
         if self.app.array_input_active and self.app.editing_array and not self.app.locked:
             self.app.handle_array_input(event)
             return
 
+        # Ctrl+V outside the editor imports the clipboard as a new array
+        if event.key == pygame.K_v and event.mod & pygame.KMOD_CTRL and not self.app.locked:
+            self.app.import_clipboard()
+            return
+
+        # Ctrl+F opens a search over the console scrollback
+        if event.key == pygame.K_f and event.mod & pygame.KMOD_CTRL:
+            self.app.console_search = ""
+            return
+
+        # R switches between a single run and a race of several algorithms
+        if event.key == pygame.K_r and not self.app.input_active and not self.app.started:
+            self.app.toggle_race_mode()
+            return
+
+        # G picks how often the next run stops to draw
+        if event.key == pygame.K_g and not self.app.input_active and not self.app.started:
+            self.app.cycle_step_granularity()
+            return
+
         # Handle element count input
         if self.app.input_active and not self.app.locked:
             if event.key in [pygame.K_RETURN, pygame.K_KP_ENTER]:
@@ -193,4 +228,17 @@ class EventHandler:
                     # Check if new size would be valid
                     test_size = int(self.app.input_text + event.unicode) if self.app.input_text else int(event.unicode)
                     if test_size <= SORTING_CONFIG['MAX_ARRAY_SIZE']:
-                        self.app.input_text += event.unicode
\ No newline at end of file
+                        self.app.input_text += event.unicode
+
+    def _handle_console_search(self, event):
+        """Edit the console search query; Enter jumps to the next older match"""
+        if event.key == pygame.K_ESCAPE:
+            self.app.console_search = None
+            self.app.console.query = None
+            self.app.console.scroll(-len(self.app.console))
+        elif event.key in [pygame.K_RETURN, pygame.K_KP_ENTER]:
+            self.app.console.find(self.app.console_search)
+        elif event.key == pygame.K_BACKSPACE:
+            self.app.console_search = self.app.console_search[:-1]
+        elif event.unicode and event.unicode.isprintable():
+            self.app.console_search += event.unicode
@@ -0,0 +1,259 @@
+"""
+Headless export of sort animations to image sequences
+
+    python export_frames.py --algorithm "Merge Sort" --size 50 --out frames/
+    python export_frames.py --algorithm radix --every 5 --format raw --out frames/
+    python export_frames.py --algorithm heap --input data.csv --width 1200 --height 400
+
+Runs one algorithm through its SortingVisualizers generator with the SDL
+dummy video driver, so no window is opened. The run is recorded once as a
+Trace; the exported frames are then split into ranges, and each range is
+rendered by a process pool worker from a keyframe snapshot of the array at
+the start of its range plus the recorded writes that follow.
+
+--format png writes frame_000000.png, frame_000001.png, ... with one file
+per exported frame. --format raw writes one RGB24 dump per range
+(frames_000000.rgb holds consecutive frames starting at that ordinal) and
+frames.json describing the size and file order.
+"""
+
+import argparse
+import json
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from array_import import iter_file_chunks
+from background_sort import HeadlessApp
+from config import SORTING_CONFIG, UI_DIMENSIONS
+from sorting_visualizers import GRANULARITIES, VISUALS, Stepper
+from SortAlgorithm.Datasets import SHAPES, generate
+from trace_cache import RecordingList, Trace, typecode_of
+
+# Ranges per worker, so a slow range does not leave the other workers idle
+RANGES_PER_WORKER = 4
+
+
+def resolve_algorithm(name):
+    """Match a VISUALS name exactly, or by a unique case-insensitive prefix"""
+    if name in VISUALS:
+        return name
+    matches = [key for key in VISUALS if key.lower().startswith(name.lower())]
+    if len(matches) != 1:
+        raise ValueError(f"unknown algorithm {name!r}, expected one of {list(VISUALS)}")
+    return matches[0]
+
+
+def record(algorithm, values, granularity="operation"):
+    """Run the visual generator headless and return its Trace (every frame)"""
+    typecode = typecode_of(values)
+    if typecode is None:
+        raise ValueError("export needs an all-int or all-float array")
+    trace = Trace(typecode)
+    recorded = RecordingList(values, trace)
+    app_instance = HeadlessApp(Stepper(granularity, SORTING_CONFIG['STEP_RATE']))
+    for frame in VISUALS[algorithm](recorded, app_instance):
+        if recorded.trace is None:
+            raise ValueError("array holds values the trace cannot store")
+        if frame:
+            trace.frame_writes.append(len(trace.write_index))
+            trace.highlight.extend(app_instance.current_indices)
+            trace.frame_highlight.append(len(trace.highlight))
+    return trace
+
+
+def plan_jobs(trace, values, every, ranges):
+    """
+    Split the exported frames into jobs, each with the keyframe it starts from
+
+    Frame f is exported when f % every == 0, as ordinal f // every; a final
+    frame showing the sorted array follows the last one. Each job holds
+    the array state before its first frame and the slices of the trace it
+    replays, so workers never need the whole trace.
+    """
+    total = len(trace)
+    exported = -(-total // every)  # ordinals 0 .. exported-1, then the final frame
+    bounds = [exported * k // ranges for k in range(ranges + 1)]
+    state = list(values)
+    index, value = trace.write_index, trace.write_value
+    w = 0
+    jobs = []
+    for lo, hi in zip(bounds, bounds[1:]):
+        if lo == hi:
+            continue
+        first = lo * every
+        last = min(total - 1, (hi - 1) * every)
+        # Advance the shared state to just before this job's first frame
+        w_start = trace.frame_writes[first - 1] if first else 0
+        for k in range(w, w_start):
+            state[index[k]] = value[k]
+        w = w_start
+        final = hi == exported
+        w_stop = len(index) if final else trace.frame_writes[last]
+        h_start = trace.frame_highlight[first - 1] if first else 0
+        h_stop = trace.frame_highlight[last]
+        jobs.append({
+            "first": first,
+            "every": every,
+            "keyframe": array(value.typecode, state),
+            "write_index": index[w_start:w_stop],
+            "write_value": value[w_start:w_stop],
+            "frame_writes": array('q', (x - w_start for x in trace.frame_writes[first:last + 1])),
+            "highlight": trace.highlight[h_start:h_stop],
+            "frame_highlight": array('q', (x - h_start for x in trace.frame_highlight[first:last + 1])),
+            "final": final,
+            "final_ordinal": exported,
+        })
+    if not jobs:
+        # No frames at all (an empty or one-step run): only the final frame
+        jobs.append({"first": 0, "every": every, "keyframe": array(trace.write_value.typecode, values),
+                     "write_index": trace.write_index, "write_value": trace.write_value,
+                     "frame_writes": array('q'), "highlight": array('q'),
+                     "frame_highlight": array('q'), "final": True, "final_ordinal": 0})
+    return jobs
+
+
+def job_frames(job):
+    """(ordinal, values, highlighted indices, sorted) for every frame a job exports"""
+    values = job["keyframe"].tolist()
+    index, value = job["write_index"], job["write_value"]
+    highlight = job["highlight"]
+    first, every = job["first"], job["every"]
+    w = h = 0
+    for f, (w_end, h_end) in enumerate(zip(job["frame_writes"], job["frame_highlight"]), first):
+        for k in range(w, w_end):
+            values[index[k]] = value[k]
+        if f % every == 0:
+            yield f // every, values, highlight[h:h_end].tolist(), False
+        w, h = w_end, h_end
+    if job["final"]:
+        for k in range(w, len(index)):
+            values[index[k]] = value[k]
+        yield job["final_ordinal"], values, [], True
+
+
+_renderer = None
+
+
+def _init_renderer(width, height):
+    """Process pool initializer: one dummy-driver surface and UIComponents per worker"""
+    global _renderer
+    # The dummy driver must be chosen before pygame is first imported
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from config import FONTS
+    from ui_components import UIComponents
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.Surface((width, height))
+    fonts = {
+        'title': pygame.font.Font(None, FONTS['TITLE_SIZE']),
+        'medium': pygame.font.Font(None, FONTS['MEDIUM_SIZE']),
+        'small': pygame.font.Font(None, FONTS['SMALL_SIZE']),
+        'console': pygame.font.Font(None, FONTS['CONSOLE_SIZE']),
+    }
+    _renderer = (pygame, screen, UIComponents(screen, fonts), pygame.Rect(0, 0, width, height))
+
+
+def render_job(job, out_dir, fmt):
+    """Render one job's frames; returns (first ordinal, frames written, file name)"""
+    pygame, screen, ui, panel = _renderer
+    first_ordinal = None
+    count = 0
+    raw = None
+    name = None
+    try:
+        for ordinal, values, indices, done in job_frames(job):
+            ui.draw_visualization_panel(panel, values, indices, not done, done)
+            if first_ordinal is None:
+                first_ordinal = ordinal
+                if fmt == "raw":
+                    name = f"frames_{ordinal:06d}.rgb"
+                    raw = open(os.path.join(out_dir, name), "wb")
+            if raw is not None:
+                raw.write(pygame.image.tostring(screen, "RGB"))
+            else:
+                pygame.image.save(screen, os.path.join(out_dir, f"frame_{ordinal:06d}.png"))
+            count += 1
+    finally:
+        if raw is not None:
+            raw.close()
+    return first_ordinal, count, name
+
+
+def export(algorithm, values, out_dir, every=1, fmt="png", width=None, height=None,
+           granularity="operation", workers=None):
+    """Record one run and render its frames in parallel; returns the number of frames written"""
+    width = width or UI_DIMENSIONS['VIZ_PANEL_WIDTH']
+    height = height or UI_DIMENSIONS['VIZ_PANEL_HEIGHT']
+    workers = workers if workers is not None else os.cpu_count() or 1
+    os.makedirs(out_dir, exist_ok=True)
+
+    trace = record(algorithm, list(values), granularity)
+    jobs = plan_jobs(trace, values, every, max(1, workers) * RANGES_PER_WORKER)
+
+    if workers == 0:
+        _init_renderer(width, height)
+        results = [render_job(job, out_dir, fmt) for job in jobs]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_renderer,
+                                 initargs=(width, height)) as pool:
+            results = list(pool.map(render_job, jobs, [out_dir] * len(jobs), [fmt] * len(jobs)))
+
+    frames = sum(count for _, count, _ in results)
+    if fmt == "raw":
+        with open(os.path.join(out_dir, "frames.json"), "w") as f:
+            json.dump({
+                "algorithm": algorithm, "width": width, "height": height, "pixel_format": "RGB24",
+                "frames": frames, "every": every, "steps": len(trace),
+                "files": [{"name": name, "first": first, "frames": count}
+                          for first, count, name in results if count],
+            }, f, indent=1)
+    return frames
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a sort animation headlessly to image files")
+    parser.add_argument("--algorithm", required=True, help="visualizer name or a unique prefix of it")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--input", default=None, help="CSV, text or .i64/.f64 file to sort")
+    parser.add_argument("--size", type=int, default=SORTING_CONFIG['MAX_ARRAY_SIZE'])
+    parser.add_argument("--shape", default=SORTING_CONFIG['DATASET_SHAPE'], choices=SHAPES)
+    parser.add_argument("--seed", type=int, default=SORTING_CONFIG['DATASET_SEED'] or 0)
+    parser.add_argument("--every", type=int, default=1, help="export every Nth recorded step")
+    parser.add_argument("--granularity", default="operation",
+                        choices=[g for g in GRANULARITIES if g != "rate"])
+    parser.add_argument("--format", default="png", choices=("png", "raw"))
+    parser.add_argument("--width", type=int, default=None)
+    parser.add_argument("--height", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="render processes (0 renders in this process)")
+    args = parser.parse_args(argv)
+
+    if args.every < 1:
+        parser.error("--every must be at least 1")
+    try:
+        algorithm = resolve_algorithm(args.algorithm)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.input:
+        values = [v for chunk in iter_file_chunks(args.input) for v in chunk]
+    else:
+        values = generate(args.shape, args.size, seed=args.seed,
+                          low=SORTING_CONFIG['MIN_VALUE'], high=SORTING_CONFIG['MAX_VALUE'])
+
+    try:
+        frames = export(algorithm, values, args.out, args.every, args.format,
+                        args.width, args.height, args.granularity, args.workers)
+    except ValueError as e:
+        print(f"cannot export: {e}", file=sys.stderr)
+        return 2
+    print(f"{frames} {args.format} frames of {algorithm} on {len(values)} items written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,6 +22,9 @@ def main():
             if not running:
                 break
 
+        # Advance any file/clipboard import within its frame budget
+        visualizer.step_import()
+
         # Perform sorting step
         if visualizer.sorting and not visualizer.paused and sort_generator:
             if current_time - last_step_time > visualizer.speed:
@@ -0,0 +1,341 @@
+"""
+Performance regression gate for the Sorting Algorithm Visualizer
+
+    python perf_gate.py                      # compare against perf_baseline.json
+    python perf_gate.py --update-baseline    # re-measure and overwrite the baseline
+    python perf_gate.py --filter quick_sort --threshold 0.05
+    python perf_gate.py --memory             # write perf_memory.json instead
+
+Runs a fixed, seeded set of benchmarks over the SortAlgorithm functions
+and the visualizer draw path, collecting repeated samples of each. A
+benchmark counts as a regression when its median slowed down by more than
+the threshold AND a one-sided Mann-Whitney U test says the new samples are
+slower than the baseline ones at the chosen significance level, so noisy
+single runs do not fail the gate. Exits with status 1 on any regression.
+The draw_frame benchmarks need pygame; on a host without it they are
+listed as not measured, and --update-baseline keeps their old entries.
+
+--memory profiles the same algorithms and shapes at three sizes with
+SortAlgorithm.MemoryProfile and writes peak bytes, RSS growth and the
+largest allocation sites next to the baseline, for choosing algorithms
+on memory-limited workers. It is informational and never fails.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import sys
+import time
+from statistics import median
+
+from SortAlgorithm.Autotune import host_info
+from SortAlgorithm.BucketSortAlgorithm import bucket_sort
+from SortAlgorithm.CountingSortAlgorithm import counting_sort
+from SortAlgorithm.Datasets import generate
+from SortAlgorithm.HeapSortAlgorithm import heap_sort
+from SortAlgorithm.InsertionAlgorithm import insertion_sort
+from SortAlgorithm.MemoryProfile import profile_call
+from SortAlgorithm.MergeSortAlgorithm import merge_sort
+from SortAlgorithm.QuickSortAlogirthm import intro_sort, quick_sort
+from SortAlgorithm.RadixAlgorithm import radix_sort_lsd
+from SortAlgorithm.StringSortAlgorithm import msd_string_sort
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json")
+MEMORY_PATH = os.path.join(os.path.dirname(BASELINE_PATH), "perf_memory.json")
+
+SEED = 41
+
+# Fast benchmarks are looped until one sample takes at least this long
+MIN_SAMPLE_S = 0.02
+
+SHAPES = ("uniform", "nearly_sorted", "reversed", "few_unique")
+
+# name -> (function, input size, dtype); every algorithm runs on every shape
+ALGORITHMS = {
+    "quick_sort": (quick_sort, 5000, "int"),
+    "intro_sort": (intro_sort, 5000, "int"),
+    "merge_sort": (merge_sort, 5000, "int"),
+    "heap_sort": (heap_sort, 5000, "int"),
+    "radix_sort": (lambda a: radix_sort_lsd(a, 256), 5000, "int"),
+    "counting_sort": (counting_sort, 5000, "int"),
+    "bucket_sort": (bucket_sort, 5000, "float"),
+    "insertion_sort": (insertion_sort, 500, "int"),
+    "msd_string_sort": (msd_string_sort, 5000, "str"),
+}
+
+
+def _dataset(shape, n, dtype):
+    if dtype == "float":
+        return generate(shape, n, seed=SEED, dtype="float", low=0.0, high=0.999999)
+    values = generate(shape, n, seed=SEED, low=0, high=10**6)
+    if dtype == "str":
+        return [f"SKU-{v:07d}" for v in values]
+    return values
+
+
+def algorithm_benchmarks():
+    """Yield (name, group, shape, run) where run() performs one timed call"""
+    for algo, (fn, n, dtype) in ALGORITHMS.items():
+        for shape in SHAPES:
+            data = _dataset(shape, n, dtype)
+            yield f"{algo}/{shape}", algo, shape, (lambda fn=fn, data=data: fn(list(data)))
+
+
+def draw_benchmarks():
+    """Draw-path benchmarks on an offscreen surface; empty when pygame is missing"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    try:
+        import pygame
+    except ImportError:
+        return
+    from config import FONTS, SORTING_CONFIG, UI_DIMENSIONS
+    from console_log import ArrayPreview, ConsoleLog
+    from ui_components import UIComponents
+
+    pygame.font.init()
+    screen = pygame.Surface((900, 740))
+    fonts = {
+        'title': pygame.font.Font(None, FONTS['TITLE_SIZE']),
+        'medium': pygame.font.Font(None, FONTS['MEDIUM_SIZE']),
+        'small': pygame.font.Font(None, FONTS['SMALL_SIZE']),
+        'console': pygame.font.Font(None, FONTS['CONSOLE_SIZE']),
+    }
+    ui = UIComponents(screen, fonts)
+    panel = pygame.Rect(30, 490, UI_DIMENSIONS['VIZ_PANEL_WIDTH'], UI_DIMENSIONS['VIZ_PANEL_HEIGHT'])
+    console = pygame.Rect(450, 360, UI_DIMENSIONS['CONSOLE_WIDTH'], UI_DIMENSIONS['CONSOLE_HEIGHT'])
+
+    for shape in SHAPES:
+        values = generate(shape, SORTING_CONFIG['MAX_ARRAY_SIZE'], seed=SEED, low=1, high=100)
+        messages = ConsoleLog(SORTING_CONFIG['CONSOLE_HISTORY'])
+        for _ in range(SORTING_CONFIG['CONSOLE_HISTORY']):
+            messages.add("sortingapp$ Original array: ", ArrayPreview(values))
+
+        def frame(values=values, messages=messages):
+            # 60 frames of the panels that change while a sort is running
+            for i in range(60):
+                ui.draw_visualization_panel(panel, values, [i % len(values)], True, False)
+                ui.draw_console_panel(console, messages)
+
+        yield f"draw_frame/{shape}", "draw_frame", shape, frame
+
+
+def _calibrate(run):
+    """Calls per sample so that one sample takes at least MIN_SAMPLE_S"""
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            run()
+        if time.perf_counter() - t0 >= MIN_SAMPLE_S:
+            return loops
+        loops *= 2
+
+
+def collect(repeats=15, name_filter=None):
+    """Run every benchmark repeats times and return per-call samples in seconds"""
+    results = {}
+    gc_was_enabled = gc.isenabled()
+    try:
+        for gen in (algorithm_benchmarks(), draw_benchmarks()):
+            for name, group, shape, run in gen:
+                if name_filter and name_filter not in name:
+                    continue
+                loops = _calibrate(run)  # doubles as the warm-up
+                samples = []
+                gc.disable()
+                for _ in range(repeats):
+                    t0 = time.perf_counter()
+                    for _ in range(loops):
+                        run()
+                    samples.append((time.perf_counter() - t0) / loops)
+                gc.enable()
+                results[name] = {"group": group, "shape": shape, "loops": loops, "samples": samples}
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return results
+
+
+def memory_profile(name_filter=None, top=5):
+    """Memory rows per algorithm, shape and size (a quarter, one and four times n)"""
+    rows = []
+    for algo, (fn, n, dtype) in ALGORITHMS.items():
+        for shape in SHAPES:
+            for size in (n // 4, n, n * 4):
+                name = f"{algo}/{shape}/{size}"
+                if name_filter and name_filter not in name:
+                    continue
+                row = {"name": name, "algorithm": algo, "shape": shape, "n": size}
+                row.update(profile_call(fn, _dataset(shape, size, dtype), top=top))
+                rows.append(row)
+    return rows
+
+
+def print_memory_report(rows):
+    print(f"{'benchmark':<36} {'peak KiB':>9} {'RSS KiB':>9} {'B/elem':>7} {'blocks':>7}  largest site")
+    for r in rows:
+        site = r["sites"][0]["site"] if r["sites"] else "-"
+        print(f"{r['name']:<36} {r['peak_extra_bytes'] / 1024:9.0f} {r['peak_rss_bytes'] / 1024:9.0f} "
+              f"{r['peak_extra_bytes'] / r['n']:7.1f} {r['peak_blocks']:7d}  {site}")
+
+
+def mann_whitney_greater(baseline, current):
+    """
+    One-sided Mann-Whitney U test that current tends to be larger than baseline
+
+    Uses the normal approximation with tie correction; returns (U, p).
+    """
+    n1, n2 = len(current), len(baseline)
+    pooled = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(pooled)
+    ties = 0.0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        ties += t ** 3 - t
+        i = j + 1
+
+    rank_sum = sum(r for r, (_, side) in zip(ranks, pooled) if side == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)  # continuity correction
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(baseline, current, threshold=0.10, alpha=0.01):
+    """Per-benchmark rows with median delta, p-value and verdict"""
+    rows = []
+    for name, cur in current.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append({"name": name, "group": cur["group"], "shape": cur["shape"],
+                         "verdict": "new", "ratio": 1.0, "p": 1.0})
+            continue
+        ratio = median(cur["samples"]) / median(base["samples"])
+        _, p_slower = mann_whitney_greater(base["samples"], cur["samples"])
+        _, p_faster = mann_whitney_greater(cur["samples"], base["samples"])
+        if ratio - 1 > threshold and p_slower < alpha:
+            verdict, p = "REGRESSION", p_slower
+        elif 1 - ratio > threshold and p_faster < alpha:
+            verdict, p = "faster", p_faster
+        else:
+            verdict, p = "ok", min(p_slower, p_faster)
+        rows.append({"name": name, "group": cur["group"], "shape": cur["shape"],
+                     "verdict": verdict, "ratio": ratio, "p": p})
+    return rows
+
+
+def _geomean(ratios):
+    return math.exp(sum(map(math.log, ratios)) / len(ratios))
+
+
+def print_report(rows):
+    print(f"{'benchmark':<32} {'delta':>8} {'p':>8}  verdict")
+    for r in rows:
+        print(f"{r['name']:<32} {(r['ratio'] - 1) * 100:+7.1f}% {r['p']:8.4f}  {r['verdict']}")
+
+    for label, field in (("algorithm", "group"), ("shape", "shape")):
+        groups = {}
+        for r in rows:
+            if r["verdict"] != "new":
+                groups.setdefault(r[field], []).append(r["ratio"])
+        print(f"\nper {label} (geometric mean of median ratios)")
+        for key, ratios in groups.items():
+            print(f"  {key:<28} {(_geomean(ratios) - 1) * 100:+7.1f}%")
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path, results, repeats):
+    data = {"host": host_info(), "repeats": repeats, "seed": SEED, "benchmarks": results}
+    with open(path, "w") as f:
+        json.dump(data, f, indent=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare benchmark timings against a stored baseline")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="measure and overwrite the baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative median slowdown that counts as a regression")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Mann-Whitney significance level")
+    parser.add_argument("--repeats", type=int, default=15)
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose name contains this")
+    parser.add_argument("--json", default=None, help="also write the comparison rows here")
+    parser.add_argument("--memory", action="store_true",
+                        help="profile memory instead and write it next to the baseline")
+    parser.add_argument("--memory-output", default=MEMORY_PATH)
+    args = parser.parse_args(argv)
+
+    if args.memory:
+        rows = memory_profile(args.filter)
+        print_memory_report(rows)
+        try:
+            with open(args.memory_output) as f:
+                previous = {r["name"]: r for r in json.load(f)["profiles"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            previous = {}
+        # As with the baseline, rows this run did not profile are kept
+        kept = [name for name in previous if name not in {r["name"] for r in rows}]
+        merged = {**previous, **{r["name"]: r for r in rows}}
+        with open(args.memory_output, "w") as f:
+            json.dump({"host": host_info(), "seed": SEED, "profiles": list(merged.values())}, f, indent=1)
+        print(f"\nmemory profile with {len(rows)} profiled and {len(kept)} kept entries "
+              f"written to {args.memory_output}")
+        return 0
+
+    if args.update_baseline:
+        results = collect(args.repeats, args.filter)
+        try:
+            previous = load_baseline(args.baseline)["benchmarks"]
+        except (OSError, ValueError, KeyError):
+            previous = {}
+        # Entries this run did not measure (filtered out, or draw_frame on a
+        # host without pygame) keep their previous samples
+        kept = [name for name in previous if name not in results]
+        save_baseline(args.baseline, {**previous, **results}, args.repeats)
+        print(f"baseline with {len(results)} measured and {len(kept)} kept benchmarks "
+              f"written to {args.baseline}")
+        return 0
+
+    try:
+        baseline = load_baseline(args.baseline)["benchmarks"]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+        return 2
+
+    current = collect(args.repeats, args.filter)
+    rows = compare(baseline, current, args.threshold, args.alpha)
+    print_report(rows)
+    missing = [name for name in baseline
+               if name not in current and (not args.filter or args.filter in name)]
+    if missing:
+        print(f"\nnot measured on this host: {', '.join(missing)}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+
+    regressions = [r["name"] for r in rows if r["verdict"] == "REGRESSION"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("\nno regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Race mode for the Sorting Algorithm Visualizer
+Runs several visual generators on identical copies of one array. Every
+lane gets the same number of steps per tick and keeps its own operation,
+write and time counts. Large arrays are sorted in worker processes that
+stream their traces back, so the UI thread only applies writes and draws
+"""
+
+import multiprocessing
+import queue
+import time
+
+from sorting_visualizers import OPERATION, SWAP, VISUALS
+from trace_cache import RecordingList, Trace, typecode_of
+
+# Chunks a worker may run ahead of the UI before it blocks
+QUEUE_CHUNKS = 4
+
+
+class _CountingStepper:
+    """Stops at every checkpoint and counts them by level"""
+
+    def __init__(self):
+        self.counts = [0, 0, 0]
+
+    def __call__(self, level):
+        self.counts[level] += 1
+        return True
+
+
+class _CountingList(list):
+    """List that counts item writes"""
+
+    def __init__(self, values):
+        super().__init__(values)
+        self.writes = 0
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.writes += 1
+
+
+def _short(n):
+    for unit, size in (("M", 1_000_000), ("k", 1_000)):
+        if n >= size:
+            return f"{n / size:.1f}{unit}"
+    return str(n)
+
+
+class _Costs:
+    """Cost reporting shared by local and remote lanes"""
+
+    error = None
+
+    def costs(self):
+        if self.error:
+            return "failed"
+        return f"{_short(self.ops)} op {_short(self.writes)} wr"
+
+    def summary(self):
+        if self.error:
+            return f"failed: {self.error}"
+        return f"{self.costs()}, {self.seconds * 1000:.1f} ms"
+
+
+class Lane(_Costs):
+    """One racer run in this process; it is the app_instance its generator sees"""
+
+    def __init__(self, name, values):
+        self.name = name
+        self.values = values
+        self.sorting = True
+        self.paused = False
+        self.sorted = False
+        self.current_indices = []
+        self.stepper = _CountingStepper()
+        self.seconds = 0.0
+        self.steps = 0
+        self.generator = VISUALS[name](values, self)
+
+    def complete_sorting(self):
+        """Results are reported for the whole race once every lane is done"""
+
+    @property
+    def ops(self):
+        # Comparisons and reads, as the generators tag them
+        return self.stepper.counts[OPERATION] + self.stepper.counts[SWAP]
+
+    @property
+    def writes(self):
+        return self.values.writes
+
+    def step(self):
+        """Advance to the next checkpoint; False once the generator is finished"""
+        try:
+            next(self.generator)
+        except StopIteration:
+            self.sorted = True
+            return False
+        self.steps += 1
+        return not self.sorted
+
+    def advance(self, steps):
+        start = time.perf_counter()
+        for _ in range(steps):
+            if self.sorted or not self.step():
+                break
+        self.seconds += time.perf_counter() - start
+
+    def close(self):
+        self.sorting = False
+
+
+def _race_worker(name, values, typecode, out, chunk_frames):
+    """Run one visual generator headless and stream its trace in chunks"""
+    try:
+        trace = Trace(typecode)
+        values = RecordingList(values, trace)
+        lane = Lane(name, values)
+        writes = 0
+        while True:
+            start = time.perf_counter()
+            for _ in range(chunk_frames):
+                running = lane.step()
+                if values.trace is None:
+                    raise ValueError("array holds values the trace cannot store")
+                trace.frame_writes.append(len(trace.write_index))
+                trace.highlight.extend(lane.current_indices)
+                trace.frame_highlight.append(len(trace.highlight))
+                if not running:
+                    break
+            lane.seconds += time.perf_counter() - start
+            writes += len(trace.write_index)
+            out.put((trace, lane.ops, writes, lane.seconds, lane.sorted))
+            if lane.sorted:
+                return
+            trace = values.trace = Trace(typecode)
+    except Exception as e:
+        out.put(e)
+
+
+class RemoteLane(_Costs):
+    """A racer sorted in a worker process; the UI only replays its streamed trace"""
+
+    def __init__(self, context, name, values, typecode, chunk_frames):
+        self.name = name
+        self.values = list(values)
+        self.sorted = False
+        self.error = None
+        self.current_indices = []
+        self.ops = self.writes = self.steps = 0
+        self.seconds = 0.0
+        self.chunk = None
+        self.chunk_stats = None
+        self.frame = self.w = self.h = 0
+        self.queue = context.Queue(maxsize=QUEUE_CHUNKS)
+        self.process = context.Process(target=_race_worker, daemon=True,
+                                       args=(name, self.values, typecode, self.queue, chunk_frames))
+        self.process.start()
+
+    def _next_chunk(self):
+        exitcode = self.process.exitcode
+        if exitcode:
+            # A worker killed mid-write can leave a partial message in the
+            # pipe, so nothing more is read from it
+            self._fail(f"worker exited with code {exitcode}")
+            return False
+        try:
+            item = self.queue.get_nowait()
+        except queue.Empty:
+            if exitcode is not None:
+                # Exited cleanly but never sent its final chunk
+                self._fail("worker exited before finishing")
+            return False
+        if isinstance(item, Exception):
+            self._fail(str(item))
+            return False
+        self.chunk, *self.chunk_stats = item
+        self.frame = self.w = self.h = 0
+        return True
+
+    def _fail(self, error):
+        self.error = error
+        self.sorted = True
+
+    def advance(self, steps):
+        """Apply up to steps frames; a lane whose worker is behind waits for it"""
+        values = self.values
+        while steps > 0 and not self.sorted:
+            chunk = self.chunk
+            if chunk is None or self.frame == len(chunk):
+                if not self._next_chunk():
+                    return
+                chunk = self.chunk
+
+            w_end = chunk.frame_writes[self.frame]
+            index, value = chunk.write_index, chunk.write_value
+            for k in range(self.w, w_end):
+                values[index[k]] = value[k]
+            self.w = w_end
+            h_end = chunk.frame_highlight[self.frame]
+            self.current_indices = chunk.highlight[self.h:h_end].tolist()
+            self.h = h_end
+            self.frame += 1
+            self.steps += 1
+            steps -= 1
+
+            if self.frame == len(chunk):
+                # Costs arrive with each chunk, as measured in the worker
+                self.ops, self.writes, self.seconds, self.sorted = self.chunk_stats
+
+    def close(self):
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.queue.cancel_join_thread()
+        self.queue.close()
+
+
+class Race:
+    """A set of lanes racing on copies of one array"""
+
+    def __init__(self, names, values, steps_per_tick=1, process_min=5000, chunk_frames=4096):
+        self.max_value = max(values) if values else 1
+        self.steps_per_tick = steps_per_tick
+        typecode = typecode_of(values)
+        self.in_workers = len(values) >= process_min and typecode is not None
+        if self.in_workers:
+            context = multiprocessing.get_context("spawn")
+            self.lanes = [RemoteLane(context, name, values, typecode, chunk_frames) for name in names]
+        else:
+            self.lanes = [Lane(name, _CountingList(values)) for name in names]
+
+    @property
+    def done(self):
+        return all(lane.sorted for lane in self.lanes)
+
+    def run(self, app_instance):
+        """Visual generator for the main loop: each tick advances every lane equally"""
+        while not self.done:
+            if not app_instance.sorting:
+                yield False
+                return
+
+            while app_instance.paused:
+                yield True
+
+            for lane in self.lanes:
+                if not lane.sorted:
+                    lane.advance(self.steps_per_tick)
+            yield True
+
+        app_instance.complete_sorting()
+        app_instance.sorted = True
+        app_instance.sorting = False
+        yield False
+
+    def standings(self):
+        """Lanes fastest first, failed lanes last"""
+        return sorted(self.lanes, key=lambda lane: (lane.error is not None, lane.seconds))
+
+    def close(self):
+        for lane in self.lanes:
+            lane.close()
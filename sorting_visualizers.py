@@ -2,11 +2,65 @@
 Sorting algorithm visualization generators
 """
 
+import time
+
+# Checkpoint levels, finest first. Generators tag each place they could
+# yield with one of these, and the run's Stepper decides whether to stop there.
+OPERATION = 0  # a comparison, count or other read
+SWAP = 1  # a write that changes the displayed array
+PASS = 2  # the end of a pass, partition or merge
+
+# Passes and partitions are one tier: each algorithm marks whichever
+# structural boundary it has (bubble passes, quick sort partitions, ...)
+GRANULARITIES = {
+    "operation": OPERATION,
+    "swap": SWAP,
+    "pass": PASS,
+    "partition": PASS,
+    "rate": None,
+}
+
+
+class Stepper:
+    """Decides which checkpoints of a visual generator yield a frame"""
+
+    # In rate mode the clock is only read every this many checkpoints
+    CLOCK_EVERY = 32
+
+    def __init__(self, granularity="operation", rate=120):
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"unknown granularity {granularity!r}, expected one of {list(GRANULARITIES)}")
+        self.granularity = granularity
+        self.min_level = GRANULARITIES[granularity]
+        self.interval = 1 / rate
+        self.deadline = None
+        self.count = 0
+
+    def __call__(self, level):
+        """True when the generator should yield at a checkpoint of this level"""
+        if self.min_level is not None:
+            return level >= self.min_level
+
+        # Rate mode: work for one interval after each resume, then yield
+        self.count += 1
+        if self.count % self.CLOCK_EVERY:
+            return False
+        now = time.perf_counter()
+        if self.deadline is None:
+            self.deadline = now + self.interval
+            return False
+        if now >= self.deadline:
+            self.deadline = None
+            return True
+        return False
+
+
 class SortingVisualizers:
     @staticmethod
     def bubble_sort_visual(sorting_array, app_instance):
         """Generator for bubble sort visualization"""
         n = len(sorting_array)
+        step = app_instance.stepper
 
         for i in range(n):
             swapped = False
@@ -18,12 +72,18 @@ class SortingVisualizers:
                 while app_instance.paused:
                     yield True
 
-                app_instance.current_indices = [j, j+1]
-
                 if sorting_array[j] > sorting_array[j+1]:
                     sorting_array[j], sorting_array[j+1] = sorting_array[j+1], sorting_array[j]
                     swapped = True
+                    if step(SWAP):
+                        app_instance.current_indices = [j, j+1]
+                        yield True
+                elif step(OPERATION):
+                    app_instance.current_indices = [j, j+1]
+                    yield True
 
+            if step(PASS):
+                app_instance.current_indices = [n-i-1]
                 yield True
 
             if not swapped:
@@ -57,6 +117,7 @@ class SortingVisualizers:
             yield False
             return
 
+        step = app_instance.stepper
         size = len(sorting_array)
         buckets = [[] for _ in range(size)]
 
@@ -71,7 +132,11 @@ class SortingVisualizers:
 
             index = int(size * sorting_array[i] / (max_val + 1))
             buckets[index].append(sorting_array[i])
-            app_instance.current_indices = [i]
+            if step(OPERATION):
+                app_instance.current_indices = [i]
+                yield True
+
+        if step(PASS):
             yield True
 
         # Sort individual buckets using insertion sort
@@ -91,7 +156,11 @@ class SortingVisualizers:
                         buckets[i][k + 1] = buckets[i][k]
                         k -= 1
                     buckets[i][k + 1] = key
-                    yield True
+                    if step(OPERATION):
+                        yield True
+
+        if step(PASS):
+            yield True
 
         # Concatenate all buckets into sorting_array
         index = 0
@@ -105,9 +174,10 @@ class SortingVisualizers:
                     yield True
 
                 sorting_array[index] = buckets[i][j]
-                app_instance.current_indices = [index]
+                if step(SWAP):
+                    app_instance.current_indices = [index]
+                    yield True
                 index += 1
-                yield True
 
         app_instance.complete_sorting()
         app_instance.sorted = True
@@ -127,6 +197,8 @@ class SortingVisualizers:
             yield False
             return
 
+        step = app_instance.stepper
+
         # Find range of values
         max_val = max(sorting_array)
         min_val = min(sorting_array)
@@ -146,13 +218,17 @@ class SortingVisualizers:
                 yield True
 
             count[sorting_array[i] - min_val] += 1
-            app_instance.current_indices = [i]
-            yield True
+            if step(OPERATION):
+                app_instance.current_indices = [i]
+                yield True
 
         # Change count[i] so that count[i] contains actual position
         for i in range(1, len(count)):
             count[i] += count[i - 1]
 
+        if step(PASS):
+            yield True
+
         # Build output array
         for i in range(len(sorting_array) - 1, -1, -1):
             if not app_instance.sorting:
@@ -164,8 +240,9 @@ class SortingVisualizers:
 
             output[count[sorting_array[i] - min_val] - 1] = sorting_array[i]
             count[sorting_array[i] - min_val] -= 1
-            app_instance.current_indices = [i]
-            yield True
+            if step(OPERATION):
+                app_instance.current_indices = [i]
+                yield True
 
         # Copy output array to sorting_array
         for i in range(len(sorting_array)):
@@ -177,8 +254,9 @@ class SortingVisualizers:
                 yield True
 
             sorting_array[i] = output[i]
-            app_instance.current_indices = [i]
-            yield True
+            if step(SWAP):
+                app_instance.current_indices = [i]
+                yield True
 
         app_instance.complete_sorting()
         app_instance.sorted = True
@@ -218,6 +296,7 @@ class SortingVisualizers:
     @staticmethod
     def _partition_visual(arr, low, high, app_instance):
         """Partition function matching your reference implementation with visualization"""
+        step = app_instance.stepper
         pivot = arr[high]  # Choose last element as pivot (matches your reference)
         i = low
 
@@ -228,21 +307,27 @@ class SortingVisualizers:
             while app_instance.paused:
                 yield True
 
-            app_instance.current_indices = [j, high, i]  # Highlight current element, pivot, and partition index
-
             if arr[j] <= pivot:
                 if i != j:  # Only swap if different indices
                     arr[i], arr[j] = arr[j], arr[i]
-                    app_instance.current_indices = [i, j]
-                    yield True
+                    if step(SWAP):
+                        app_instance.current_indices = [i, j]
+                        yield True
                 i += 1
 
-            yield True
+            if step(OPERATION):
+                app_instance.current_indices = [j, high, i]  # Highlight current element, pivot, and partition index
+                yield True
 
         # Place pivot in correct position (matches your reference)
         if i != high:
             arr[i], arr[high] = arr[high], arr[i]
-            app_instance.current_indices = [i, high]
+            if step(SWAP):
+                app_instance.current_indices = [i, high]
+                yield True
+
+        if step(PASS):
+            app_instance.current_indices = [i]
             yield True
 
         return i
@@ -278,11 +363,15 @@ class SortingVisualizers:
     def heap_sort_visual(sorting_array, app_instance):
         """Generator for heap sort visualization"""
         n = len(sorting_array)
+        step = app_instance.stepper
 
         # Build max heap
         for i in range(n // 2 - 1, -1, -1):
             yield from SortingVisualizers._sift_down_visual(sorting_array, i, n - 1, app_instance)
 
+        if step(PASS):
+            yield True
+
         # Extract elements from heap
         for end in range(n - 1, 0, -1):
             if not app_instance.sorting:
@@ -293,12 +382,17 @@ class SortingVisualizers:
 
             # Swap root with end
             sorting_array[0], sorting_array[end] = sorting_array[end], sorting_array[0]
-            app_instance.current_indices = [0, end]
-            yield True
+            if step(SWAP):
+                app_instance.current_indices = [0, end]
+                yield True
 
             # Sift down the new root
             yield from SortingVisualizers._sift_down_visual(sorting_array, 0, end - 1, app_instance)
 
+            if step(PASS):
+                app_instance.current_indices = [end]
+                yield True
+
         app_instance.complete_sorting()
         app_instance.sorted = True
         app_instance.sorting = False
@@ -308,6 +402,7 @@ class SortingVisualizers:
     @staticmethod
     def _sift_down_visual(a, start, end, app_instance):
         """Helper for heap sort sift down with visualization"""
+        step = app_instance.stepper
         root = start
         while (left := 2 * root + 1) <= end:
             if not app_instance.sorting:
@@ -328,8 +423,9 @@ class SortingVisualizers:
                 break
 
             a[root], a[largest] = a[largest], a[root]
-            app_instance.current_indices = [root, largest]
-            yield True
+            if step(SWAP):
+                app_instance.current_indices = [root, largest]
+                yield True
 
             root = largest
 
@@ -337,6 +433,7 @@ class SortingVisualizers:
     def insertion_sort_visual(sorting_array, app_instance):
         """Generator for insertion sort visualization"""
         n = len(sorting_array)
+        step = app_instance.stepper
 
         for i in range(1, n):
             key = sorting_array[i]
@@ -350,13 +447,15 @@ class SortingVisualizers:
                     yield True
 
                 sorting_array[j + 1] = sorting_array[j]
-                app_instance.current_indices = [j, j + 1]
+                if step(SWAP):
+                    app_instance.current_indices = [j, j + 1]
+                    yield True
                 j -= 1
-                yield True
 
             sorting_array[j + 1] = key
-            app_instance.current_indices = [j + 1]
-            yield True
+            if step(PASS):
+                app_instance.current_indices = [j + 1]
+                yield True
 
         app_instance.complete_sorting()
         app_instance.sorted = True
@@ -395,6 +494,7 @@ class SortingVisualizers:
     @staticmethod
     def _merge_visual(arr, left, mid, right, app_instance):
         """Merge with visualization"""
+        step = app_instance.stepper
         left_arr = arr[left:mid + 1]
         right_arr = arr[mid + 1:right + 1]
 
@@ -415,9 +515,10 @@ class SortingVisualizers:
                 arr[k] = right_arr[j]
                 j += 1
 
-            app_instance.current_indices = [k]
+            if step(SWAP):
+                app_instance.current_indices = [k]
+                yield True
             k += 1
-            yield True
 
         while i < len(left_arr):
             if not app_instance.sorting:
@@ -427,10 +528,11 @@ class SortingVisualizers:
                 yield True
 
             arr[k] = left_arr[i]
-            app_instance.current_indices = [k]
+            if step(SWAP):
+                app_instance.current_indices = [k]
+                yield True
             i += 1
             k += 1
-            yield True
 
         while j < len(right_arr):
             if not app_instance.sorting:
@@ -440,9 +542,14 @@ class SortingVisualizers:
                 yield True
 
             arr[k] = right_arr[j]
-            app_instance.current_indices = [k]
+            if step(SWAP):
+                app_instance.current_indices = [k]
+                yield True
             j += 1
             k += 1
+
+        if step(PASS):
+            app_instance.current_indices = [left, right]
             yield True
 
     @staticmethod
@@ -460,6 +567,8 @@ class SortingVisualizers:
     def _quick_sort_helper(arr, low, high, app_instance):
         """Recursive helper for quick sort with visualization"""
         if low < high:
+            step = app_instance.stepper
+
             # Partition
             pivot = arr[(low + high) // 2]
             i = low
@@ -479,11 +588,16 @@ class SortingVisualizers:
 
                 if i <= j:
                     arr[i], arr[j] = arr[j], arr[i]
-                    app_instance.current_indices = [i, j]
-                    yield True
+                    if step(SWAP):
+                        app_instance.current_indices = [i, j]
+                        yield True
                     i += 1
                     j -= 1
 
+            if step(PASS):
+                app_instance.current_indices = [low, high]
+                yield True
+
             # Recursively sort partitions
             yield from SortingVisualizers._quick_sort_helper(arr, low, j, app_instance)
             yield from SortingVisualizers._quick_sort_helper(arr, i, high, app_instance)
@@ -500,6 +614,8 @@ class SortingVisualizers:
             yield False
             return
 
+        step = app_instance.stepper
+
         # Find maximum number to know number of digits
         max_num = max(sorting_array)
 
@@ -522,8 +638,9 @@ class SortingVisualizers:
 
                 index = sorting_array[i] // exp
                 count[index % 10] += 1
-                app_instance.current_indices = [i]
-                yield True
+                if step(OPERATION):
+                    app_instance.current_indices = [i]
+                    yield True
 
             # Change count[i] so it contains actual position
             for i in range(1, 10):
@@ -541,8 +658,9 @@ class SortingVisualizers:
                 index = sorting_array[i] // exp
                 output[count[index % 10] - 1] = sorting_array[i]
                 count[index % 10] -= 1
-                app_instance.current_indices = [i]
-                yield True
+                if step(OPERATION):
+                    app_instance.current_indices = [i]
+                    yield True
 
             # Copy output array to sorting_array
             for i in range(n):
@@ -554,7 +672,12 @@ class SortingVisualizers:
                     yield True
 
                 sorting_array[i] = output[i]
-                app_instance.current_indices = [i]
+                if step(SWAP):
+                    app_instance.current_indices = [i]
+                    yield True
+
+            if step(PASS):
+                app_instance.current_indices = []
                 yield True
 
             exp *= 10
@@ -568,6 +691,7 @@ class SortingVisualizers:
     @staticmethod
     def _counting_sort_by_digit_visual(a, exp, base, original_array, is_negative, app_instance):
         """Helper for radix sort digit sorting with visualization"""
+        step = app_instance.stepper
         n = len(a)
         output = [0] * n
         count = [0] * base
@@ -582,7 +706,8 @@ class SortingVisualizers:
 
             digit = (a[i] // exp) % base
             count[digit] += 1
-            yield True
+            if step(OPERATION):
+                yield True
 
         # Calculate positions
         for d in range(1, base):
@@ -600,8 +725,23 @@ class SortingVisualizers:
             pos = count[digit] - 1
             output[pos] = a[i]
             count[digit] -= 1
-            yield True
+            if step(OPERATION):
+                yield True
 
         # Copy back
         for i in range(n):
-            a[i] = output[i]
\ No newline at end of file
+            a[i] = output[i]
+
+
+# Visual generator for each algorithm button
+VISUALS = {
+    "Bubble Sort": SortingVisualizers.bubble_sort_visual,
+    "Bucket Sort": SortingVisualizers.bucket_sort_visual,
+    "Counting Sort": SortingVisualizers.counting_sort_visual,
+    "Quick Select": SortingVisualizers.quick_select_visual,
+    "Heap Sort": SortingVisualizers.heap_sort_visual,
+    "Insertion Sort": SortingVisualizers.insertion_sort_visual,
+    "Merge Sort": SortingVisualizers.merge_sort_visual,
+    "Quick Sort": SortingVisualizers.quick_sort_visual,
+    "Radix Sort": SortingVisualizers.radix_sort_visual,
+}
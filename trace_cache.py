@@ -0,0 +1,173 @@
+"""
+Trace cache for the Sorting Algorithm Visualizer
+Records the frames a visual generator produces (array writes and
+highlighted indices) into typed arrays, and replays them when the same
+algorithm runs on the same input again
+"""
+
+import hashlib
+from array import array
+from collections import OrderedDict
+
+
+def typecode_of(values):
+    """array typecode that round-trips every value, or None for mixed types"""
+    if all(type(v) is int for v in values):
+        return 'q'
+    if all(type(v) is float for v in values):
+        return 'd'
+    return None
+
+
+def content_key(values):
+    """(typecode, digest) for an all-int or all-float array, None otherwise"""
+    typecode = typecode_of(values)
+    if typecode is None:
+        return None  # mixed types would not round-trip through one typed array
+    try:
+        data = array(typecode, values).tobytes()
+    except OverflowError:
+        return None
+    return typecode, hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class Trace:
+    """One recorded run: frame boundaries over flat write and index arrays"""
+
+    __slots__ = ("write_index", "write_value", "frame_writes", "highlight", "frame_highlight")
+
+    def __init__(self, typecode):
+        self.write_index = array('q')
+        self.write_value = array(typecode)
+        self.frame_writes = array('q')  # writes applied up to and including frame f
+        self.highlight = array('q')
+        self.frame_highlight = array('q')  # highlight entries up to and including frame f
+
+    def __len__(self):
+        return len(self.frame_writes)
+
+    @property
+    def nbytes(self):
+        return sum(a.itemsize * len(a) for a in (
+            self.write_index, self.write_value, self.frame_writes,
+            self.highlight, self.frame_highlight))
+
+
+class RecordingList(list):
+    """List that logs every item assignment into a Trace"""
+
+    def __init__(self, values, trace):
+        super().__init__(values)
+        self.trace = trace
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        trace = self.trace
+        if trace is not None:
+            if index < 0:
+                index += len(self)
+            try:
+                trace.write_value.append(value)
+            except (TypeError, OverflowError):
+                # A value the typed array cannot hold; stop recording this run
+                self.trace = None
+                return
+            trace.write_index.append(index)
+
+
+class TraceCache:
+    """LRU of recorded traces bounded by their total size in bytes"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.traces = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.traces)
+
+    def get(self, key):
+        trace = self.traces.get(key)
+        if trace is None:
+            self.misses += 1
+            return None
+        self.traces.move_to_end(key)
+        self.hits += 1
+        return trace
+
+    def put(self, key, trace):
+        """Store a trace, evicting least recently used ones to stay within max_bytes"""
+        size = trace.nbytes
+        if size > self.max_bytes:
+            return False
+        old = self.traces.pop(key, None)
+        if old is not None:
+            self.nbytes -= old.nbytes
+        self.traces[key] = trace
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, evicted = self.traces.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return True
+
+    def stats(self):
+        return (f"{self.hits} hits, {self.misses} misses, {len(self.traces)} traces, "
+                f"{self.nbytes / 1024:.1f}/{self.max_bytes / 1024:.0f} KiB")
+
+    def record(self, key, generator, values, app_instance):
+        """
+        Run a visual generator over a RecordingList, storing its trace if the run completes
+
+        values must be the RecordingList the generator sorts. Recording stops
+        (and nothing is cached) if the trace outgrows the cache.
+        """
+        for frame in generator:
+            trace = values.trace
+            if trace is not None:
+                if frame and not app_instance.paused:
+                    trace.frame_writes.append(len(trace.write_index))
+                    trace.highlight.extend(app_instance.current_indices)
+                    trace.frame_highlight.append(len(trace.highlight))
+                    if len(trace) % 1024 == 0 and trace.nbytes > self.max_bytes:
+                        values.trace = None
+                elif not frame and app_instance.sorted:
+                    # The final frame; the main loop does not resume a finished run
+                    values.trace = None
+                    self.put(key, trace)
+            yield frame
+        values.trace = None
+
+    @staticmethod
+    def replay(trace, sorting_array, app_instance):
+        """Visual generator that plays a recorded trace back onto sorting_array"""
+        index, value = trace.write_index, trace.write_value
+        highlight = trace.highlight
+        w = h = 0
+        for f in range(len(trace)):
+            if not app_instance.sorting:
+                yield False
+                return
+
+            while app_instance.paused:
+                yield True
+
+            w_end = trace.frame_writes[f]
+            for k in range(w, w_end):
+                sorting_array[index[k]] = value[k]
+            w = w_end
+            h_end = trace.frame_highlight[f]
+            app_instance.current_indices = highlight[h:h_end].tolist()
+            h = h_end
+            yield True
+
+        # Writes made after the last frame, before the generator finished
+        for k in range(w, len(index)):
+            sorting_array[index[k]] = value[k]
+
+        app_instance.complete_sorting()
+        app_instance.sorted = True
+        app_instance.sorting = False
+        app_instance.current_indices = []
+        yield False
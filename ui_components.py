@@ -5,11 +5,16 @@ Contains all drawing methods for different UI sections
 
 import pygame
 from config import COLORS, FONTS, UI_DIMENSIONS
+from array_strip import ArrayStrip
 
 class UIComponents:
     def __init__(self, screen, fonts):
         self.screen = screen
         self.fonts = fonts
+        self.array_strip = ArrayStrip(fonts['medium'], COLORS['BLACK'])
+        self.max_source = None
+        self.max_length = 0
+        self.max_value = 1
 
     def wrap_text(self, text, font, max_width):
         """
@@ -137,29 +142,17 @@ class UIComponents:
         pygame.draw.rect(self.screen, COLORS['WHITE'], display_rect, border_radius=5)
         pygame.draw.rect(self.screen, border_color, display_rect, 2, border_radius=5)
 
-        # Create display text with brackets
+        # Lay out the array, or the text being edited, as tiles with known offsets
+        strip = self.array_strip
         if editing and is_active:
-            # Show cursor and editing text
-            display_text = f"[{input_text}]"
-
-            # Calculate cursor position in display
-            cursor_display_pos = cursor_pos + 1  # +1 for opening bracket
-
-            # Render text
-            text_surface = self.fonts['medium'].render(display_text, True, COLORS['BLACK'])
-
-            # Calculate cursor position
-            text_before_cursor = f"[{input_text[:cursor_pos]}"
-            cursor_x = self.fonts['medium'].size(text_before_cursor)[0]
-
+            strip.layout_text(input_text)
+            cursor_x = strip.text_x(cursor_pos + 1)  # +1 for opening bracket
         else:
-            # Normal display
-            display_text = str(array)
-            text_surface = self.fonts['medium'].render(display_text, True, COLORS['BLACK'])
+            strip.layout_array(array)
             cursor_x = -1  # No cursor
 
         # Calculate scrolling
-        text_width = text_surface.get_width()
+        text_width = strip.width
         available_width = content_rect.width - 20
         needs_scroll = text_width > available_width
 
@@ -170,23 +163,22 @@ class UIComponents:
 
         # Draw text with scroll offset
         if needs_scroll:
-            x_pos = content_rect.x - scroll_offset
-
             # Auto-scroll to cursor if editing
             if editing and is_active:
-                cursor_abs_x = x_pos + cursor_x
-                if cursor_abs_x < content_rect.x:
+                if cursor_x < scroll_offset:
                     scroll_offset = max(0, cursor_x - 50)
-                elif cursor_abs_x > content_rect.x + available_width - 50:
+                elif cursor_x > scroll_offset + available_width - 50:
                     scroll_offset = min(text_width - available_width + 20,
                                         cursor_x - available_width + 100)
+            x_pos = content_rect.x - scroll_offset
         else:
             # Center the text
             x_pos = display_rect.centerx - text_width // 2
             scroll_offset = 0
 
-        # Draw the text
-        self.screen.blit(text_surface, (x_pos, content_rect.y + 10))
+        # Draw only the tiles inside the scroll window
+        for i in strip.visible(content_rect.x - x_pos, content_rect.x + available_width - x_pos):
+            self.screen.blit(strip.glyph(i), (x_pos + strip.offsets[i], content_rect.y + 10))
 
         # Draw cursor if editing
         if editing and is_active and cursor_x >= 0:
@@ -209,7 +201,7 @@ class UIComponents:
         # Draw hint text if editing
         if editing and is_active:
             hint_text = self.fonts['small'].render(
-                "Type numbers separated by commas. Press Enter to confirm, Esc to cancel.",
+                "Type or paste numbers separated by commas. Press Enter to confirm, Esc to cancel.",
                 True, COLORS['GRAY']
             )
             hint_rect = hint_text.get_rect(midtop=(display_rect.centerx, display_rect.bottom + 5))
@@ -250,15 +242,16 @@ class UIComponents:
                                     scrollbar_track.width, thumb_height)
             pygame.draw.rect(self.screen, COLORS['GRAY'], thumb_rect, border_radius=5)
 
-    def draw_algorithm_selection(self, algorithm_buttons, selected_algorithm):
-        """Draw algorithm radio buttons"""
+    def draw_algorithm_selection(self, algorithm_buttons, selected_algorithm, checked=None):
+        """Draw algorithm radio buttons; in race mode every algorithm in checked is filled"""
         for algo_data in algorithm_buttons:
             # Draw radio button
             pygame.draw.circle(self.screen, COLORS['BLUE_HEADER'],
                              (algo_data['radio'].x + 8, algo_data['radio'].y + 8), 8)
 
             # Fill if selected
-            if algo_data['name'] == selected_algorithm:
+            if (algo_data['name'] in checked if checked is not None
+                    else algo_data['name'] == selected_algorithm):
                 pygame.draw.circle(self.screen, COLORS['WHITE'],
                                  (algo_data['radio'].x + 8, algo_data['radio'].y + 8), 4)
             else:
@@ -321,8 +314,26 @@ class UIComponents:
         # Calculate and draw bars
         panel_width = viz_panel.width - 20
         panel_height = viz_panel.height - 20
-        bar_width = panel_width // len(sorting_array) - 2
-        max_value = max(sorting_array) if sorting_array else 1
+        n = len(sorting_array)
+        bar_width = panel_width // n - 2
+        # Sorting permutes the array, so its maximum is computed once per array
+        if sorting_array is not self.max_source or n != self.max_length:
+            self.max_source, self.max_length = sorting_array, n
+            self.max_value = max(sorting_array) or 1
+        max_value = self.max_value
+
+        if bar_width < 1:
+            # More bars than fit: one bar per pixel column, sampling the array,
+            # so the frame costs the panel width rather than the array length
+            columns = min(n, panel_width)
+            marked = {i * columns // n for i in current_indices} if sorting else ()
+            for c in range(columns):
+                value = sorting_array[c * n // columns]
+                bar_height = int((value / max_value) * (panel_height - 10))
+                color = COLORS['RED'] if c in marked else COLORS['GREEN']
+                pygame.draw.rect(self.screen, color, (viz_panel.x + 10 + c, viz_panel.y + panel_height - bar_height,
+                                                      1, bar_height))
+            return
 
         for i, value in enumerate(sorting_array):
             bar_height = int((value / max_value) * (panel_height - 10))
@@ -339,40 +350,79 @@ class UIComponents:
 
             pygame.draw.rect(self.screen, color, (x, y, bar_width, bar_height))
 
-    def draw_console_panel(self, console_panel, console_messages):
-        """Draw the console output panel with text wrapping and DONE button"""
+    def draw_race_grid(self, grid_rect, panels, max_value, sorting):
+        """Draw one small bar chart per race lane, with its costs above it"""
+        if not panels:
+            return
+        cols = min(len(panels), 5)
+        rows = -(-len(panels) // cols)
+        cell_w = grid_rect.width // cols
+        cell_h = grid_rect.height // rows
+        font = self.fonts['console']
+        max_value = max_value or 1
+
+        for k, (title, values, indices, costs, done) in enumerate(panels):
+            cell = pygame.Rect(grid_rect.x + (k % cols) * cell_w, grid_rect.y + (k // cols) * cell_h,
+                               cell_w - 4, cell_h - 4)
+            pygame.draw.rect(self.screen, COLORS['GRAY'], cell, border_radius=5)
+            inner = cell.inflate(-6, -6)
+            pygame.draw.rect(self.screen, COLORS['WHITE'], inner, border_radius=5)
+
+            self.screen.set_clip(inner)
+            title = font.render(title.replace(" Sort", ""), True, COLORS['BLACK'])
+            self.screen.blit(title, (inner.x + 4, inner.y + 2))
+            cost = font.render(costs, True, COLORS['DARK_GRAY'])
+            self.screen.blit(cost, (inner.x + 4, inner.y + 2 + title.get_height()))
+            self.screen.set_clip(None)
+
+            # Bars: one per pixel column at most, sampling long arrays
+            n = len(values)
+            chart = pygame.Rect(inner.x + 4, inner.y + 4 + 2 * title.get_height(),
+                                inner.width - 8, inner.height - 8 - 2 * title.get_height())
+            if n == 0 or chart.height <= 0:
+                continue
+            columns = min(n, chart.width)
+            bar_w = chart.width / columns
+            marked = {i * columns // n for i in indices} if sorting and not done else ()
+            for c in range(columns):
+                value = values[c * n // columns]
+                bar_h = max(1, int(value / max_value * chart.height))
+                color = COLORS['RED'] if c in marked else COLORS['GREEN']
+                pygame.draw.rect(self.screen, color, (chart.x + int(c * bar_w), chart.bottom - bar_h,
+                                                      max(1, int(bar_w) - 1), bar_h))
+
+    def draw_console_panel(self, console_panel, console, search_text=None):
+        """Draw the visible part of the console log, plus the search prompt when open"""
         pygame.draw.rect(self.screen, COLORS['CONSOLE_BG'], console_panel, border_radius=5)
 
         # Calculate available width for text (with padding)
         padding = 10
         max_text_width = console_panel.width - (padding * 2)
-
-        # Process all messages and wrap them
-        all_lines = []
-        for message in console_messages:
-            wrapped_lines = self.wrap_text(message, self.fonts['console'], max_text_width)
-            all_lines.extend(wrapped_lines)
+        font = self.fonts['console']
 
         # Calculate line height and max visible lines
         line_height = 18
         max_visible_lines = (console_panel.height - (padding * 2)) // line_height
+        if search_text is not None:
+            max_visible_lines -= 1  # bottom row holds the search prompt
 
-        # Get the lines to display (most recent if there are too many)
-        if len(all_lines) > max_visible_lines:
-            display_lines = all_lines[-max_visible_lines:]
-        else:
-            display_lines = all_lines
+        # Only messages that reach the screen are formatted and wrapped
+        display_lines = console.visible_lines(
+            max_visible_lines, lambda text: self.wrap_text(text, font, max_text_width), max_text_width)
 
         # Draw the wrapped lines
         y_offset = padding
-        for line in display_lines:
-            if y_offset + line_height > console_panel.height - padding:
-                break  # Stop if we've reached the bottom
-
-            text = self.fonts['console'].render(line, True, COLORS['CONSOLE_GREEN'])
+        for line, matched in display_lines:
+            color = COLORS['ORANGE'] if matched else COLORS['CONSOLE_GREEN']
+            text = font.render(line, True, color)
             self.screen.blit(text, (console_panel.x + padding, console_panel.y + y_offset))
             y_offset += line_height
 
+        if search_text is not None:
+            prompt = font.render(f"search: {search_text}_", True, COLORS['WHITE'])
+            self.screen.blit(prompt, (console_panel.x + padding,
+                                      console_panel.bottom - padding - line_height))
+
     def draw_quit_button(self, quit_button):
         """Draw the QUIT button"""
         pygame.draw.rect(self.screen, COLORS['RED'], quit_button, border_radius=5)